@@ -3,9 +3,10 @@ title = Pro Custom Art Tarot
 package.name = propictarotapp
 package.domain = org.example
 version = 1.0
-requirements = hostpython3, libffi, openssl, sdl2_image, sdl2_mixer, sdl2_ttf, sqlite3, python3, sdl2, setuptools, six, pyjnius, android, kivy, urllib3, idna, certifi, chardet, requests
+requirements = hostpython3, libffi, openssl, sdl2_image, sdl2_mixer, sdl2_ttf, sqlite3, python3, sdl2, setuptools, six, pyjnius, android, kivy, urllib3, idna, certifi, chardet, requests, pillow
 source.dir = .
-source.include_exts = py,png,kv,atlas
+source.include_exts = py,png,kv,atlas,tpack
+source.exclude_dirs = tools
 fullscreen = 0
 icon.filename = images/AppIcons/playstore.png
 orientation = portrait
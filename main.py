@@ -2,12 +2,22 @@ import random
 import json
 import os
 import sys
-from datetime import datetime, date
+import time
+import math
+import cProfile
+import functools
+import tracemalloc
+import threading
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.core.window import Window
+from kivy.core.image import ImageLoader, Image as CoreImage
+from kivy.atlas import Atlas
 from kivy.uix.button import Button
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.floatlayout import FloatLayout
@@ -15,49 +25,143 @@ from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.uix.textinput import TextInput
 from kivy.uix.switch import Switch
+from kivy.uix.filechooser import FileChooserListView
+from kivy.uix.progressbar import ProgressBar
 from kivy.logger import Logger
-from kivy.graphics import PushMatrix, PopMatrix, Rotate, Color, Rectangle, Ellipse, Animation
+from kivy.graphics import Color, Rectangle, Ellipse, Point, InstructionGroup, Mesh, PushMatrix, PopMatrix, Translate, Scale
+from kivy.uix.widget import Widget
+from kivy.uix.stencilview import StencilView
+from kivy.properties import NumericProperty, ObjectProperty
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.metrics import dp
+from kivy.metrics import dp, sp
+from kivy.utils import escape_markup
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.screenmanager import ScreenManager, Screen, NoTransition
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 import logging
+import queue
 import traceback
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from tarot_core.deck import tarot_cards, SPREADS, get_card_meaning, set_meaning_table
+from tarot_core.decks import (
+    IMAGE_EXTENSIONS, CARD_BACK_NAMES, TEXTURE_RESOLUTION_FULL, CARD_RESOLUTIONS, DECK_MANIFEST,
+    DeckImportError, canonical_asset_key, pick_card_resolution, import_deck, read_deck_manifest, list_decks,
+)
+from tarot_core.layouts import CARD_ASPECT, HitIndex, card_corners, layout_bounds, spread_layout
+from tarot_core.meanings import BUILTIN_PACK, MeaningPack, find_packs
+from tarot_core.search import HIGHLIGHT_START, HIGHLIGHT_END
+from tarot_core.session import ReadingSession
+from tarot_core.store import atomic_write_json, WriteBehindScheduler, ClientManager
 
 # Logging setup for crash and error reporting
+DOWNLOADS_PATH = "/storage/emulated/0/Download"
+LOG_FILE_NAME = "app_crash_log.txt"
+LOG_MAX_BYTES = 512 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_RATE_WINDOW = 5.0  # seconds
+LOG_RATE_BURST = 5  # identical messages allowed per window
+
+# Tags logged from layout and drawing callbacks stay quiet unless something goes wrong
+TAG_LEVELS = {
+    "MysticalButton": logging.WARNING,
+    "ClientButton": logging.WARNING,
+}
+
+_log_listener = None
+_log_file = None
+
+class RateLimitFilter(logging.Filter):
+    """Drops repeats of the same tag and message beyond a burst per time window; errors always pass.
+
+    Handlers on any thread share one filter, so the counts sit behind a lock. The
+    "Suppressed N" summary goes to summary_sink (the log queue) rather than back
+    through logging, which would re-enter this filter.
+    """
+
+    def __init__(self, window=LOG_RATE_WINDOW, burst=LOG_RATE_BURST, summary_sink=None):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.summary_sink = summary_sink
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.counts = {}
+
+    def filter(self, record):
+        if record.levelno >= logging.ERROR:
+            return True
+        suppressed = 0
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start > self.window:
+                suppressed = sum(count - self.burst for count in self.counts.values() if count > self.burst)
+                self.counts = {}
+                self.window_start = now
+            key = (record.name, record.msg)
+            count = self.counts.get(key, 0) + 1
+            self.counts[key] = count
+        if suppressed and self.summary_sink is not None:
+            self.summary_sink(logging.LogRecord("Logging", logging.WARNING, __file__, 0, f"Suppressed {suppressed} repeated log messages", None, None))
+        return count <= self.burst
+
+def set_log_level(tag, level):
+    logging.getLogger(tag).setLevel(level)
+
 def setup_logging():
-    downloads_path = "/storage/emulated/0/Download"
+    # Callers only enqueue records; a background listener thread owns the rotating file
+    global _log_listener, _log_file
+    if _log_listener is not None:
+        return _log_file
     try:
-        os.makedirs(downloads_path, exist_ok=True)
-        log_file = os.path.join(downloads_path, "app_crash_log.txt")
-        logging.basicConfig(
-            filename=log_file,
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        os.makedirs(DOWNLOADS_PATH, exist_ok=True)
+        log_file = os.path.join(DOWNLOADS_PATH, LOG_FILE_NAME)
+        file_handler = RotatingFileHandler(log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(name)s: %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(RateLimitFilter(summary_sink=log_queue.put))
+        root = logging.getLogger()
+        root.setLevel(logging.INFO)
+        root.addHandler(queue_handler)
+        for tag, level in TAG_LEVELS.items():
+            set_log_level(tag, level)
+        _log_listener = QueueListener(log_queue, file_handler)
+        _log_listener.start()
+        _log_file = log_file
         print(f"Logging set up: {log_file}")
         return log_file
     except Exception as e:
         print(f"Failed to set up logging: {e}")
         return None
 
+def flush_logging():
+    # Synchronously drains every queued record to disk, then resumes the background writer
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.flush()
+        _log_listener.start()
+
 def custom_exception_handler(exc_type, exc_value, exc_traceback):
     stack_trace = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-    logging.error(f"Unhandled exception:\n{stack_trace}")
-    print(f"Crash logged to /storage/emulated/0/Download/app_crash_log.txt")
+    logging.getLogger("PictureTarot").critical(f"Unhandled exception:\n{stack_trace}")
+    flush_logging()
+    print(f"Crash logged to {os.path.join(DOWNLOADS_PATH, LOG_FILE_NAME)}")
     sys.exit(1)
 
 def log_error(tag, message, exception=None):
-    full_msg = f"{tag}: {message}"
+    full_msg = message
     if exception:
         full_msg += f"\n{traceback.format_exc()}"
-    logging.error(full_msg)
-    print(f"Error logged to /storage/emulated/0/Download/app_crash_log.txt")
+    logging.getLogger(tag).error(full_msg)
+    print(f"Error logged to {os.path.join(DOWNLOADS_PATH, LOG_FILE_NAME)}")
 
 def log_info(tag, message):
-    logging.info(f"{tag}: {message}")
-    print(f"Info logged: {message}")
+    logger = logging.getLogger(tag)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message)
 
 # Set mystical dark gradient background (approximated)
 Window.clearcolor = (0.05, 0.05, 0.25, 1)  # Approx #0a0a2e to #1a1a40
@@ -67,76 +171,426 @@ BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 if hasattr(sys, '_MEIPASS'):  # PyInstaller compatibility
     BASE_PATH = sys._MEIPASS
 
-# Card definitions
-suits = ["Wands", "Cups", "Swords", "Pentacles"]
-ranks = ["Ace", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten", "Page", "Knight", "Queen", "King"]
-major_arcana = [
-    "The Fool", "The Magician", "The High Priestess", "The Empress", "The Emperor", "The Hierophant", "The Lovers",
-    "The Chariot", "Strength", "The Hermit", "Wheel of Fortune", "Justice", "The Hanged Man", "Death",
-    "Temperance", "The Devil", "The Tower", "The Star", "The Moon", "The Sun", "Judgement", "The World"
-]
+# Asset lookup
+ATLAS_DIR = os.path.join(BASE_PATH, "images", "atlas")
+BUILTIN_DECK_NAME = "Rider-Waite (built-in)"
+MEANINGS_DIR = os.path.join(BASE_PATH, "meanings")  # bundled interpretation packs; users add theirs under user_data_dir
 
-# Expanded card meanings with minor arcana
-CARD_MEANINGS = {
-    "The Fool": {"upright": "New beginnings, innocence, spontaneity, free spirit", "reversed": "Recklessness, taken advantage of, inconsideration"},
-    "The Magician": {"upright": "Manifestation, resourcefulness, power, inspired action", "reversed": "Manipulation, poor planning, untapped talents"},
-    "The High Priestess": {"upright": "Intuition, sacred knowledge, divine feminine, subconscious", "reversed": "Secrets, disconnected intuition, withdrawal"},
-    "The Empress": {"upright": "Femininity, beauty, nature, nurturing, abundance", "reversed": "Creative block, dependency on others"},
-    "The Emperor": {"upright": "Authority, establishment, structure, father figure", "reversed": "Domination, excessive control, rigidity"},
-    "The Hierophant": {"upright": "Spiritual wisdom, religious beliefs, conformity, tradition", "reversed": "Personal beliefs, freedom, challenging status quo"},
-    "The Lovers": {"upright": "Love, harmony, relationships, values alignment", "reversed": "Self-love, disharmony, imbalance, misalignment"},
-    "The Chariot": {"upright": "Control, willpower, success, determination", "reversed": "Self-discipline, opposition, lack of direction"},
-    "Strength": {"upright": "Strength, courage, persuasion, influence, compassion", "reversed": "Self-doubt, low energy, raw emotion"},
-    "The Hermit": {"upright": "Soul searching, introspection, inner guidance", "reversed": "Isolation, loneliness, withdrawal"},
-    "Wheel of Fortune": {"upright": "Good luck, karma, life cycles, destiny", "reversed": "Bad luck, lack of control, clinging to control"},
-    "Justice": {"upright": "Justice, fairness, truth, cause and effect", "reversed": "Unfairness, lack of accountability, dishonesty"},
-    "The Hanged Man": {"upright": "Surrender, letting go, sacrifice, patience", "reversed": "Delays, resistance, stalling, indecision"},
-    "Death": {"upright": "Endings, change, transformation, transition", "reversed": "Resistance to change, personal transformation"},
-    "Temperance": {"upright": "Balance, moderation, patience, purpose", "reversed": "Imbalance, excess, self-healing, re-alignment"},
-    "The Devil": {"upright": "Shadow self, attachment, addiction, restriction", "reversed": "Releasing limiting beliefs, exploring dark thoughts"},
-    "The Tower": {"upright": "Sudden change, upheaval, chaos, revelation", "reversed": "Personal transformation, fear of change, averting disaster"},
-    "The Star": {"upright": "Hope, faith, purpose, renewal, spirituality", "reversed": "Lack of faith, despair, self-trust, disconnection"},
-    "The Moon": {"upright": "Illusion, fear, anxiety, subconscious, intuition", "reversed": "Release of fear, repressed emotion, inner confusion"},
-    "The Sun": {"upright": "Positivity, fun, warmth, success, vitality", "reversed": "Inner child, feeling down, overly optimistic"},
-    "Judgement": {"upright": "Judgement, rebirth, inner calling, absolution", "reversed": "Self-doubt, inner critic, ignoring the call"},
-    "The World": {"upright": "Completion, integration, accomplishment, travel", "reversed": "Seeking personal closure, short-cut to success"},
-    "Ace of Wands": {"upright": "Inspiration, new opportunities, growth", "reversed": "Lack of energy, delayed timing, lack of direction"},
-    "King of Wands": {"upright": "Natural born leader, vision, entrepreneur", "reversed": "Impulsiveness, haste, ruthless"},
-}
+# Card texture densities (CARD_RESOLUTIONS) are shared with the deck importer. For the built-in
+# deck, atlases come from tools/build_atlases.py and "full" is served from the loose deck files;
+# imported decks have loose files at every density.
 
-def get_card_meaning(card_name, orientation):
-    try:
-        meanings = CARD_MEANINGS.get(card_name, {})
-        if orientation.lower() in meanings:
-            return meanings[orientation.lower()]
-        if " of " in card_name:
-            suit = card_name.split(" of ")[1]
-            rank = card_name.split(" of ")[0]
-            suit_themes = {
-                "Wands": "creativity, passion, growth",
-                "Cups": "emotions, relationships, intuition",
-                "Swords": "thoughts, communication, conflict",
-                "Pentacles": "material matters, work, resources"
-            }
-            theme = suit_themes.get(suit, "life lessons")
-            return f"Focus on {theme}. {rank} energy brings new perspectives."
-        return f"Meditate on the symbolism of {card_name}. Trust your intuition for guidance."
-    except Exception as e:
-        log_error("PictureTarot", f"Error getting card meaning for {card_name}", e)
-        return f"Error retrieving meaning for {card_name}"
-
-# Spread definitions
-SPREADS = {
-    "Daily Guidance": {"cards": 1, "positions": ["Your guidance for today"], "description": "A single card to guide your day"},
-    "Past-Present-Future": {"cards": 3, "positions": ["Past influences", "Present situation", "Future potential"], "description": "Classic three-card timeline reading"},
-    "Love & Relationships": {"cards": 5, "positions": ["You in love", "Your partner/potential", "The relationship", "Challenges to overcome", "Outcome/advice"], "description": "Deep dive into your romantic life"},
-    "Career Path": {"cards": 4, "positions": ["Current career energy", "Hidden talents", "Obstacles to address", "Next steps to take"], "description": "Navigate your professional journey"},
-    "Celtic Cross": {"cards": 10, "positions": ["Present situation", "Challenge/cross", "Distant past/foundation", "Recent past", "Possible outcome", "Near future", "Your approach", "External influences", "Hopes & fears", "Final outcome"], "description": "The most comprehensive tarot spread"},
-    "Chakra Balance": {"cards": 7, "positions": ["Root Chakra (survival)", "Sacral Chakra (creativity)", "Solar Plexus (power)", "Heart Chakra (love)", "Throat Chakra (communication)", "Third Eye (intuition)", "Crown Chakra (spirituality)"], "description": "Align your spiritual energy centers"},
-    "Essential Oil Guidance": {"cards": 3, "positions": ["Physical needs", "Emotional needs", "Spiritual needs"], "description": "Perfect for holistic wellness consultations"}
-}
+class AssetManifest:
+    """Maps canonical card names to image paths from a single scan of the deck directory."""
+
+    def __init__(self, base_path, atlas_dir=ATLAS_DIR, density_dirs=None, fallback_back_path=None, name=None):
+        self.base_path = base_path
+        self.atlas_dir = atlas_dir
+        self.density_dirs = density_dirs or {}
+        self.fallback_back_path = fallback_back_path
+        self.name = name or os.path.basename(os.path.normpath(base_path))
+        self.card_paths = {}
+        self.card_back_path = None
+        self.card_keys = {}
+        self.atlas_paths = {}
+        self.density_paths = {}
+        self.mtime = None
+        self.scan()
+
+    def _dir_mtime(self):
+        try:
+            return os.stat(self.base_path).st_mtime
+        except OSError:
+            return None
+
+    @staticmethod
+    def _scan_images(path):
+        found = {}
+        with os.scandir(path) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                ext = ext.lower()
+                if ext not in IMAGE_EXTENSIONS or not entry.is_file():
+                    continue
+                key = canonical_asset_key(stem)
+                # Prefer the earlier extension when a card exists in several formats
+                if key in found and IMAGE_EXTENSIONS.index(found[key][0]) <= IMAGE_EXTENSIONS.index(ext):
+                    continue
+                found[key] = (ext, entry.path)
+        return found
+
+    def scan(self):
+        try:
+            self.mtime = self._dir_mtime()
+            found = self._scan_images(self.base_path)
+            self.card_paths = {}
+            self.card_keys = {}
+            for card_name in tarot_cards:
+                key = canonical_asset_key(card_name)
+                if key in found:
+                    self.card_paths[card_name] = found[key][1]
+                    # Atlas entries are keyed by the original file stem
+                    self.card_keys[card_name] = os.path.splitext(os.path.basename(found[key][1]))[0]
+            self.card_back_path = self.fallback_back_path
+            for name in CARD_BACK_NAMES:
+                key = canonical_asset_key(name)
+                if key in found:
+                    self.card_back_path = found[key][1]
+                    self.card_keys[None] = os.path.splitext(os.path.basename(found[key][1]))[0]
+                    break
+            self.atlas_paths = {}
+            if self.atlas_dir:
+                for resolution, _ in CARD_RESOLUTIONS:
+                    atlas_path = os.path.join(self.atlas_dir, f"{self.name}-{resolution}.atlas")
+                    if os.path.exists(atlas_path):
+                        self.atlas_paths[resolution] = atlas_path
+            self.density_paths = {}
+            for resolution, path in self.density_dirs.items():
+                density_found = self._scan_images(path)
+                self.density_paths[resolution] = {card_name: density_found[canonical_asset_key(card_name)][1]
+                                                  for card_name in tarot_cards if canonical_asset_key(card_name) in density_found}
+            log_info("AssetManifest", f"Indexed {len(self.card_paths)} card images in {self.base_path}, atlases: {sorted(self.atlas_paths)}, densities: {sorted(self.density_paths)}")
+        except Exception as e:
+            log_error("AssetManifest", f"Error scanning deck directory {self.base_path}", e)
+            self.card_paths = {}
+            self.card_back_path = self.fallback_back_path
+            self.card_keys = {}
+            self.atlas_paths = {}
+            self.density_paths = {}
+
+    def refresh_if_stale(self):
+        # A single stat of the deck directory; only rescans when its contents changed
+        if self._dir_mtime() != self.mtime:
+            log_info("AssetManifest", "Deck directory changed, rescanning")
+            self.scan()
+            return True
+        return False
+
+    def loose_resolution(self, resolution):
+        # Densities with their own loose files; anything else is served from the full-size file
+        return resolution if resolution in self.density_paths else TEXTURE_RESOLUTION_FULL
+
+    def card_path(self, card_name, resolution=TEXTURE_RESOLUTION_FULL):
+        return self.density_paths.get(resolution, self.card_paths).get(card_name) or self.card_paths.get(card_name)
+
+    def card_source(self, card_name, resolution=TEXTURE_RESOLUTION_FULL):
+        # Usable as an Image.source; card_name None selects the card back
+        atlas_path = self.atlas_paths.get(resolution)
+        key = self.card_keys.get(card_name)
+        if atlas_path and key:
+            return f"atlas://{atlas_path[:-len('.atlas')]}/{key}"
+        return self.card_back_path if card_name is None else self.card_path(card_name, resolution)
+
+DEFAULT_TEXTURE_BUDGET_MB = 64
+
+class TextureCache:
+    """Application-wide LRU of card textures keyed by (card name, resolution)."""
+
+    def __init__(self, budget_mb=DEFAULT_TEXTURE_BUDGET_MB):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.entries = OrderedDict()
+        self.used_bytes = 0
+        self.card_back = None
+        self.atlases = {}
+        self.atlas_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def texture_bytes(texture):
+        # Decoded RGBA size, which is what the GPU actually holds
+        width, height = texture.size
+        return width * height * 4
+
+    def get(self, card_name, resolution=TEXTURE_RESOLUTION_FULL):
+        key = (card_name, resolution)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def contains(self, card_name, resolution=TEXTURE_RESOLUTION_FULL):
+        return (card_name, resolution) in self.entries
+
+    def put(self, card_name, texture, resolution=TEXTURE_RESOLUTION_FULL):
+        key = (card_name, resolution)
+        if key in self.entries:
+            self.used_bytes -= self.entries.pop(key)[1]
+        nbytes = self.texture_bytes(texture)
+        self.entries[key] = (texture, nbytes)
+        self.used_bytes += nbytes
+        self._evict()
+
+    def _evict(self):
+        # Always keep the most recent entry, even if it alone exceeds the budget
+        while self.used_bytes > self.budget_bytes and len(self.entries) > 1:
+            key, (texture, nbytes) = self.entries.popitem(last=False)
+            self.used_bytes -= nbytes
+            self.stats["evictions"] += 1
+            log_info("TextureCache", f"Evicted {key[0]} ({key[1]})")
+
+    def set_budget(self, budget_mb):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._evict()
+
+    def get_card_back(self, path):
+        # One shared texture serves every face-down card
+        if self.card_back is None and path:
+            try:
+                self.card_back = CoreImage(path).texture
+            except Exception as e:
+                log_error("TextureCache", f"Error loading card back {path}", e)
+        return self.card_back
+
+    def get_atlas(self, path):
+        # Atlas pages are shared by every card at that density and stay resident
+        atlas = self.atlases.get(path)
+        if atlas is None:
+            atlas = Atlas(path)
+            self.atlases[path] = atlas
+            self.atlas_bytes += sum(self.texture_bytes(texture) for texture in atlas.original_textures)
+            log_info("TextureCache", f"Loaded atlas {path} ({len(atlas.textures)} regions)")
+        return atlas
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
+        self.card_back = None
+        self.atlases.clear()
+        self.atlas_bytes = 0
+
+    def summary(self):
+        return {
+            "entries": len(self.entries),
+            "used_mb": round(self.used_bytes / (1024 * 1024), 2),
+            "budget_mb": round(self.budget_bytes / (1024 * 1024), 2),
+            "atlases": len(self.atlases),
+            "atlas_mb": round(self.atlas_bytes / (1024 * 1024), 2),
+            "hits": self.stats["hits"],
+            "misses": self.stats["misses"],
+            "evictions": self.stats["evictions"],
+        }
+
+class TexturePrefetcher:
+    """Decodes card images on worker threads and uploads them into the texture cache on the main thread."""
+
+    def __init__(self, texture_cache, max_workers=2):
+        self.texture_cache = texture_cache
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="CardDecode")
+        self.pending = set()
+        self.stats = {
+            "decoded": 0, "decode_ms": 0.0,
+            "uploaded": 0, "upload_ms": 0.0,
+            "reveals": 0, "reveal_ms": 0.0, "last_reveal_ms": 0.0,
+        }
+
+    def prefetch(self, cards, resolution=TEXTURE_RESOLUTION_FULL):
+        # cards is a list of (card_name, path)
+        for card_name, path in cards:
+            key = (card_name, resolution)
+            if not path or key in self.pending or self.texture_cache.contains(card_name, resolution):
+                continue
+            self.pending.add(key)
+            self.executor.submit(self._decode, key, path)
+
+    def _decode(self, key, path):
+        # Runs on a worker thread: file read and PNG decode only, no GL calls
+        try:
+            start = time.perf_counter()
+            image = ImageLoader.load(path)
+            decode_ms = (time.perf_counter() - start) * 1000
+            Clock.schedule_once(lambda dt: self._upload(key, image, decode_ms), 0)
+        except Exception as e:
+            log_error("TexturePrefetcher", f"Error decoding {path}", e)
+            Clock.schedule_once(lambda dt: self.pending.discard(key), 0)
+
+    def _upload(self, key, image, decode_ms):
+        # Runs on the main thread where the GL context lives
+        try:
+            start = time.perf_counter()
+            if key in self.pending:
+                self.texture_cache.put(key[0], image.texture, key[1])
+                self.stats["uploaded"] += 1
+                self.stats["upload_ms"] += (time.perf_counter() - start) * 1000
+            self.stats["decoded"] += 1
+            self.stats["decode_ms"] += decode_ms
+        except Exception as e:
+            log_error("TexturePrefetcher", f"Error uploading texture for {key[0]}", e)
+        finally:
+            self.pending.discard(key)
+
+    def record_reveal(self, elapsed_ms):
+        self.stats["reveals"] += 1
+        self.stats["reveal_ms"] += elapsed_ms
+        self.stats["last_reveal_ms"] = elapsed_ms
+
+    def summary(self):
+        stats = self.stats
+        def avg(total, count):
+            return round(total / count, 2) if count else 0.0
+        return {
+            "avg_decode_ms": avg(stats["decode_ms"], stats["decoded"]),
+            "avg_upload_ms": avg(stats["upload_ms"], stats["uploaded"]),
+            "avg_reveal_ms": avg(stats["reveal_ms"], stats["reveals"]),
+            "last_reveal_ms": round(stats["last_reveal_ms"], 2),
+        }
+
+    def cancel_pending(self):
+        # In-flight decodes are dropped when they land because they are no longer pending
+        self.pending.clear()
+
+PERF_SAMPLE_LIMIT = 600  # per metric, roughly ten seconds of frames at 60 fps
+
+def percentiles(samples, points=(50, 95, 99)):
+    # Nearest-rank percentiles of a sample window
+    ordered = sorted(samples)
+    if not ordered:
+        return {f"p{p}": 0.0 for p in points}
+    result = {}
+    for p in points:
+        rank = max(1, -(-p * len(ordered) // 100))
+        result[f"p{p}"] = round(ordered[rank - 1], 2)
+    return result
+
+def count_widgets(root):
+    return sum(1 for _ in root.walk(restrict=True))
+
+def count_canvas_instructions(canvas):
+    # Child widget canvases and canvas.before/after are nested groups, so one walk covers the tree
+    total = 0
+    for instruction in canvas.children:
+        if isinstance(instruction, InstructionGroup):
+            total += count_canvas_instructions(instruction)
+        else:
+            total += 1
+    return total
+
+LEAK_CYCLES = 3
+
+class LeakDetector:
+    """Debug aid that flags screens whose widget or canvas instruction count keeps growing across visits."""
+
+    def __init__(self, cycles=LEAK_CYCLES):
+        self.enabled = False
+        self.cycles = cycles
+        self.samples = {}
+        self.flagged = {}
+
+    def record(self, screen_name, root):
+        if not self.enabled:
+            return
+        sample = (count_widgets(root), count_canvas_instructions(root.canvas))
+        history = self.samples.setdefault(screen_name, deque(maxlen=self.cycles + 1))
+        history.append(sample)
+        if len(history) <= self.cycles:
+            return
+        pairs = list(zip(history, list(history)[1:]))
+        for field, label in ((0, "widgets"), (1, "instructions")):
+            if all(after[field] > before[field] for before, after in pairs):
+                if (screen_name, label) not in self.flagged:
+                    logging.getLogger("LeakDetector").warning(f"{screen_name}: {label} grew on {self.cycles} consecutive visits ({history[0][field]} -> {history[-1][field]})")
+                self.flagged[(screen_name, label)] = (history[0][field], history[-1][field])
+
+    def reset(self):
+        self.samples.clear()
+        self.flagged.clear()
+
+    def report(self):
+        return {
+            "enabled": self.enabled,
+            "screens": {name: {"widgets": history[-1][0], "instructions": history[-1][1]} for name, history in self.samples.items()},
+            "flagged": [f"{name} {label} {first}->{last}" for (name, label), (first, last) in sorted(self.flagged.items())],
+        }
+
+class PerfMonitor:
+    """Keeps bounded windows of frame times, screen build costs and reveal latency."""
+
+    def __init__(self, sample_limit=PERF_SAMPLE_LIMIT):
+        self.sample_limit = sample_limit
+        self.frame_ms = deque(maxlen=sample_limit)
+        self.reveal_ms = deque(maxlen=sample_limit)
+        self.screen_ms = {}
+        self.screen_widgets = {}
+        self.profiler = None
+        self.frame_event = None
+
+    def start(self):
+        if self.frame_event is None:
+            self.frame_event = Clock.schedule_interval(self._on_frame, 0)
+
+    def stop(self):
+        if self.frame_event is not None:
+            self.frame_event.cancel()
+            self.frame_event = None
+
+    def _on_frame(self, dt):
+        self.frame_ms.append(dt * 1000)
+
+    def record_screen(self, screen_name, elapsed_ms, widget_count):
+        if screen_name not in self.screen_ms:
+            self.screen_ms[screen_name] = deque(maxlen=self.sample_limit)
+        self.screen_ms[screen_name].append(elapsed_ms)
+        self.screen_widgets[screen_name] = widget_count
+
+    def record_reveal(self, elapsed_ms):
+        self.reveal_ms.append(elapsed_ms)
+
+    def report(self):
+        return {
+            "frames": dict(count=len(self.frame_ms), **percentiles(self.frame_ms)),
+            "reveal": dict(count=len(self.reveal_ms), **percentiles(self.reveal_ms)),
+            "screens": {
+                name: dict(count=len(samples), widgets=self.screen_widgets.get(name, 0), **percentiles(samples))
+                for name, samples in self.screen_ms.items()
+            },
+        }
+
+    @property
+    def capturing(self):
+        return self.profiler is not None
 
-tarot_cards = [f"{rank} of {suit}" for suit in suits for rank in ranks] + major_arcana
+    def start_capture(self):
+        if self.profiler is not None:
+            return
+        tracemalloc.start()
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+        log_info("PerfMonitor", "Profiler capture started")
+
+    def stop_capture(self, output_dir=DOWNLOADS_PATH):
+        # Writes a .prof for snakeviz/pstats and a tracemalloc top-50 next to the crash log
+        if self.profiler is None:
+            return []
+        self.profiler.disable()
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(output_dir, exist_ok=True)
+        profile_path = os.path.join(output_dir, f"tarot_profile_{stamp}.prof")
+        self.profiler.dump_stats(profile_path)
+        self.profiler = None
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        memory_path = os.path.join(output_dir, f"tarot_memory_{stamp}.txt")
+        with open(memory_path, 'w', encoding='utf-8') as f:
+            for stat in snapshot.statistics('lineno')[:50]:
+                f.write(f"{stat}\n")
+        log_info("PerfMonitor", f"Profiler capture written to {profile_path} and {memory_path}")
+        return [profile_path, memory_path]
+
+def timed_screen(screen_name):
+    # Records wall time and resulting widget count of a show_* screen builder
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.perf_monitor.record_screen(screen_name, (time.perf_counter() - start) * 1000, count_widgets(self.main_layout))
+                self.leak_detector.record(screen_name, self.main_layout)
+        return wrapper
+    return decorator
 
 class MysticalButton(Button):
     def __init__(self, text="", **kwargs):
@@ -151,8 +605,8 @@ class MysticalButton(Button):
         try:
             log_info("MysticalButton", f"Initializing button: {text}")
             with self.canvas.before:
-                Color(0.1, 0.1, 0.2, 0.9)
-                self.border = Rectangle(pos=self.pos, size=self.size)
+                self.border_color = Color(0.1, 0.1, 0.2, 0.9)
+                self.border_rect = Rectangle(pos=self.pos, size=self.size)
                 Color(0.15, 0.05, 0.25, 0.9)
                 self.inner_rect = Rectangle(pos=(self.x + 2, self.y + 2), size=(self.width - 4, self.height - 4))
             self.bind(pos=self._update_graphics, size=self._update_graphics)
@@ -162,8 +616,8 @@ class MysticalButton(Button):
     def _update_graphics(self, *args):
         try:
             log_info("MysticalButton", f"Updating graphics for button: {self.text}")
-            self.border.pos = self.pos
-            self.border.size = self.size
+            self.border_rect.pos = self.pos
+            self.border_rect.size = self.size
             self.inner_rect.pos = (self.x + 2, self.y + 2)
             self.inner_rect.size = (self.width - 4, self.height - 4)
         except Exception as e:
@@ -176,15 +630,47 @@ class ClientButton(MysticalButton):
         super().__init__(text=f"👤 {client_name}", **kwargs)
         try:
             log_info("ClientButton", f"Initializing client button: {client_name}, active: {is_active}")
-            with self.canvas.before:
-                if is_active:
-                    Color(0.3, 0.6, 0.2, 0.9)
-                else:
-                    Color(0.4, 0.2, 0.6, 0.8)
-                self.border = Rectangle(pos=self.pos, size=self.size)
+            # Recolor the inherited border rather than stacking a second rectangle on it
+            self.border_color.rgba = (0.3, 0.6, 0.2, 0.9) if is_active else (0.4, 0.2, 0.6, 0.8)
         except Exception as e:
             log_error("ClientButton", f"Error initializing button for {client_name}", e)
 
+    def set_client(self, client_name, is_active):
+        # Reused rows relabel the button instead of building a new one
+        self.client_name = client_name
+        self.is_active = is_active
+        self.text = f"👤 {client_name}"
+        self.border_color.rgba = (0.3, 0.6, 0.2, 0.9) if is_active else (0.4, 0.2, 0.6, 0.8)
+
+class ClientRow(BoxLayout):
+    """One client manager row, built once and refilled as the search changes."""
+
+    def __init__(self, on_switch, on_edit, on_delete, **kwargs):
+        super().__init__(orientation='horizontal', size_hint_y=None, height=dp(80), spacing=dp(10), **kwargs)
+        self.client_id = None
+        self.client_btn = ClientButton("", size_hint_x=0.5)
+        self.client_btn.bind(on_press=lambda btn: None if btn.is_active else on_switch(self.client_id))
+        self.info_label = Label(text="", font_size='12sp', color=(0.8, 0.8, 0.8, 1), size_hint_x=0.3, halign='center')
+        self.info_label.bind(size=self.info_label.setter('text_size'))
+        edit_btn = MysticalButton("✏️", size_hint_x=0.1)
+        edit_btn.bind(on_press=lambda btn: on_edit(self.client_id))
+        self.delete_btn = MysticalButton("🗑️", size_hint_x=0.1)
+        self.delete_btn.bind(on_press=lambda btn: on_delete(self.client_id))
+        self.add_widget(self.client_btn)
+        self.add_widget(self.info_label)
+        self.add_widget(edit_btn)
+        self.add_widget(self.delete_btn)
+
+    def show(self, client_data, is_active, can_delete):
+        self.client_id = client_data["id"]
+        self.client_btn.set_client(client_data["name"], is_active)
+        last_visit = client_data["last_visit"][:10] if client_data["last_visit"] else "—"
+        self.info_label.text = f"📚 {client_data['reading_count']} readings\n📝 {client_data['journal_count']} entries\n🕓 {last_visit}"
+        if can_delete and self.delete_btn.parent is None:
+            self.add_widget(self.delete_btn)
+        elif not can_delete and self.delete_btn.parent is not None:
+            self.remove_widget(self.delete_btn)
+
 class AnimatedButton(ButtonBehavior, FloatLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -208,117 +694,327 @@ class AnimatedButton(ButtonBehavior, FloatLayout):
         except Exception as e:
             log_error("AnimatedButton", "Error in button press animation", e)
 
-class TarotCardImage(AnimatedButton, Image):
-    def __init__(self, card_name, orientation, app_instance, **kwargs):
-        super().__init__(**kwargs)
-        self.card_name = card_name
-        self.orientation = orientation
-        self.is_revealed = False
-        self.app_instance = app_instance
-        try:
-            log_info("TarotCardImage", f"Initializing card: {card_name}, orientation: {orientation}")
-            if orientation == "Reversed":
-                self._apply_rotation()
-        except Exception as e:
-            log_error("TarotCardImage", f"Error initializing card {card_name}", e)
+SPREAD_CARD_DP = 300  # on-screen card height textures are chosen for
+SPREAD_FIT_MARGIN = 0.92  # share of the view the whole spread fills before zooming
+SPREAD_ZOOM_MAX = 4.0
+SPREAD_WHEEL_STEP = 1.1
+SPREAD_TAP_SLOP = 10  # dp a touch may travel and still count as a tap
 
-    def _apply_rotation(self):
-        try:
-            log_info("TarotCardImage", f"Applying rotation to card: {self.card_name}")
-            with self.canvas.before:
-                PushMatrix()
-                Rotate(angle=180, origin=(self.center_x, self.center_y))
-            with self.canvas.after:
-                PopMatrix()
-            self.bind(pos=self._update_rotation, size=self._update_rotation)
-        except Exception as e:
-            log_error("TarotCardImage", f"Error applying rotation to {self.card_name}", e)
+class SpreadView(StencilView):
+    """Draws a spread's cards as one mesh per texture under a single pan/zoom transform.
 
-    def _update_rotation(self, *args):
-        try:
-            log_info("TarotCardImage", f"Updating rotation for card: {self.card_name}")
-            if self.orientation == "Reversed":
-                self.canvas.before.clear()
-                self.canvas.after.clear()
-                with self.canvas.before:
-                    PushMatrix()
-                    Rotate(angle=180, origin=(self.center_x, self.center_y))
-                with self.canvas.after:
-                    PopMatrix()
-        except Exception as e:
-            log_error("TarotCardImage", f"Error updating rotation for {self.card_name}", e)
+    Cards sharing a texture (an atlas page, or the card back) share a Mesh, so a 10-card
+    spread costs a few draw calls, and pan and zoom only update the Translate and Scale.
+    Taps go through a HitIndex in layout coordinates to tap_callback(indices, topmost first).
+    """
 
-class ParticleWidget(Widget):
-    def __init__(self, **kwargs):
+    def __init__(self, tap_callback, **kwargs):
         super().__init__(**kwargs)
-        self.particles = []
-        Clock.schedule_once(self.create_particles, 0)
-
-    def create_particles(self, dt):
-        for _ in range(50):  # Match particle count from HTML
-            x = random.uniform(0, Window.width)
-            y = random.uniform(0, Window.height)
-            with self.canvas:
-                Color(1, 1, 1, 0.8)  # White with opacity
-                particle = Ellipse(pos=(x, y), size=(2, 2))
-            self.particles.append(particle)
-            self.animate_particle(particle)
-
-    def animate_particle(self, particle):
-        anim = Animation(pos=(particle.pos[0], particle.pos[1] - 100), duration=15)
-        anim += Animation(pos=particle.pos, duration=15)
-        anim.repeat = True
-        anim.start(particle)
-
-class OrbWidget(Widget):
-    def __init__(self, size, color, pos, delay, **kwargs):
-        super().__init__(**kwargs)
-        self.size = size
+        self.tap_callback = tap_callback
+        self.slots = []
+        self.faces = []  # per slot: (texture, reversed)
+        self.aspect = CARD_ASPECT
+        self.hit_index = HitIndex([], CARD_ASPECT)
+        self.bounds = (0, 0, 0, 0)
+        self.fit_scale = 1.0
+        self.zoom = 1.0
+        self.pan = [0.0, 0.0]  # pixels from the centred position
+        self.touches = {}
+        self.draw_calls = 0
         with self.canvas:
-            Color(*color)
-            self.orb = Ellipse(pos=pos, size=size)
-        self.animate_orb(delay)
-
-    def animate_orb(self, delay):
-        anim = Animation(pos=(self.orb.pos[0] + 30, self.orb.pos[1] - 30), duration=5)
-        anim += Animation(pos=(self.orb.pos[0] - 20, self.orb.pos[1] - 20), duration=5)
-        anim += Animation(pos=(self.orb.pos[0] - 30, self.orb.pos[1] + 30), duration=5)
-        anim += Animation(pos=self.orb.pos, duration=5)
-        anim.repeat = True
-        anim.start(self.orb, delay)
+            PushMatrix()
+            self.translate = Translate()
+            self.scale = Scale(1, 1, 1)
+            self.cards_group = InstructionGroup()
+            PopMatrix()
+        self.bind(pos=self._apply_transform, size=self._fit)
+
+    def show_spread(self, slots, faces, aspect):
+        self.slots = list(slots)
+        self.faces = list(faces)
+        self.aspect = aspect
+        self.hit_index = HitIndex(self.slots, aspect)
+        self.bounds = layout_bounds(self.slots, aspect)
+        self.zoom = 1.0
+        self.pan = [0.0, 0.0]
+        self._fit()
+        self._rebuild()
+
+    def set_face(self, index, texture, reversed_card=False):
+        self.faces[index] = (texture, reversed_card)
+        self._rebuild()
+
+    def _rebuild(self):
+        # Regions of one atlas page share a GL texture id, and so one mesh
+        batches = {}
+        for slot, (texture, reversed_card) in zip(self.slots, self.faces):
+            if texture is None:
+                continue
+            _, vertices, indices = batches.setdefault(texture.id, (texture, [], []))
+            base = len(vertices) // 4
+            uvs = texture.tex_coords
+            # A reversed card starts from the opposite corner of its region, which turns it 180°
+            shift = 4 if reversed_card else 0
+            for corner, (x, y) in enumerate(card_corners(slot, self.aspect)):
+                uv = (2 * corner + shift) % 8
+                vertices += (x, y, uvs[uv], uvs[uv + 1])
+            indices += (base, base + 1, base + 2, base + 2, base + 3, base)
+        self.cards_group.clear()
+        self.cards_group.add(Color(1, 1, 1, 1))
+        for texture, vertices, indices in batches.values():
+            self.cards_group.add(Mesh(vertices=vertices, indices=indices, mode='triangles', texture=texture))
+        self.draw_calls = len(batches)
+
+    def _fit(self, *args):
+        min_x, min_y, max_x, max_y = self.bounds
+        width, height = max(max_x - min_x, 1e-6), max(max_y - min_y, 1e-6)
+        self.fit_scale = SPREAD_FIT_MARGIN * min(self.width / width, self.height / height)
+        self._apply_transform()
+
+    def _apply_transform(self, *args):
+        scale = self.fit_scale * self.zoom
+        min_x, min_y, max_x, max_y = self.bounds
+        # Keep at least the spread's centre on screen
+        for axis, (extent, half_view) in enumerate(((max_x - min_x, self.width / 2), (max_y - min_y, self.height / 2))):
+            limit = max(half_view, extent * scale / 2)
+            self.pan[axis] = min(limit, max(-limit, self.pan[axis]))
+        self.translate.xy = (self.center_x + self.pan[0] - scale * (min_x + max_x) / 2,
+                             self.center_y + self.pan[1] - scale * (min_y + max_y) / 2)
+        self.scale.xyz = (scale, scale, 1)
+
+    def to_layout(self, x, y):
+        scale = self.fit_scale * self.zoom
+        return (x - self.translate.x) / scale, (y - self.translate.y) / scale
+
+    def zoom_at(self, factor, x, y):
+        # The layout point under (x, y) stays under it
+        layout_x, layout_y = self.to_layout(x, y)
+        self.zoom = min(SPREAD_ZOOM_MAX, max(1.0, self.zoom * factor))
+        scale = self.fit_scale * self.zoom
+        min_x, min_y, max_x, max_y = self.bounds
+        self.pan[0] = x - self.center_x - scale * (layout_x - (min_x + max_x) / 2)
+        self.pan[1] = y - self.center_y - scale * (layout_y - (min_y + max_y) / 2)
+        self._apply_transform()
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return False
+        if touch.is_mouse_scrolling:
+            if touch.button in ('scrollup', 'scrolldown'):
+                self.zoom_at(SPREAD_WHEEL_STEP if touch.button == 'scrolldown' else 1 / SPREAD_WHEEL_STEP, *touch.pos)
+            return True
+        touch.grab(self)
+        # A second finger makes the gesture a pinch, so none of its touches is a tap
+        touch.ud['spread_tap'] = not self.touches
+        for other in self.touches.values():
+            other.ud['spread_tap'] = False
+        self.touches[touch.uid] = touch
+        return True
+
+    def on_touch_move(self, touch):
+        if touch.grab_current is not self:
+            return False
+        if abs(touch.x - touch.ox) > dp(SPREAD_TAP_SLOP) or abs(touch.y - touch.oy) > dp(SPREAD_TAP_SLOP):
+            touch.ud['spread_tap'] = False
+        if len(self.touches) == 1:
+            self.pan[0] += touch.dx
+            self.pan[1] += touch.dy
+            self._apply_transform()
+        else:
+            touch.ud['spread_tap'] = False
+            other = next(other for uid, other in self.touches.items() if uid != touch.uid)
+            before = math.dist(other.pos, (touch.px, touch.py))
+            if before > 0:
+                self.zoom_at(math.dist(other.pos, touch.pos) / before, (other.x + touch.x) / 2, (other.y + touch.y) / 2)
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is not self:
+            return False
+        touch.ungrab(self)
+        self.touches.pop(touch.uid, None)
+        if touch.ud.get('spread_tap') and not self.touches:
+            self.tap_callback(self.hit_index.hits(*self.to_layout(*touch.pos)))
+        return True
+
+AMBIENT_PARTICLES = 50  # Match particle count from HTML
+AMBIENT_MIN_PARTICLES = 10
+AMBIENT_FPS_CAP = 30
+AMBIENT_ADAPT_SECONDS = 2.0
+PARTICLE_DRIFT = 100
+PARTICLE_PERIOD = 30.0
+ORB_STEP_SECONDS = 5.0
+ORB_PATH = [(30, -30), (-20, -20), (-30, 30), (0, 0)]
+ORB_SPECS = [  # size, color, anchor as (x fraction, x offset, y fraction), start delay
+    (100, (0.4, 0.49, 0.92, 0.3), (0, 10, 0.1), 0),
+    (80, (1, 0.55, 0, 0.3), (0.8, -80, 0.7), 5),
+    (60, (0.66, 0.9, 0.81, 0.3), (0.9, -60, 0.4), 10),
+]
+
+class AmbientAnimator(Widget):
+    """Draws the background particles and orbs from one clock callback and a single point batch."""
+
+    def __init__(self, enabled=True, fps_cap=AMBIENT_FPS_CAP, max_particles=AMBIENT_PARTICLES, **kwargs):
+        super().__init__(**kwargs)
+        self.fps_cap = fps_cap
+        self.max_particles = max_particles
+        self.active_particles = max_particles
+        # x and y as fractions of the widget size, then a phase offset, per particle
+        self.particles = array('f')
+        for _ in range(max_particles):
+            self.particles.extend((random.random(), random.random(), random.random()))
+        self.elapsed = 0.0
+        self.frame_avg = 1.0 / fps_cap
+        self.adapt_elapsed = 0.0
+        self.event = None
+        self.enabled = enabled
+        self.paused = False
+        self.group = InstructionGroup()
+        self.orbs = []
+        for size, color, anchor, delay in ORB_SPECS:
+            self.group.add(Color(*color))
+            orb = Ellipse(size=(dp(size), dp(size)))
+            self.group.add(orb)
+            self.orbs.append((orb, anchor, delay))
+        self.group.add(Color(1, 1, 1, 0.8))  # White with opacity
+        self.points = Point(pointsize=1)
+        self.group.add(self.points)
+        if enabled:
+            self.canvas.add(self.group)
+        self.bind(pos=self._draw, size=self._draw)
+        self._schedule()
+
+    def _schedule(self):
+        running = self.enabled and not self.paused
+        if running and self.event is None:
+            self.event = Clock.schedule_interval(self._tick, 1.0 / self.fps_cap)
+        elif not running and self.event is not None:
+            self.event.cancel()
+            self.event = None
+
+    def set_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self.canvas.add(self.group)
+            self._draw()
+        else:
+            self.canvas.remove(self.group)
+        self._schedule()
+        log_info("AmbientAnimator", f"Ambient animation {'enabled' if enabled else 'disabled'}")
+
+    def set_fps_cap(self, fps_cap):
+        self.fps_cap = fps_cap
+        if self.event is not None:
+            self.event.cancel()
+            self.event = None
+        self._schedule()
+
+    def pause(self):
+        self.paused = True
+        self._schedule()
+
+    def resume(self):
+        self.paused = False
+        self._schedule()
+
+    def _tick(self, dt):
+        self.elapsed += dt
+        self._adapt(dt)
+        self._draw()
+
+    def _adapt(self, dt):
+        # Sheds particles while ticks run late and slowly restores them once frames recover
+        self.frame_avg += (dt - self.frame_avg) * 0.1
+        self.adapt_elapsed += dt
+        if self.adapt_elapsed < AMBIENT_ADAPT_SECONDS:
+            return
+        self.adapt_elapsed = 0.0
+        budget = 1.0 / self.fps_cap
+        if self.frame_avg > budget * 1.5 and self.active_particles > AMBIENT_MIN_PARTICLES:
+            self.active_particles = max(AMBIENT_MIN_PARTICLES, self.active_particles * 3 // 4)
+            log_info("AmbientAnimator", f"Frame time {self.frame_avg * 1000:.1f} ms, reducing to {self.active_particles} particles")
+        elif self.frame_avg < budget * 1.1 and self.active_particles < self.max_particles:
+            self.active_particles = min(self.max_particles, self.active_particles + 5)
+
+    def _orb_offset(self, t):
+        # Piecewise-linear walk through ORB_PATH, one step every ORB_STEP_SECONDS
+        if t <= 0:
+            return 0, 0
+        step, frac = divmod(t / ORB_STEP_SECONDS, 1)
+        step = int(step) % len(ORB_PATH)
+        start, end = ORB_PATH[step - 1], ORB_PATH[step]
+        return start[0] + (end[0] - start[0]) * frac, start[1] + (end[1] - start[1]) * frac
+
+    def _draw(self, *args):
+        if not self.enabled:
+            return
+        width, height = self.size
+        drift = dp(PARTICLE_DRIFT)
+        particles = self.particles
+        points = []
+        for i in range(0, self.active_particles * 3, 3):
+            phase = (self.elapsed / PARTICLE_PERIOD + particles[i + 2]) % 1.0
+            # Triangle wave: drift down then back up, like the original two-step animation
+            offset = drift * (1 - abs(2 * phase - 1))
+            points += (self.x + particles[i] * width, self.y + particles[i + 1] * height - offset)
+        self.points.points = points
+        for orb, (x_frac, x_offset, y_frac), delay in self.orbs:
+            dx, dy = self._orb_offset(self.elapsed - delay)
+            orb.pos = (self.x + x_frac * width + dp(x_offset + dx), self.y + y_frac * height + dp(dy))
+
+    def summary(self):
+        return {
+            "running": self.event is not None,
+            "fps_cap": self.fps_cap,
+            "particles": self.active_particles,
+            "frame_avg_ms": round(self.frame_avg * 1000, 2),
+        }
 
 class MenuCard(BoxLayout):
     scale_factor = NumericProperty(1.0)
 
+    DAILY_COMPLETED_RGBA = (0.13, 0.76, 0.36, 0.1)  # Green gradient approx
+    DAILY_PENDING_RGBA = (1, 0.84, 0, 0.1)  # Gold gradient approx
+
     def __init__(self, icon, title, description, callback, completed=False, **kwargs):
         super().__init__(orientation='vertical', padding=dp(25), spacing=dp(5), **kwargs)
         self.callback = callback
         self.completed = completed
+        self.description = description
         with self.canvas.before:
             Color(0, 0, 0, 0.05)
             self.rect = Rectangle(pos=self.pos, size=self.size)
         self.bind(pos=self.update_rect, size=self.update_rect)
 
         # Apply daily card styling if applicable
+        self.state_color = None
+        self.state_rect = None
         if "Daily" in title:
-            if completed:
-                with self.canvas.before:
-                    Color(0.13, 0.76, 0.36, 0.1)  # Green gradient approx
-                    self.rect = Rectangle(pos=self.pos, size=self.size)
-            else:
-                with self.canvas.before:
-                    Color(1, 0.84, 0, 0.1)  # Gold gradient approx
-                    self.rect = Rectangle(pos=self.pos, size=self.size)
+            with self.canvas.before:
+                self.state_color = Color(*(self.DAILY_COMPLETED_RGBA if completed else self.DAILY_PENDING_RGBA))
+                self.state_rect = Rectangle(pos=self.pos, size=self.size)
 
         self.add_widget(Label(text=icon, font_size='32sp', color=(1, 1, 1, 1)))
         self.add_widget(Label(text=title, font_size='20sp', bold=True, color=(1, 1, 1, 1)))
-        self.add_widget(Label(text=description if not completed else f"{description} ✅", font_size='14sp', color=(0.72, 0.72, 0.82, 1)))
+        self.desc_label = Label(text=description if not completed else f"{description} ✅", font_size='14sp', color=(0.72, 0.72, 0.82, 1))
+        self.add_widget(self.desc_label)
 
         self.bind(on_touch_down=self.on_touch)
 
+    def set_completed(self, completed):
+        self.completed = completed
+        self.desc_label.text = self.description if not completed else f"{self.description} ✅"
+        if self.state_color is not None:
+            self.state_color.rgba = self.DAILY_COMPLETED_RGBA if completed else self.DAILY_PENDING_RGBA
+
     def update_rect(self, *args):
         self.rect.pos = self.pos
         self.rect.size = self.size
+        if self.state_rect is not None:
+            self.state_rect.pos = self.pos
+            self.state_rect.size = self.size
 
     def on_touch(self, touch):
         if self.collide_point(*touch.pos) and not self.disabled:
@@ -332,24 +1028,132 @@ class MenuCard(BoxLayout):
     def animation_is_active(self):
         return any(anim.state == 'in_progress' for anim in Animation.transitions)
 
-class ClientManager:
-    # [Previous ClientManager code remains unchanged]
-    pass
+class ScreenCache:
+    """Builds each screen once and re-applies only its changing data when shown again."""
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def show(self, name, build, refresh=None):
+        if not self.manager.has_screen(name):
+            screen = Screen(name=name)
+            screen.add_widget(build())
+            self.manager.add_widget(screen)
+            log_info("ScreenCache", f"Built screen {name}")
+        if refresh is not None:
+            refresh()
+        self.manager.current = name
+
+    def invalidate(self, name):
+        if self.manager.has_screen(name):
+            self.manager.remove_widget(self.manager.get_screen(name))
+
+LIST_PAGE_SIZE = 50
+STATS_WINDOWS = [("All time", None), ("12 months", 12), ("3 months", 3), ("This month", 1)]
+SEARCH_DEBOUNCE = 0.25  # seconds of typing pause before the index is queried
+SEARCH_MIN_CHARS = 2  # one-letter prefixes match nearly everything
+CLIENT_PICKER_LIMIT = 30  # rows built per keystroke in the client picker
+
+class ListRow(Label):
+    """Recycled row of a PagedListView; text wraps to the row width."""
+
+    select_callback = ObjectProperty(None, allownone=True)
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('color', (0.9, 0.9, 0.9, 1))
+        kwargs.setdefault('halign', 'left')
+        kwargs.setdefault('valign', 'middle')
+        super().__init__(**kwargs)
+        self.bind(width=lambda instance, width: setattr(instance, 'text_size', (width, None)))
+
+    def on_touch_down(self, touch):
+        if self.select_callback is not None and self.collide_point(*touch.pos):
+            self.select_callback()
+            return True
+        return super().on_touch_down(touch)
+
+class PagedListView(RecycleView):
+    """RecycleView that pulls rows a page at a time from load_page(cursor, limit) -> (rows, cursor).
+
+    Rows are strings, or (text, key) pairs when on_select(key) should run on tap.
+    """
+
+    def __init__(self, load_page, empty_text, font_size='16sp', page_size=LIST_PAGE_SIZE, on_select=None, markup=False, **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = ListRow
+        self.load_page = load_page
+        self.page_size = page_size
+        self.font_size = font_size
+        self.on_select = on_select
+        self.markup = markup
+        self.cursor = None
+        self.exhausted = False
+        self.row_texts = []
+        layout = RecycleBoxLayout(orientation='vertical', spacing=dp(10), default_size=(None, dp(40)), default_size_hint=(1, None), size_hint_y=None)
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+        self.bind(scroll_y=self._on_scroll, width=self._on_width)
+        self.load_more()
+        if not self.row_texts:
+            self.exhausted = True
+            self.data = [{"text": empty_text, "font_size": font_size, "height": dp(40), "markup": False, "select_callback": None}]
+
+    def row_height(self, text):
+        # Estimated from wrapped line count so rows never need a measuring layout pass
+        font_px = sp(float(self.font_size.rstrip('sp')))
+        chars_per_line = max(20, int((self.width or Window.width) / (font_px * 0.55)))
+        lines = sum(max(1, -(-len(line) // chars_per_line)) for line in text.split("\n"))
+        return max(dp(40), lines * font_px * 1.3 + dp(10))
+
+    def load_more(self):
+        if self.exhausted:
+            return
+        rows, self.cursor = self.load_page(self.cursor, self.page_size)
+        if len(rows) < self.page_size:
+            self.exhausted = True
+        self.row_texts.extend(rows)
+        self.data.extend(self.row_data(row) for row in rows)
+
+    def row_data(self, row):
+        text, key = row if isinstance(row, tuple) else (row, None)
+        select = functools.partial(self.on_select, key) if self.on_select is not None and key is not None else None
+        return {"text": text, "font_size": self.font_size, "height": self.row_height(text), "markup": self.markup, "select_callback": select}
+
+    def _on_scroll(self, instance, scroll_y):
+        if scroll_y <= 0.1 and not self.exhausted:
+            self.load_more()
+
+    def _on_width(self, instance, width):
+        if self.row_texts:
+            self.data = [self.row_data(row) for row in self.row_texts]
 
 class PictureTarotApp(App):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         try:
-            self.client_manager = ClientManager()
+            self.write_scheduler = WriteBehindScheduler()
+            self.client_manager = ClientManager(os.path.join(self.user_data_dir, "clients.db"), self.write_scheduler)
             self.animation_enabled = True
+            self.texture_cache_mb = DEFAULT_TEXTURE_BUDGET_MB
+            self.leak_detection = False
+            self.ambient_fps = AMBIENT_FPS_CAP
+            self.meaning_pack_path = None
+            self.meaning_pack = None
+            self.deck_path = None
+            self.builtin_back_path = None
             self.load_settings()
-            self.current_cards = []
-            self.current_orientations = []
-            self.current_spread_name = ""
-            self.current_spread_info = {}
-            self.card_index = 0
-            self.is_special = False
-            self.current_card_widget = None
+            self.reading_session = None
+            self.screen_versions = {}
+            self.stats_months = None
+            self.search_text = ""
+            self.search_event = None
+            self.asset_manifest = None
+            self.texture_cache = TextureCache(self.texture_cache_mb)
+            self.texture_prefetcher = TexturePrefetcher(self.texture_cache)
+            self.perf_monitor = PerfMonitor()
+            self.leak_detector = LeakDetector()
+            self.leak_detector.enabled = self.leak_detection
+            self.use_meaning_pack(self.meaning_pack_path)
         except Exception as e:
             log_error("PictureTarot", "Error initializing app", e)
 
@@ -360,6 +1164,11 @@ class PictureTarotApp(App):
                 with open(settings_file, 'r', encoding='utf-8') as f:
                     settings = json.load(f)
                     self.animation_enabled = settings.get("animation_enabled", True)
+                    self.texture_cache_mb = settings.get("texture_cache_mb", DEFAULT_TEXTURE_BUDGET_MB)
+                    self.leak_detection = settings.get("leak_detection", False)
+                    self.ambient_fps = settings.get("ambient_fps", AMBIENT_FPS_CAP)
+                    self.meaning_pack_path = settings.get("meaning_pack")
+                    self.deck_path = settings.get("deck")
                     log_info("PictureTarot", "Settings loaded successfully")
             else:
                 log_info("PictureTarot", f"Settings file not found at {settings_file}, using defaults")
@@ -371,11 +1180,12 @@ class PictureTarotApp(App):
     def save_settings(self):
         try:
             os.makedirs(self.user_data_dir, exist_ok=True)
-            settings = {"animation_enabled": self.animation_enabled}
+            settings = {"animation_enabled": self.animation_enabled, "texture_cache_mb": self.texture_cache_mb, "leak_detection": self.leak_detection, "ambient_fps": self.ambient_fps, "meaning_pack": self.meaning_pack_path, "deck": self.deck_path}
             settings_file = os.path.join(self.user_data_dir, "settings.json")
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2)
-            log_info("PictureTarot", "Settings saved successfully")
+            def write():
+                atomic_write_json(settings_file, settings)
+                log_info("PictureTarot", "Settings saved successfully")
+            self.write_scheduler.schedule(settings_file, write)
         except Exception as e:
             log_error("PictureTarot", f"Failed to save settings: {str(e)}")
             log_info("PictureTarot", "Failed to save settings")
@@ -395,20 +1205,44 @@ class PictureTarotApp(App):
                 log_info("PictureTarot", f"App icon not found at {icon_path}, using default")
             self.title = "Picture Tarot - Mystical Edition"
             self.main_layout = FloatLayout()
-            self.particle_widget = ParticleWidget()
-            self.main_layout.add_widget(self.particle_widget)
-            self.orb1 = OrbWidget((dp(100), dp(100)), (0.4, 0.49, 0.92, 0.3), (dp(10), dp(Window.height * 0.1)), 0)
-            self.orb2 = OrbWidget((dp(80), dp(80)), (1, 0.55, 0, 0.3), (dp(Window.width * 0.8 - 80), dp(Window.height * 0.7)), 5)
-            self.orb3 = OrbWidget((dp(60), dp(60)), (0.66, 0.9, 0.81, 0.3), (dp(Window.width * 0.9 - 60), dp(Window.height * 0.4)), 10)
-            self.main_layout.add_widget(self.orb1)
-            self.main_layout.add_widget(self.orb2)
-            self.main_layout.add_widget(self.orb3)
+            # One persistent group, resized in place, so the background costs the same draw calls all session
+            self.background = InstructionGroup()
+            self.background.add(Color(0.05, 0.05, 0.25, 1))
+            self.background_rect = Rectangle(pos=(0, 0), size=Window.size)
+            self.background.add(self.background_rect)
+            self.main_layout.canvas.before.add(self.background)
+            self.main_layout.bind(size=self._update_background)
+            self.ambient = AmbientAnimator(enabled=self.animation_enabled, fps_cap=self.ambient_fps)
+            self.main_layout.add_widget(self.ambient)
+            self.screen_manager = ScreenManager(transition=NoTransition())
+            self.screen_cache = ScreenCache(self.screen_manager)
+            self.main_layout.add_widget(self.screen_manager)
+            self.get_asset_manifest()
+            self.perf_monitor.start()
             self.show_main_menu()
+            self.resume_reading_session()
             return self.main_layout
         except Exception as e:
             log_error("PictureTarot", "Error building main app", e)
             raise
 
+    def _update_background(self, instance, size):
+        self.background_rect.size = size
+
+    def on_pause(self):
+        # Android may kill a paused app without calling on_stop
+        self.ambient.pause()
+        self.write_scheduler.flush()
+        flush_logging()
+        return True
+
+    def on_resume(self):
+        self.ambient.resume()
+
+    def on_stop(self):
+        self.client_manager.close()
+        flush_logging()
+
     def get_image_base_path(self):
         try:
             possible_paths = [
@@ -429,23 +1263,49 @@ class PictureTarotApp(App):
             log_error("PictureTarot", "Error finding image base path", e)
             return BASE_PATH
 
-    def get_card_image_path(self, card_name):
+    def get_asset_manifest(self):
+        if self.asset_manifest is None:
+            self.asset_manifest = self.build_asset_manifest(self.deck_path)
+        return self.asset_manifest
+
+    def build_asset_manifest(self, deck_dir):
+        # None, or an imported deck that has since been deleted, selects the built-in deck
+        if deck_dir and os.path.exists(os.path.join(deck_dir, DECK_MANIFEST)):
+            deck = read_deck_manifest(deck_dir)
+            density_dirs = {resolution: os.path.join(deck_dir, resolution) for resolution in deck["resolutions"] if resolution != TEXTURE_RESOLUTION_FULL}
+            return AssetManifest(os.path.join(deck_dir, TEXTURE_RESOLUTION_FULL), atlas_dir=None, density_dirs=density_dirs,
+                                 fallback_back_path=self.get_builtin_back_path(), name=deck["name"])
+        return AssetManifest(self.get_image_base_path())
+
+    def get_builtin_back_path(self):
+        # Decks imported without a card back borrow the built-in one
+        if self.builtin_back_path is None:
+            self.builtin_back_path = AssetManifest(self.get_image_base_path()).card_back_path
+        return self.builtin_back_path
+
+    def get_decks_dir(self):
+        return os.path.join(self.user_data_dir, "decks")
+
+    def use_deck(self, deck_dir):
         try:
-            base_path = self.get_image_base_path()
-            naming_variants = [
-                card_name.replace(" ", "_"),
-                card_name.replace(" ", "_").lower(),
-                card_name.replace(" ", "-"),
-                card_name.replace(" ", "-").lower(),
-                card_name.replace(" ", ""),
-                card_name.replace(" ", "").lower()
-            ]
-            for variant in naming_variants:
-                for ext in ['.png', '.jpg', '.jpeg', '.PNG', '.JPG', '.JPEG']:
-                    image_path = os.path.join(base_path, f"{variant}{ext}")
-                    if os.path.exists(image_path):
-                        log_info("PictureTarot", f"Found image for {card_name} at {image_path}")
-                        return image_path
+            self.asset_manifest = self.build_asset_manifest(deck_dir)
+            self.deck_path = deck_dir
+            # Cached textures and the face-down cards on screen belong to the previous art
+            self.texture_prefetcher.cancel_pending()
+            self.texture_cache.clear()
+            self.screen_cache.invalidate("reading_screen")
+            log_info("PictureTarot", f"Using deck {self.asset_manifest.name}")
+            return True
+        except Exception as e:
+            log_error("PictureTarot", f"Error switching to deck {deck_dir}", e)
+            self.show_error_popup(f"Error switching deck: {str(e)}")
+            return False
+
+    def get_card_image_path(self, card_name, resolution=TEXTURE_RESOLUTION_FULL):
+        try:
+            image_path = self.get_asset_manifest().card_path(card_name, resolution)
+            if image_path:
+                return image_path
             log_info("PictureTarot", f"Card image not found for '{card_name}', using card back")
             return self.get_card_back_path()
         except Exception as e:
@@ -454,20 +1314,38 @@ class PictureTarotApp(App):
 
     def get_card_back_path(self):
         try:
-            base_path = self.get_image_base_path()
-            back_names = ["CardBacks", "cardback", "card_back", "back"]
-            for name in back_names:
-                for ext in ['.png', '.jpg', '.jpeg', '.PNG', '.JPG', '.JPEG']:
-                    path = os.path.join(base_path, f"{name}{ext}")
-                    if os.path.exists(path):
-                        log_info("PictureTarot", f"Found card back image at {path}")
-                        return path
-            log_info("PictureTarot", "Card back image not found")
-            return None
+            return self.get_asset_manifest().card_back_path
         except Exception as e:
             log_error("PictureTarot", "Error getting card back path", e)
             return None
 
+    def get_card_source(self, card_name, pixel_height):
+        # Image.source for a card at the density matching the widget's pixel height
+        return self.get_asset_manifest().card_source(card_name, pick_card_resolution(pixel_height))
+
+    def get_card_texture(self, card_name, resolution=TEXTURE_RESOLUTION_FULL):
+        manifest = self.get_asset_manifest()
+        atlas_path = manifest.atlas_paths.get(resolution)
+        if atlas_path and card_name in manifest.card_keys:
+            return self.texture_cache.get_atlas(atlas_path)[manifest.card_keys[card_name]]
+        resolution = manifest.loose_resolution(resolution)
+        texture = self.texture_cache.get(card_name, resolution)
+        if texture is None:
+            # Not prefetched yet: decode synchronously so later readings hit the cache
+            image_path = self.get_card_image_path(card_name, resolution)
+            if not image_path:
+                return None
+            texture = CoreImage(image_path).texture
+            self.texture_cache.put(card_name, texture, resolution)
+        return texture
+
+    def get_card_back_texture(self, resolution=TEXTURE_RESOLUTION_FULL):
+        manifest = self.get_asset_manifest()
+        atlas_path = manifest.atlas_paths.get(resolution)
+        if atlas_path and None in manifest.card_keys:
+            return self.texture_cache.get_atlas(atlas_path)[manifest.card_keys[None]]
+        return self.texture_cache.get_card_back(self.get_card_back_path())
+
     def show_error_popup(self, message):
         try:
             log_info("PictureTarot", f"Showing error popup: {message}")
@@ -483,101 +1361,155 @@ class PictureTarotApp(App):
         except Exception as e:
             log_error("PictureTarot", f"Error showing popup: {message}", e)
 
+    def show_info_popup(self, title, message):
+        try:
+            content = BoxLayout(orientation='vertical', spacing=10, padding=15)
+            info_label = Label(text=message, font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=0.7, halign='center', valign='middle', text_size=(None, None))
+            info_label.bind(size=info_label.setter('text_size'))
+            close_btn = MysticalButton("OK", size_hint_y=0.3)
+            content.add_widget(info_label)
+            content.add_widget(close_btn)
+            popup = Popup(title=title, content=content, size_hint=(0.8, 0.4), background_color=(0.1, 0.05, 0.2, 0.95))
+            close_btn.bind(on_press=popup.dismiss)
+            popup.open()
+        except Exception as e:
+            log_error("PictureTarot", f"Error showing popup: {message}", e)
+
+    @timed_screen("main_menu")
     def show_main_menu(self):
         try:
-            log_info("PictureTarot", "Rendering main menu")
-            self.main_layout.clear_widgets()
-            with self.main_layout.canvas.before:
-                log_info("PictureTarot", "Setting background color")
-                Color(0.05, 0.05, 0.25, 1)
-                Rectangle(pos=(0, 0), size=Window.size)
-            container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(20), size_hint=(0.95, 0.95), pos_hint={'center_x': 0.5, 'center_y': 0.5})
-            log_info("PictureTarot", f"Container created with size_hint: {container.size_hint}, pos_hint: {container.pos_hint}")
-
-            # Header
-            header = BoxLayout(size_hint_y=0.15, padding=dp(15), spacing=dp(10), background_color=(0, 0, 0, 0.05))
-            client_label = Label(text=f"👤 Client: {self.client_manager.get_current_client_name()}", font_size='16sp', color=(0.66, 0.9, 0.81, 1), size_hint_x=0.6)
-            switch_btn = MysticalButton("Switch Client", size_hint_x=0.2)
-            add_client_btn = MysticalButton("+ Add Client", size_hint_x=0.2)
-            switch_btn.bind(on_press=lambda x: self.show_client_manager())
-            add_client_btn.bind(on_press=lambda x: self.add_new_client())
-            header.add_widget(client_label)
-            header.add_widget(switch_btn)
-            header.add_widget(add_client_btn)
-            log_info("PictureTarot", "Client header widgets added")
-
-            # Title
-            title = Label(text="✦ PICTURE TAROT ✦", font_size='28sp', bold=True, color=(1, 1, 0.8, 1), size_hint_y=0.12, pos_hint={'center_x': 0.5})
-            subtitle = Label(text="UNLOCK YOUR DESTINY", font_size='16sp', color=(0.72, 0.72, 0.82, 1), size_hint_y=0.08, pos_hint={'center_x': 0.5})
-            log_info("PictureTarot", "Title and subtitle created")
-
-            # Menu options
-            daily_drawn = self.client_manager.check_daily_reading_done("Daily Guidance")
-            menu_options = [
-                ("🔮", "Daily Card", "Receive guidance for your day ahead", lambda x: self.start_daily_reading(), not daily_drawn),
-                ("📚", "Tarot Spreads", "Explore deeper with specialized readings", lambda x: self.show_spreads_menu(), True),
-                ("📖", "Reading History", "Review your past revelations", lambda x: self.show_history(), True),
-                ("✍️", "Client Journal", "Document insights and reflections", lambda x: self.show_journal(), True),
-                ("⚙️", "Settings", "Customize your mystical experience", lambda x: self.show_settings(), True)
-            ]
-            container.add_widget(header)
-            container.add_widget(title)
-            container.add_widget(subtitle)
-            for icon, title, desc, callback, enabled in menu_options:
-                card = MenuCard(icon, title, desc, callback, completed=("Daily" in title and not enabled))
-                container.add_widget(card)
-            log_info("PictureTarot", f"Added {len(menu_options)} menu cards to container")
-
-            scroll = ScrollView()
-            scroll.add_widget(container)
-            log_info("PictureTarot", "Added container to ScrollView")
-            self.main_layout.add_widget(scroll)
-            log_info("PictureTarot", "Main layout updated with ScrollView")
+            self.screen_cache.show("main_menu", self._build_main_menu, self._refresh_main_menu)
         except Exception as e:
             log_error("PictureTarot", "Error showing main menu", e)
             self.show_error_popup(f"Error displaying main menu: {str(e)}")
 
+    def _build_main_menu(self):
+        log_info("PictureTarot", "Building main menu")
+        container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(20), size_hint=(0.95, 0.95), pos_hint={'center_x': 0.5, 'center_y': 0.5})
+
+        # Header
+        header = BoxLayout(size_hint_y=0.15, padding=dp(15), spacing=dp(10), background_color=(0, 0, 0, 0.05))
+        self.menu_client_label = Label(font_size='16sp', color=(0.66, 0.9, 0.81, 1), size_hint_x=0.6, halign='center')
+        switch_btn = MysticalButton("Switch Client", size_hint_x=0.2)
+        add_client_btn = MysticalButton("+ Add Client", size_hint_x=0.2)
+        switch_btn.bind(on_press=lambda x: self.show_client_manager())
+        add_client_btn.bind(on_press=lambda x: self.add_new_client())
+        header.add_widget(self.menu_client_label)
+        header.add_widget(switch_btn)
+        header.add_widget(add_client_btn)
+
+        # Title
+        title = Label(text="✦ PICTURE TAROT ✦", font_size='28sp', bold=True, color=(1, 1, 0.8, 1), size_hint_y=0.12, pos_hint={'center_x': 0.5})
+        subtitle = Label(text="UNLOCK YOUR DESTINY", font_size='16sp', color=(0.72, 0.72, 0.82, 1), size_hint_y=0.08, pos_hint={'center_x': 0.5})
+
+        # Menu options
+        menu_options = [
+            ("🔮", "Daily Card", "Receive guidance for your day ahead", lambda: self.start_daily_reading()),
+            ("📚", "Tarot Spreads", "Explore deeper with specialized readings", lambda: self.show_spreads_menu()),
+            ("📖", "Reading History", "Review your past revelations", lambda: self.show_history()),
+            ("✍️", "Client Journal", "Document insights and reflections", lambda: self.show_journal()),
+            ("🔍", "Search", "Find past readings and journal notes", lambda: self.show_search()),
+            ("⚙️", "Settings", "Customize your mystical experience", lambda: self.show_settings())
+        ]
+        container.add_widget(header)
+        container.add_widget(title)
+        container.add_widget(subtitle)
+        for icon, title, desc, callback in menu_options:
+            card = MenuCard(icon, title, desc, callback)
+            if "Daily" in title:
+                self.menu_daily_card = card
+            container.add_widget(card)
+
+        scroll = ScrollView()
+        scroll.add_widget(container)
+        return scroll
+
+    def _refresh_main_menu(self):
+        counts = self.client_manager.get_reading_counts()
+        self.menu_client_label.text = f"👤 Client: {self.client_manager.get_current_client_name()}\n{counts['week']} this week · {counts['month']} this month"
+        self.menu_daily_card.set_completed(self.client_manager.check_daily_reading_done("Daily Guidance"))
+
+    def _build_screen_header(self, title_text, back, title_size_hint_x=0.7, size_hint_y=0.1):
+        header = BoxLayout(size_hint_y=size_hint_y)
+        back_btn = MysticalButton("← Back", size_hint_x=1 - title_size_hint_x)
+        back_btn.bind(on_press=lambda x: back())
+        title = Label(text=title_text, font_size='24sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=title_size_hint_x)
+        header.add_widget(back_btn)
+        header.add_widget(title)
+        return header, title
+
+    def _screen_is_current(self, name):
+        # True when the cached screen already reflects the latest client data
+        if self.screen_versions.get(name) == self.client_manager.version:
+            return True
+        self.screen_versions[name] = self.client_manager.version
+        return False
+
+    @timed_screen("client_manager")
     def show_client_manager(self):
         try:
-            self.main_layout.clear_widgets()
-            container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
-            header = BoxLayout(size_hint_y=0.1)
-            back_btn = MysticalButton("← Back", size_hint_x=0.3)
-            back_btn.bind(on_press=lambda x: self.show_main_menu())
-            title = Label(text="👥 Client Manager", font_size='24sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=0.7)
-            header.add_widget(back_btn)
-            header.add_widget(title)
-            container.add_widget(header)
-            scroll = ScrollView()
-            client_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
-            client_container.bind(minimum_height=client_container.setter('height'))
-            for client_id, client_data in self.client_manager.clients.items():
-                is_active = client_id == self.client_manager.current_client_id
-                client_box = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(80), spacing=dp(10))
-                client_btn = ClientButton(client_data["name"], is_active=is_active, size_hint_x=0.6)
-                if not is_active:
-                    client_btn.bind(on_press=lambda btn, cid=client_id: self.switch_to_client(cid))
-                readings_count = len(client_data["readings"])
-                journal_count = len(client_data["journal"])
-                info_label = Label(text=f"📚 {readings_count} readings\n📝 {journal_count} entries", font_size='12sp', color=(0.8, 0.8, 0.8, 1), size_hint_x=0.3, halign='center')
-                info_label.bind(size=info_label.setter('text_size'))
-                client_box.add_widget(client_btn)
-                client_box.add_widget(info_label)
-                if len(self.client_manager.clients) > 1:
-                    delete_btn = MysticalButton("🗑️", size_hint_x=0.1)
-                    delete_btn.bind(on_press=lambda btn, cid=client_id: self.confirm_delete_client(cid))
-                    client_box.add_widget(delete_btn)
-                client_container.add_widget(client_box)
-            scroll.add_widget(client_container)
-            container.add_widget(scroll)
-            add_btn = MysticalButton("➕ Add New Client", size_hint_y=0.1)
-            add_btn.bind(on_press=lambda x: self.add_new_client())
-            container.add_widget(add_btn)
-            self.main_layout.add_widget(container)
+            self.screen_cache.show("client_manager", self._build_client_manager, self._refresh_client_manager)
         except Exception as e:
             log_error("PictureTarot", "Error showing client manager", e)
             self.show_error_popup(f"Error displaying client manager: {str(e)}")
 
+    def _build_client_manager(self):
+        container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, _ = self._build_screen_header("👥 Client Manager", self.show_main_menu)
+        container.add_widget(header)
+        self.client_search_input = TextInput(hint_text="Find a client by name or description", multiline=False, size_hint_y=None, height=dp(45), background_color=(0.2, 0.15, 0.3, 0.8), foreground_color=(1, 1, 1, 1), font_size='16sp')
+        # The index answers within a frame, so the list follows every keystroke without a debounce
+        self.client_search_input.bind(text=lambda instance, text: self.update_client_list())
+        self.client_search_input.bind(on_text_validate=lambda instance: self.pick_first_client())
+        container.add_widget(self.client_search_input)
+        self.client_count_label = Label(text="", font_size='12sp', color=(0.8, 0.8, 0.8, 1), size_hint_y=None, height=dp(20))
+        container.add_widget(self.client_count_label)
+        scroll = ScrollView()
+        self.client_list_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
+        self.client_list_container.bind(minimum_height=self.client_list_container.setter('height'))
+        scroll.add_widget(self.client_list_container)
+        container.add_widget(scroll)
+        add_btn = MysticalButton("➕ Add New Client", size_hint_y=0.1)
+        add_btn.bind(on_press=lambda x: self.add_new_client())
+        container.add_widget(add_btn)
+        self.client_picker_results = []
+        # Rows are reused on every keystroke; building widgets is what would cost frames
+        self.client_rows = [ClientRow(self.switch_to_client, self.edit_client, self.confirm_delete_client) for _ in range(CLIENT_PICKER_LIMIT)]
+        return container
+
+    def _refresh_client_manager(self):
+        if self._screen_is_current("client_manager"):
+            return
+        self.update_client_list()
+
+    def update_client_list(self):
+        # Only the best CLIENT_PICKER_LIMIT matches get widgets; an empty query lists recent visits
+        try:
+            query = self.client_search_input.text
+            self.client_picker_results = self.client_manager.find_clients(query, CLIENT_PICKER_LIMIT)
+            total = self.client_manager.client_count
+            if query.strip():
+                self.client_count_label.text = f"{len(self.client_picker_results)} shown" if self.client_picker_results else "No client matches"
+            elif total > len(self.client_picker_results):
+                self.client_count_label.text = f"{len(self.client_picker_results)} most recent of {total} clients, type to find others"
+            else:
+                self.client_count_label.text = f"{total} clients"
+            self.client_list_container.clear_widgets()
+            current_id = self.client_manager.current_client_id
+            for row, client_data in zip(self.client_rows, self.client_picker_results):
+                row.show(client_data, client_data["id"] == current_id, can_delete=total > 1)
+                self.client_list_container.add_widget(row)
+        except Exception as e:
+            log_error("PictureTarot", "Error updating client list", e)
+            self.show_error_popup(f"Error finding clients: {str(e)}")
+
+    def pick_first_client(self):
+        # Enter in the search field switches to the best match
+        if self.client_search_input.text.strip() and self.client_picker_results:
+            client_id = self.client_picker_results[0]["id"]
+            if client_id != self.client_manager.current_client_id:
+                self.switch_to_client(client_id)
+
     def switch_to_client(self, client_id):
         try:
             if self.client_manager.switch_client(client_id):
@@ -624,9 +1556,43 @@ class PictureTarotApp(App):
             log_error("PictureTarot", "Error adding new client", e)
             self.show_error_popup(f"Error adding client: {str(e)}")
 
+    def edit_client(self, client_id):
+        try:
+            client_data = self.client_manager.get_client(client_id)
+            content = BoxLayout(orientation='vertical', spacing=dp(15), padding=dp(15))
+            title_label = Label(text="✏️ Edit Client", font_size='20sp', bold=True, color=(1, 1, 0.8, 1), size_hint_y=0.2)
+            name_input = TextInput(text=client_data["name"], hint_text="Client name", multiline=False, size_hint_y=0.2, background_color=(0.2, 0.15, 0.3, 0.8), foreground_color=(1, 1, 1, 1), font_size='16sp')
+            desc_input = TextInput(text=client_data["description"], hint_text="Description", multiline=True, size_hint_y=0.4, background_color=(0.2, 0.15, 0.3, 0.8), foreground_color=(1, 1, 1, 1), font_size='14sp')
+            buttons = BoxLayout(size_hint_y=0.2, spacing=dp(10))
+            save_btn = MysticalButton("✅ Save")
+            cancel_btn = MysticalButton("❌ Cancel")
+            buttons.add_widget(save_btn)
+            buttons.add_widget(cancel_btn)
+            content.add_widget(title_label)
+            content.add_widget(name_input)
+            content.add_widget(desc_input)
+            content.add_widget(buttons)
+            popup = Popup(title="", content=content, size_hint=(0.9, 0.7), background_color=(0.05, 0.05, 0.15, 0.95))
+            def save_client(*args):
+                name = name_input.text.strip()
+                if not name:
+                    self.show_error_popup("Client name cannot be empty!")
+                    return
+                if self.client_manager.rename_client(client_id, name, desc_input.text.strip()):
+                    popup.dismiss()
+                    self.show_client_manager()
+                else:
+                    self.show_error_popup("Client name already exists or invalid!")
+            save_btn.bind(on_press=save_client)
+            cancel_btn.bind(on_press=popup.dismiss)
+            popup.open()
+        except Exception as e:
+            log_error("PictureTarot", f"Error editing client {client_id}", e)
+            self.show_error_popup(f"Error editing client: {str(e)}")
+
     def confirm_delete_client(self, client_id):
         try:
-            client_name = self.client_manager.clients[client_id]["name"]
+            client_name = self.client_manager.get_client(client_id)["name"]
             content = BoxLayout(orientation='vertical', spacing=dp(15), padding=dp(15))
             warning_label = Label(text=f"⚠️ Delete Client?\n\n'{client_name}'\n\nThis will permanently delete all readings and journal entries for this client.", font_size='16sp', color=(1, 1, 1, 1), halign='center', size_hint_y=0.7)
             warning_label.bind(size=warning_label.setter('text_size'))
@@ -664,172 +1630,319 @@ class PictureTarotApp(App):
             log_error("PictureTarot", "Error starting daily reading", e)
             self.show_error_popup(f"Error starting daily reading: {str(e)}")
 
+    @timed_screen("spreads_menu")
     def show_spreads_menu(self):
         try:
-            self.main_layout.clear_widgets()
-            container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
-            header = BoxLayout(size_hint_y=0.12)
-            back_btn = MysticalButton("← Back", size_hint_x=0.25)
-            back_btn.bind(on_press=lambda x: self.show_main_menu())
-            title = Label(text="Choose Your Spread", font_size='20sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=0.5)
-            client_info = Label(text=f"👤 {self.client_manager.get_current_client_name()}", font_size='14sp', color=(0.66, 0.9, 0.81, 1), size_hint_x=0.25)
-            header.add_widget(back_btn)
-            header.add_widget(title)
-            header.add_widget(client_info)
-            container.add_widget(header)
-            scroll = ScrollView()
-            spread_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
-            spread_container.bind(minimum_height=spread_container.setter('height'))
-            for spread_name, spread_info in SPREADS.items():
-                if spread_name == "Daily Guidance":
-                    continue
-                spread_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(120), padding=dp(10), spacing=dp(5))
-                with spread_layout.canvas.before:
-                    Color(0.15, 0.1, 0.25, 0.7)
-                    rect = Rectangle(pos=spread_layout.pos, size=spread_layout.size)
-                    spread_layout.bg_rect = rect
-                spread_layout.bind(pos=self._update_spread_bg, size=self._update_spread_bg)
-                name_label = Label(text=f"✨ {spread_name} ({spread_info['cards']} cards)", font_size='18sp', bold=True, color=(1, 1, 1, 1), size_hint_y=0.6, halign='left')
-                name_label.bind(size=name_label.setter('text_size'))
-                desc_label = Label(text=spread_info['description'], font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=0.4, halign='left')
-                desc_label.bind(size=desc_label.setter('text_size'))
-                spread_layout.add_widget(name_label)
-                spread_layout.add_widget(desc_label)
-                clickable = AnimatedButton(size_hint_y=None, height=dp(120))
-                clickable.bind(on_press=lambda x, s=spread_name: self.start_reading(SPREADS[s]["cards"], s))
-                spread_layout.add_widget(clickable)
-                spread_container.add_widget(spread_layout)
-            scroll.add_widget(spread_container)
-            container.add_widget(scroll)
-            self.main_layout.add_widget(container)
+            self.screen_cache.show("spreads_menu", self._build_spreads_menu, self._refresh_spreads_menu)
         except Exception as e:
             log_error("PictureTarot", "Error showing spreads menu", e)
             self.show_error_popup(f"Error displaying spreads menu: {str(e)}")
 
+    def _build_spreads_menu(self):
+        container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header = BoxLayout(size_hint_y=0.12)
+        back_btn = MysticalButton("← Back", size_hint_x=0.25)
+        back_btn.bind(on_press=lambda x: self.show_main_menu())
+        title = Label(text="Choose Your Spread", font_size='20sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=0.5)
+        self.spreads_client_label = Label(font_size='14sp', color=(0.66, 0.9, 0.81, 1), size_hint_x=0.25)
+        header.add_widget(back_btn)
+        header.add_widget(title)
+        header.add_widget(self.spreads_client_label)
+        container.add_widget(header)
+        scroll = ScrollView()
+        spread_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
+        spread_container.bind(minimum_height=spread_container.setter('height'))
+        for spread_name, spread_info in SPREADS.items():
+            if spread_name == "Daily Guidance":
+                continue
+            spread_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(120), padding=dp(10), spacing=dp(5))
+            with spread_layout.canvas.before:
+                Color(0.15, 0.1, 0.25, 0.7)
+                rect = Rectangle(pos=spread_layout.pos, size=spread_layout.size)
+                spread_layout.bg_rect = rect
+            spread_layout.bind(pos=self._update_spread_bg, size=self._update_spread_bg)
+            name_label = Label(text=f"✨ {spread_name} ({spread_info['cards']} cards)", font_size='18sp', bold=True, color=(1, 1, 1, 1), size_hint_y=0.6, halign='left')
+            name_label.bind(size=name_label.setter('text_size'))
+            desc_label = Label(text=spread_info['description'], font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=0.4, halign='left')
+            desc_label.bind(size=desc_label.setter('text_size'))
+            spread_layout.add_widget(name_label)
+            spread_layout.add_widget(desc_label)
+            clickable = AnimatedButton(size_hint_y=None, height=dp(120))
+            clickable.bind(on_press=lambda x, s=spread_name: self.start_reading(SPREADS[s]["cards"], s))
+            spread_layout.add_widget(clickable)
+            spread_container.add_widget(spread_layout)
+        scroll.add_widget(spread_container)
+        container.add_widget(scroll)
+        return container
+
+    def _refresh_spreads_menu(self):
+        self.spreads_client_label.text = f"👤 {self.client_manager.get_current_client_name()}"
+
     def _update_spread_bg(self, instance, value):
         instance.bg_rect.pos = instance.pos
         instance.bg_rect.size = instance.size
 
     def start_reading(self, num_cards, spread_name, special=False):
         try:
-            self.current_spread_name = spread_name
-            self.current_spread_info = SPREADS[spread_name]
-            self.current_cards = random.sample(tarot_cards, num_cards)
-            self.current_orientations = [random.choice(["Upright", "Reversed"]) for _ in range(num_cards)]
-            self.card_index = 0
-            self.is_special = special
+            self.get_asset_manifest().refresh_if_stale()
+            self.reading_session = ReadingSession.draw(spread_name, num_cards, self.client_manager.current_client_id, special)
+            self.client_manager.save_session(self.reading_session.to_bytes())
+            self.prefetch_reading_textures()
             self.show_reading_screen()
         except Exception as e:
             log_error("PictureTarot", f"Error starting reading for {spread_name}", e)
             self.show_error_popup(f"Error starting reading: {str(e)}")
 
+    def resume_reading_session(self):
+        # Android may have killed the app mid-reading; reopen the checkpointed session where it stopped
+        try:
+            data = self.client_manager.load_session()
+            if data is None:
+                return
+            session = ReadingSession.from_bytes(data)
+            if session.complete or session.client_id != self.client_manager.current_client_id:
+                self.client_manager.clear_session()
+                return
+            log_info("PictureTarot", f"Resuming {session.spread} reading with {session.next_index} of {len(session)} cards revealed")
+            self.reading_session = session
+            self.prefetch_reading_textures()
+            self.show_reading_screen()
+        except Exception as e:
+            log_error("PictureTarot", "Error resuming reading session", e)
+            self.client_manager.clear_session()
+
+    def prefetch_reading_textures(self):
+        self.texture_prefetcher.cancel_pending()
+        manifest = self.get_asset_manifest()
+        resolution = pick_card_resolution(dp(SPREAD_CARD_DP))
+        if resolution not in manifest.atlas_paths:
+            # Atlas regions need no decode; only loose files are worth prefetching
+            resolution = manifest.loose_resolution(resolution)
+            self.texture_prefetcher.prefetch([(card, self.get_card_image_path(card, resolution)) for card in self.reading_session.cards], resolution)
+
+    @timed_screen("reading_screen")
     def show_reading_screen(self):
         try:
-            self.main_layout.clear_widgets()
-            container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
-            header = BoxLayout(size_hint_y=0.1)
-            back_btn = MysticalButton("← Back", size_hint_x=0.3)
-            back_btn.bind(on_press=lambda x: self.show_main_menu())
-            title = Label(text=f"{self.current_spread_name} Reading", font_size='24sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=0.7)
-            header.add_widget(back_btn)
-            header.add_widget(title)
-            container.add_widget(header)
-            scroll = ScrollView()
-            card_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
-            card_container.bind(minimum_height=card_container.setter('height'))
-            for i in range(len(self.current_cards)):
-                card = TarotCardImage(self.current_cards[i], self.current_orientations[i], self, size_hint_y=None, height=dp(300))
-                card.bind(on_touch_down=lambda instance, touch, idx=i: self.reveal_card(idx) if instance.collide_point(*touch.pos) else None)
-                meaning = get_card_meaning(self.current_cards[i], self.current_orientations[i])
-                meaning_label = Label(text=f"Position {i+1}: {meaning}", font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, height=dp(50))
-                card_container.add_widget(card)
-                card_container.add_widget(meaning_label)
-            scroll.add_widget(card_container)
-            container.add_widget(scroll)
-            self.main_layout.add_widget(container)
+            self.screen_cache.show("reading_screen", self._build_reading_screen, self._refresh_reading_screen)
         except Exception as e:
             log_error("PictureTarot", "Error showing reading screen", e)
             self.show_error_popup(f"Error displaying reading: {str(e)}")
 
+    def _build_reading_screen(self):
+        container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, self.reading_title_label = self._build_screen_header("", self.show_main_menu)
+        container.add_widget(header)
+        self.spread_view = SpreadView(self.on_spread_tap, size_hint_y=0.7)
+        container.add_widget(self.spread_view)
+        self.reading_detail_label = Label(text="", font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=0.2, halign='center', valign='top')
+        self.reading_detail_label.bind(size=self.reading_detail_label.setter('text_size'))
+        container.add_widget(self.reading_detail_label)
+        return container
+
+    def _refresh_reading_screen(self):
+        # The screen chrome is cached; only the drawn cards are new for each reading
+        session = self.reading_session
+        self.reading_title_label.text = f"{session.spread} Reading"
+        resolution = pick_card_resolution(dp(SPREAD_CARD_DP))
+        back = self.get_card_back_texture(resolution)
+        aspect = back.height / back.width if back is not None else CARD_ASPECT
+        # A resumed session shows the cards already turned face up
+        faces = [(self.get_card_texture(card_name, resolution), orientation == "Reversed") if session.is_revealed(i) else (back, False)
+                 for i, (card_name, orientation) in enumerate(zip(session.cards, session.orientations))]
+        self.spread_view.show_spread(spread_layout(session.spread, len(session), aspect), faces, aspect)
+        if session.next_index:
+            self.show_card_details(session.next_index - 1)
+        else:
+            self.show_reveal_hint()
+
+    def position_name(self, index):
+        positions = SPREADS.get(self.reading_session.spread, {}).get("positions", [])
+        return positions[index] if index < len(positions) else f"Position {index + 1}"
+
+    def show_reveal_hint(self):
+        session = self.reading_session
+        if not session.complete:
+            self.reading_detail_label.text = f"Tap card {session.next_index + 1} ({self.position_name(session.next_index)}) to reveal it. Drag to move, pinch to zoom."
+
+    def show_card_details(self, index):
+        session = self.reading_session
+        card_name, orientation = session.cards[index], session.orientations[index]
+        lines = [f"{index + 1}. {self.position_name(index)}: {card_name} ({orientation})", get_card_meaning(card_name, orientation)]
+        if not session.complete:
+            lines.append(f"Next: card {session.next_index + 1} ({self.position_name(session.next_index)})")
+        self.reading_detail_label.text = "\n".join(lines)
+
+    def on_spread_tap(self, indices):
+        # indices are every card under the touch, topmost first; the cross in the Celtic Cross overlaps
+        session = self.reading_session
+        if session is None or not indices:
+            return
+        if session.next_index in indices:
+            self.reveal_card(session.next_index)
+        else:
+            revealed = [index for index in indices if session.is_revealed(index)]
+            if revealed:
+                self.show_card_details(revealed[0])
+
     def reveal_card(self, index):
         try:
-            if index == self.card_index and not self.current_card_widget.is_revealed:
-                self.current_card_widget.source = self.get_card_image_path(self.current_cards[index])
-                self.current_card_widget.is_revealed = True
-                self.card_index += 1
-                if self.card_index < len(self.current_cards):
-                    self.current_card_widget = self.main_layout.children[0].children[0].children[self.card_index * 2]  # Adjust for layout
-                if self.is_special and self.card_index == len(self.current_cards):
-                    self.client_manager.add_reading_to_current_client(self.current_spread_name, self.current_cards, self.current_orientations)
+            session = self.reading_session
+            if session is None or not session.reveal(index):
+                return
+            start = time.perf_counter()
+            resolution = pick_card_resolution(dp(SPREAD_CARD_DP))
+            self.spread_view.set_face(index, self.get_card_texture(session.cards[index], resolution), session.orientations[index] == "Reversed")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.texture_prefetcher.record_reveal(elapsed_ms)
+            self.perf_monitor.record_reveal(elapsed_ms)
+            self.show_card_details(index)
+            if not session.complete:
+                self.client_manager.save_session(session.to_bytes())
+                return
+            log_info("PictureTarot", f"Reading fully revealed, texture stats: {self.texture_prefetcher.summary()}, cache: {self.texture_cache.summary()}")
+            if session.special:
+                self.client_manager.add_reading_to_current_client(session.spread, session.cards, session.orientations, session.seed)
+            # Queued behind the saved reading, so a kill can't leave it both saved and resumable
+            self.client_manager.clear_session()
         except Exception as e:
             log_error("PictureTarot", f"Error revealing card at index {index}", e)
             self.show_error_popup(f"Error revealing card: {str(e)}")
 
+    @timed_screen("history")
     def show_history(self):
         try:
-            self.main_layout.clear_widgets()
-            container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
-            header = BoxLayout(size_hint_y=0.1)
-            back_btn = MysticalButton("← Back", size_hint_x=0.3)
-            back_btn.bind(on_press=lambda x: self.show_main_menu())
-            title = Label(text="Reading History", font_size='24sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=0.7)
-            header.add_widget(back_btn)
-            header.add_widget(title)
-            container.add_widget(header)
-            scroll = ScrollView()
-            history_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
-            history_container.bind(minimum_height=history_container.setter('height'))
-            client = self.client_manager.get_current_client()
-            if client and client.get("readings"):
-                for reading in client["readings"]:
-                    date_str = datetime.fromisoformat(reading["date"]).strftime("%Y-%m-%d %H:%M")
-                    text = f"{date_str} - {reading['spread']} ({len(reading['cards'])} cards)"
-                    history_label = Label(text=text, font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, height=dp(40))
-                    history_container.add_widget(history_label)
-            else:
-                history_label = Label(text="No readings found.", font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, height=dp(40))
-                history_container.add_widget(history_label)
-            scroll.add_widget(history_container)
-            container.add_widget(scroll)
-            self.main_layout.add_widget(container)
+            self.screen_cache.show("history", self._build_history, self._refresh_history)
         except Exception as e:
             log_error("PictureTarot", "Error showing history", e)
             self.show_error_popup(f"Error displaying history: {str(e)}")
 
+    def _build_history(self):
+        self.history_container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, _ = self._build_screen_header("Reading History", self.show_main_menu)
+        self.history_container.add_widget(header)
+        insights_btn = MysticalButton("📈 Card Insights", size_hint_y=0.1)
+        insights_btn.bind(on_press=lambda x: self.show_stats())
+        self.history_container.add_widget(insights_btn)
+        self.history_list = None
+        return self.history_container
+
+    def _refresh_history(self):
+        if self._screen_is_current("history"):
+            return
+        if self.history_list is not None:
+            self.history_container.remove_widget(self.history_list)
+        self.history_list = PagedListView(self.load_history_page, "No readings found.")
+        # Between the header and the insights button
+        self.history_container.add_widget(self.history_list, index=1)
+
+    def load_history_page(self, cursor, limit):
+        readings, cursor = self.client_manager.get_readings_page(cursor, limit)
+        rows = []
+        for reading in readings:
+            date_str = datetime.fromisoformat(reading["date"]).strftime("%Y-%m-%d %H:%M")
+            rows.append(f"{date_str} - {reading['spread']} ({reading['card_count']} cards)")
+        return rows, cursor
+
+    @timed_screen("stats")
+    def show_stats(self):
+        try:
+            self.screen_cache.show("stats", self._build_stats, self._refresh_stats)
+        except Exception as e:
+            log_error("PictureTarot", "Error showing card stats", e)
+            self.show_error_popup(f"Error displaying card insights: {str(e)}")
+
+    def _build_stats(self):
+        container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, _ = self._build_screen_header("📈 Card Insights", self.show_history)
+        container.add_widget(header)
+        window_row = BoxLayout(size_hint_y=None, height=dp(50), spacing=dp(5))
+        for label, months in STATS_WINDOWS:
+            window_btn = MysticalButton(label, font_size='14sp', height=dp(50))
+            window_btn.bind(on_press=lambda x, m=months: self.set_stats_window(m))
+            window_row.add_widget(window_btn)
+        container.add_widget(window_row)
+        scroll = ScrollView()
+        self.stats_label = Label(markup=True, font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, halign='left', valign='top')
+        self.stats_label.bind(width=lambda instance, width: setattr(instance, 'text_size', (width, None)))
+        self.stats_label.bind(texture_size=lambda instance, size: setattr(instance, 'height', size[1]))
+        scroll.add_widget(self.stats_label)
+        container.add_widget(scroll)
+        rebuild_btn = MysticalButton("🔄 Rebuild from History", size_hint_y=0.1)
+        rebuild_btn.bind(on_press=lambda x: self.rebuild_stats())
+        container.add_widget(rebuild_btn)
+        return container
+
+    def _refresh_stats(self):
+        if self._screen_is_current("stats"):
+            return
+        stats = self.client_manager.get_card_stats(self.stats_months)
+        window = next(label for label, months in STATS_WINDOWS if months == self.stats_months)
+        if not stats["readings"]:
+            self.stats_label.text = f"[b]{window}[/b]\nNo saved readings yet."
+            return
+        orientations = stats["orientations"]
+        upright_pct = round(100 * orientations["upright"] / max(1, orientations["upright"] + orientations["reversed"]))
+        lines = [f"[b]{window}: {stats['readings']} readings[/b], {upright_pct}% upright", "", "[b]Cards that keep coming up[/b]"]
+        for rank, (card, counts) in enumerate(stats["top_cards"], start=1):
+            lines.append(f"{rank}. {card}: {counts['total']} ({counts['upright']} upright, {counts['reversed']} reversed)")
+        lines += ["", "[b]Suits[/b]", " · ".join(f"{suit} {count}" for suit, count in sorted(stats["suits"].items(), key=lambda item: -item[1]))]
+        for spread_name, by_position in stats["positions"].items():
+            labels = SPREADS.get(spread_name, {}).get("positions", [])
+            lines += ["", f"[b]{spread_name}[/b]"]
+            for position, (card, count) in by_position.items():
+                label = labels[position] if position < len(labels) else f"Position {position + 1}"
+                lines.append(f"{label}: {card} ×{count}")
+        self.stats_label.text = "\n".join(lines)
+
+    def set_stats_window(self, months):
+        self.stats_months = months
+        self.screen_versions.pop("stats", None)
+        self._refresh_stats()
+
+    def rebuild_stats(self):
+        try:
+            counted = self.client_manager.rebuild_stats(self.client_manager.current_client_id)
+            self._refresh_stats()
+            self.show_info_popup("Card Insights", f"Recounted {counted} readings")
+        except Exception as e:
+            log_error("PictureTarot", "Error rebuilding card stats", e)
+            self.show_error_popup(f"Error rebuilding card insights: {str(e)}")
+
+    def load_journal_page(self, cursor, limit):
+        entries, cursor = self.client_manager.get_journal_page(cursor, limit)
+        rows = []
+        for entry in entries:
+            date_str = datetime.fromisoformat(entry["date"]).strftime("%Y-%m-%d %H:%M")
+            rows.append(f"{date_str}\n{entry['text']}")
+        return rows, cursor
+
+    @timed_screen("journal")
     def show_journal(self):
         try:
-            self.main_layout.clear_widgets()
-            container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
-            header = BoxLayout(size_hint_y=0.1)
-            back_btn = MysticalButton("← Back", size_hint_x=0.3)
-            back_btn.bind(on_press=lambda x: self.show_main_menu())
-            title = Label(text="Client Journal", font_size='24sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=0.7)
-            header.add_widget(back_btn)
-            header.add_widget(title)
-            container.add_widget(header)
-            scroll = ScrollView()
-            journal_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
-            journal_container.bind(minimum_height=journal_container.setter('height'))
-            client = self.client_manager.get_current_client()
-            if client and client.get("journal"):
-                for entry in client["journal"]:
-                    date_str = datetime.fromisoformat(entry["date"]).strftime("%Y-%m-%d %H:%M")
-                    text = f"{date_str}\n{entry['text']}"
-                    journal_label = Label(text=text, font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, height=dp(80))
-                    journal_container.add_widget(journal_label)
-            else:
-                journal_label = Label(text="No journal entries found.", font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, height=dp(40))
-                journal_container.add_widget(journal_label)
-            scroll.add_widget(journal_container)
-            add_entry_btn = MysticalButton("➕ Add Entry", size_hint_y=0.1)
-            add_entry_btn.bind(on_press=lambda x: self.add_journal_entry())
-            container.add_widget(scroll)
-            container.add_widget(add_entry_btn)
-            self.main_layout.add_widget(container)
+            self.screen_cache.show("journal", self._build_journal, self._refresh_journal)
         except Exception as e:
             log_error("PictureTarot", "Error showing journal", e)
             self.show_error_popup(f"Error displaying journal: {str(e)}")
 
+    def _build_journal(self):
+        self.journal_container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, _ = self._build_screen_header("Client Journal", self.show_main_menu)
+        self.journal_container.add_widget(header)
+        add_entry_btn = MysticalButton("➕ Add Entry", size_hint_y=0.1)
+        add_entry_btn.bind(on_press=lambda x: self.add_journal_entry())
+        self.journal_container.add_widget(add_entry_btn)
+        self.journal_list = None
+        return self.journal_container
+
+    def _refresh_journal(self):
+        if self._screen_is_current("journal"):
+            return
+        if self.journal_list is not None:
+            self.journal_container.remove_widget(self.journal_list)
+        self.journal_list = PagedListView(self.load_journal_page, "No journal entries found.", font_size='14sp')
+        # Between the header and the add button
+        self.journal_container.add_widget(self.journal_list, index=1)
+
     def add_journal_entry(self):
         try:
             content = BoxLayout(orientation='vertical', spacing=dp(15), padding=dp(15))
@@ -858,34 +1971,333 @@ class PictureTarotApp(App):
             log_error("PictureTarot", "Error adding journal entry", e)
             self.show_error_popup(f"Error adding entry: {str(e)}")
 
+    @timed_screen("search")
+    def show_search(self):
+        try:
+            self.screen_cache.show("search", self._build_search, self._refresh_search)
+        except Exception as e:
+            log_error("PictureTarot", "Error showing search", e)
+            self.show_error_popup(f"Error displaying search: {str(e)}")
+
+    def _build_search(self):
+        self.search_container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, _ = self._build_screen_header("🔍 Search", self.show_main_menu)
+        self.search_container.add_widget(header)
+        self.search_input = TextInput(hint_text="Cards, spreads, dates, clients or journal words", multiline=False, size_hint_y=None, height=dp(45), background_color=(0.2, 0.15, 0.3, 0.8), foreground_color=(1, 1, 1, 1), font_size='16sp')
+        self.search_input.bind(text=self.on_search_text)
+        self.search_container.add_widget(self.search_input)
+        self.search_list = None
+        return self.search_container
+
+    def _refresh_search(self):
+        # Results may be stale after new readings or entries; re-run the current query
+        if not self._screen_is_current("search"):
+            self.run_search()
+
+    def on_search_text(self, instance, text):
+        # Debounced so a burst of keystrokes costs one query
+        if self.search_event is not None:
+            self.search_event.cancel()
+        self.search_event = Clock.schedule_once(lambda dt: self.run_search(), SEARCH_DEBOUNCE)
+
+    def run_search(self):
+        try:
+            self.search_event = None
+            self.search_text = self.search_input.text.strip()
+            if self.search_list is not None:
+                self.search_container.remove_widget(self.search_list)
+            if len(self.search_text) < SEARCH_MIN_CHARS:
+                self.search_list = None
+                return
+            self.search_list = PagedListView(self.load_search_page, "Nothing matches your search.", font_size='14sp', on_select=self.open_search_result, markup=True)
+            self.search_container.add_widget(self.search_list)
+        except Exception as e:
+            log_error("PictureTarot", f"Error searching for {self.search_text}", e)
+            self.show_error_popup(f"Error searching: {str(e)}")
+
+    def load_search_page(self, cursor, limit):
+        offset = cursor or 0
+        results = self.client_manager.search(self.search_text, limit, offset)
+        rows = []
+        for result in results:
+            date_str = datetime.fromisoformat(result["date"]).strftime("%Y-%m-%d %H:%M")
+            icon = "📝" if result["kind"] == "journal" else "🔮"
+            snippet = escape_markup(result["snippet"]).replace(HIGHLIGHT_START, "[b][color=ffffcc]").replace(HIGHLIGHT_END, "[/color][/b]")
+            rows.append((f"{icon} {escape_markup(result['client'])} · {date_str}\n{snippet}", (result["kind"], result["ref"])))
+        return rows, offset + len(results)
+
+    def open_search_result(self, key):
+        try:
+            kind, ref = key
+            if kind == "journal":
+                entry = self.client_manager.get_journal_entry(ref)
+                if entry is None:
+                    self.show_error_popup("This entry no longer exists.")
+                    return
+                date_str = datetime.fromisoformat(entry["date"]).strftime("%Y-%m-%d %H:%M")
+                self.show_info_popup("📝 Journal Entry", f"{date_str}\n\n{entry['text']}")
+                return
+            reading = self.client_manager.get_reading(ref)
+            if reading is None:
+                self.show_error_popup("This reading no longer exists.")
+                return
+            date_str = datetime.fromisoformat(reading.date).strftime("%Y-%m-%d %H:%M")
+            cards = "\n".join(f"{i + 1}. {card} ({orientation})" for i, (card, orientation) in enumerate(zip(reading.cards, reading.orientations)))
+            self.show_info_popup(f"🔮 {reading.spread}", f"{date_str}\n\n{cards}")
+        except Exception as e:
+            log_error("PictureTarot", f"Error opening search result {key}", e)
+            self.show_error_popup(f"Error opening result: {str(e)}")
+
+    @timed_screen("settings")
     def show_settings(self):
         try:
-            self.main_layout.clear_widgets()
-            container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
-            header = BoxLayout(size_hint_y=0.1)
-            back_btn = MysticalButton("← Back", size_hint_x=0.3)
-            back_btn.bind(on_press=lambda x: self.show_main_menu())
-            title = Label(text="⚙️ Settings", font_size='24sp', bold=True, color=(1, 1, 0.8, 1), size_hint_x=0.7)
-            header.add_widget(back_btn)
-            header.add_widget(title)
-            container.add_widget(header)
-            scroll = ScrollView()
-            settings_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
-            settings_container.bind(minimum_height=settings_container.setter('height'))
-            anim_switch = Switch(active=self.animation_enabled, size_hint=(0.2, 1))
-            anim_switch.bind(active=lambda instance, value: setattr(self, 'animation_enabled', value))
-            anim_label = Label(text="Enable Animations", font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_x=0.8)
-            settings_container.add_widget(anim_label)
-            settings_container.add_widget(anim_switch)
-            scroll.add_widget(settings_container)
-            container.add_widget(scroll)
-            save_btn = MysticalButton("💾 Save Settings", size_hint_y=0.1)
-            save_btn.bind(on_press=lambda x: self.save_settings())
-            container.add_widget(save_btn)
-            self.main_layout.add_widget(container)
+            self.screen_cache.show("settings", self._build_settings, self._refresh_settings)
         except Exception as e:
             log_error("PictureTarot", "Error showing settings", e)
             self.show_error_popup(f"Error displaying settings: {str(e)}")
 
+    def _build_settings(self):
+        container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, _ = self._build_screen_header("⚙️ Settings", self.show_main_menu)
+        container.add_widget(header)
+        scroll = ScrollView()
+        settings_container = BoxLayout(orientation='vertical', spacing=dp(10), size_hint_y=None)
+        settings_container.bind(minimum_height=settings_container.setter('height'))
+        self.anim_switch = Switch(active=self.animation_enabled, size_hint=(0.2, 1))
+        self.anim_switch.bind(active=lambda instance, value: self.set_animation_enabled(value))
+        anim_label = Label(text="Enable Animations", font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_x=0.8)
+        settings_container.add_widget(anim_label)
+        settings_container.add_widget(self.anim_switch)
+        profile_row = BoxLayout(size_hint_y=None, height=dp(60))
+        profile_label = Label(text="Capture Profile (saved to Downloads)", font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_x=0.8)
+        self.profile_switch = Switch(active=self.perf_monitor.capturing, size_hint_x=0.2)
+        self.profile_switch.bind(active=lambda instance, value: self.toggle_profile_capture(value))
+        profile_row.add_widget(profile_label)
+        profile_row.add_widget(self.profile_switch)
+        settings_container.add_widget(profile_row)
+        leak_row = BoxLayout(size_hint_y=None, height=dp(60))
+        leak_label = Label(text="Leak Detector (debug)", font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_x=0.8)
+        self.leak_switch = Switch(active=self.leak_detection, size_hint_x=0.2)
+        self.leak_switch.bind(active=lambda instance, value: self.toggle_leak_detection(value))
+        leak_row.add_widget(leak_label)
+        leak_row.add_widget(self.leak_switch)
+        settings_container.add_widget(leak_row)
+        deck_row = BoxLayout(size_hint_y=None, height=dp(60), spacing=dp(10))
+        self.deck_label = Label(font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_x=0.5, halign='left', valign='middle')
+        self.deck_label.bind(size=self.deck_label.setter('text_size'))
+        deck_btn = MysticalButton("Change", size_hint_x=0.25)
+        deck_btn.bind(on_press=lambda x: self.next_deck())
+        import_btn = MysticalButton("📥 Import", size_hint_x=0.25)
+        import_btn.bind(on_press=lambda x: self.show_deck_import())
+        deck_row.add_widget(self.deck_label)
+        deck_row.add_widget(deck_btn)
+        deck_row.add_widget(import_btn)
+        settings_container.add_widget(deck_row)
+        pack_row = BoxLayout(size_hint_y=None, height=dp(60), spacing=dp(10))
+        self.pack_label = Label(font_size='16sp', color=(0.9, 0.9, 0.9, 1), size_hint_x=0.7, halign='left', valign='middle')
+        self.pack_label.bind(size=self.pack_label.setter('text_size'))
+        pack_btn = MysticalButton("Change", size_hint_x=0.3)
+        pack_btn.bind(on_press=lambda x: self.next_meaning_pack())
+        pack_row.add_widget(self.pack_label)
+        pack_row.add_widget(pack_btn)
+        settings_container.add_widget(pack_row)
+        diagnostics_btn = MysticalButton("📊 Diagnostics")
+        diagnostics_btn.bind(on_press=lambda x: self.show_diagnostics())
+        settings_container.add_widget(diagnostics_btn)
+        scroll.add_widget(settings_container)
+        container.add_widget(scroll)
+        save_btn = MysticalButton("💾 Save Settings", size_hint_y=0.1)
+        save_btn.bind(on_press=lambda x: self.save_settings())
+        container.add_widget(save_btn)
+        return container
+
+    def _refresh_settings(self):
+        self.anim_switch.active = self.animation_enabled
+        self.profile_switch.active = self.perf_monitor.capturing
+        self.leak_switch.active = self.leak_detection
+        self.pack_label.text = f"Card Meanings: {self.meaning_pack.info['name'] if self.meaning_pack else BUILTIN_PACK['name']}"
+        self.deck_label.text = f"Card Deck: {self.get_asset_manifest().name if self.deck_path else BUILTIN_DECK_NAME}"
+
+    def next_deck(self):
+        try:
+            paths = [None] + [deck_dir for deck_dir, _ in list_decks(self.get_decks_dir())]
+            current = paths.index(self.deck_path) if self.deck_path in paths else 0
+            self.use_deck(paths[(current + 1) % len(paths)])
+            self._refresh_settings()
+        except Exception as e:
+            log_error("PictureTarot", "Error switching deck", e)
+            self.show_error_popup(f"Error switching deck: {str(e)}")
+
+    def show_deck_import(self):
+        try:
+            content = BoxLayout(orientation='vertical', spacing=dp(10), padding=dp(15))
+            title_label = Label(text="📥 Import a deck: pick a .zip or a folder of card images", font_size='16sp', color=(1, 1, 0.8, 1), size_hint_y=None, height=dp(40))
+            start_path = DOWNLOADS_PATH if os.path.isdir(DOWNLOADS_PATH) else os.path.expanduser("~")
+            chooser = FileChooserListView(path=start_path, filters=["*.zip"], dirselect=True)
+            name_input = TextInput(hint_text="Deck name (optional)", multiline=False, size_hint_y=None, height=dp(45), background_color=(0.2, 0.15, 0.3, 0.8), foreground_color=(1, 1, 1, 1), font_size='16sp')
+            progress_bar = ProgressBar(max=1, value=0, size_hint_y=None, height=dp(20))
+            status_label = Label(text="", font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, height=dp(30))
+            buttons = BoxLayout(size_hint_y=None, height=dp(60), spacing=dp(10))
+            import_btn = MysticalButton("✅ Import")
+            cancel_btn = MysticalButton("❌ Close")
+            buttons.add_widget(import_btn)
+            buttons.add_widget(cancel_btn)
+            for widget in (title_label, chooser, name_input, progress_bar, status_label, buttons):
+                content.add_widget(widget)
+            popup = Popup(title="", content=content, size_hint=(0.95, 0.9), background_color=(0.05, 0.05, 0.15, 0.95))
+            def on_progress(done, total, card):
+                progress_bar.max = total
+                progress_bar.value = done
+                status_label.text = f"{done}/{total} · {card or 'Card back'}"
+            def on_finished(deck_dir, error):
+                import_btn.disabled = False
+                if error is not None:
+                    status_label.text = "Import failed"
+                    problems = error.problems if isinstance(error, DeckImportError) else [str(error)]
+                    self.show_error_popup("\n".join(problems))
+                    return
+                popup.dismiss()
+                if self.use_deck(deck_dir):
+                    self.save_settings()
+                    self._refresh_settings()
+                    self.show_info_popup("Deck Imported", f"Now using {self.asset_manifest.name}")
+            def start_import(*args):
+                source = chooser.selection[0] if chooser.selection else chooser.path
+                import_btn.disabled = True
+                status_label.text = "Checking card names…"
+                # Threads only: forking a process that runs Kivy's GL context is unsafe, and spawned
+                # workers would re-import this module; the CLI's import-deck keeps the process pool
+                def run():
+                    try:
+                        deck_dir = import_deck(source, self.get_decks_dir(), name_input.text.strip() or None,
+                                               progress=lambda done, total, card: Clock.schedule_once(lambda dt: on_progress(done, total, card)),
+                                               processes=False)
+                        Clock.schedule_once(lambda dt: on_finished(deck_dir, None))
+                    except Exception as e:
+                        log_error("PictureTarot", f"Error importing deck from {source}", e)
+                        Clock.schedule_once(lambda dt, error=e: on_finished(None, error))
+                threading.Thread(target=run, name="DeckImport", daemon=True).start()
+            import_btn.bind(on_press=start_import)
+            cancel_btn.bind(on_press=popup.dismiss)
+            popup.open()
+        except Exception as e:
+            log_error("PictureTarot", "Error opening deck import", e)
+            self.show_error_popup(f"Error importing deck: {str(e)}")
+
+    def get_meaning_packs(self):
+        # Headers only; a pack's meanings are mapped in when it is selected
+        return [BUILTIN_PACK] + find_packs([MEANINGS_DIR, os.path.join(self.user_data_dir, "meanings")])
+
+    def use_meaning_pack(self, path):
+        try:
+            pack = MeaningPack(path) if path else None
+            set_meaning_table(pack)
+            if self.meaning_pack is not None:
+                self.meaning_pack.close()
+            self.meaning_pack = pack
+            self.meaning_pack_path = path
+            log_info("PictureTarot", f"Using card meanings from {pack.info['name'] if pack else BUILTIN_PACK['name']}")
+        except Exception as e:
+            log_error("PictureTarot", f"Error loading meaning pack {path}", e)
+            set_meaning_table(self.meaning_pack)
+
+    def next_meaning_pack(self):
+        try:
+            paths = [pack["path"] for pack in self.get_meaning_packs()]
+            current = paths.index(self.meaning_pack_path) if self.meaning_pack_path in paths else 0
+            self.use_meaning_pack(paths[(current + 1) % len(paths)])
+            self._refresh_settings()
+        except Exception as e:
+            log_error("PictureTarot", "Error switching meaning pack", e)
+            self.show_error_popup(f"Error switching card meanings: {str(e)}")
+
+    def toggle_profile_capture(self, enabled):
+        try:
+            if enabled:
+                self.perf_monitor.start_capture()
+            else:
+                paths = self.perf_monitor.stop_capture()
+                if paths:
+                    self.show_info_popup("Profile Saved", "\n".join(os.path.basename(path) for path in paths))
+        except Exception as e:
+            log_error("PictureTarot", "Error toggling profile capture", e)
+            self.show_error_popup(f"Error capturing profile: {str(e)}")
+
+    def set_animation_enabled(self, enabled):
+        self.animation_enabled = enabled
+        self.ambient.set_enabled(enabled)
+
+    def toggle_leak_detection(self, enabled):
+        self.leak_detection = enabled
+        self.leak_detector.enabled = enabled
+        if not enabled:
+            self.leak_detector.reset()
+        log_info("PictureTarot", f"Leak detection {'enabled' if enabled else 'disabled'}")
+
+    def get_diagnostics_report(self):
+        report = self.perf_monitor.report()
+        report["generated"] = datetime.now().isoformat()
+        report["textures"] = self.texture_cache.summary()
+        report["prefetch"] = self.texture_prefetcher.summary()
+        report["writes"] = self.write_scheduler.summary()
+        report["leaks"] = self.leak_detector.report()
+        report["ambient"] = self.ambient.summary()
+        return report
+
+    def export_diagnostics(self):
+        try:
+            os.makedirs(DOWNLOADS_PATH, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            export_path = os.path.join(DOWNLOADS_PATH, f"tarot_diagnostics_{stamp}.json")
+            with open(export_path, 'w', encoding='utf-8') as f:
+                json.dump(self.get_diagnostics_report(), f, indent=2)
+            log_info("PictureTarot", f"Diagnostics exported to {export_path}")
+            self.show_info_popup("Diagnostics Exported", os.path.basename(export_path))
+        except Exception as e:
+            log_error("PictureTarot", "Error exporting diagnostics", e)
+            self.show_error_popup(f"Error exporting diagnostics: {str(e)}")
+
+    @timed_screen("diagnostics")
+    def show_diagnostics(self):
+        try:
+            self.screen_cache.show("diagnostics", self._build_diagnostics, self._refresh_diagnostics)
+        except Exception as e:
+            log_error("PictureTarot", "Error showing diagnostics", e)
+            self.show_error_popup(f"Error displaying diagnostics: {str(e)}")
+
+    def _build_diagnostics(self):
+        container = BoxLayout(orientation='vertical', padding=dp(20), spacing=dp(10))
+        header, _ = self._build_screen_header("📊 Diagnostics", self.show_settings)
+        container.add_widget(header)
+        scroll = ScrollView()
+        self.diagnostics_label = Label(markup=True, font_size='14sp', color=(0.9, 0.9, 0.9, 1), size_hint_y=None, halign='left', valign='top')
+        self.diagnostics_label.bind(width=lambda instance, width: setattr(instance, 'text_size', (width, None)))
+        self.diagnostics_label.bind(texture_size=lambda instance, size: setattr(instance, 'height', size[1]))
+        scroll.add_widget(self.diagnostics_label)
+        container.add_widget(scroll)
+        export_btn = MysticalButton("💾 Export JSON", size_hint_y=0.1)
+        export_btn.bind(on_press=lambda x: self.export_diagnostics())
+        container.add_widget(export_btn)
+        return container
+
+    def _refresh_diagnostics(self):
+        report = self.get_diagnostics_report()
+        lines = ["[b]Frame time (ms)[/b]", self._format_percentiles(report["frames"]), "", "[b]Card reveal (ms)[/b]", self._format_percentiles(report["reveal"]), "", "[b]Screen builds (ms)[/b]"]
+        for screen_name, stats in sorted(report["screens"].items()):
+            lines.append(f"{screen_name}: {self._format_percentiles(stats)}, {stats['widgets']} widgets")
+        lines += ["", "[b]Textures[/b]", ", ".join(f"{key} {value}" for key, value in report["textures"].items())]
+        lines += ["", "[b]Ambient animation[/b]", ", ".join(f"{key} {value}" for key, value in report["ambient"].items())]
+        lines += ["", "[b]Pending writes[/b]", ", ".join(f"{key} {value}" for key, value in report["writes"].items())]
+        leaks = report["leaks"]
+        if leaks["enabled"]:
+            lines += ["", "[b]Leak detector[/b]"]
+            lines += [f"{name}: {counts['widgets']} widgets, {counts['instructions']} instructions" for name, counts in sorted(leaks["screens"].items())]
+            lines += [f"[color=ff6666]Growing: {entry}[/color]" for entry in leaks["flagged"]] or ["No growth detected"]
+        self.diagnostics_label.text = "\n".join(lines)
+
+    @staticmethod
+    def _format_percentiles(stats):
+        return f"p50 {stats['p50']} / p95 {stats['p95']} / p99 {stats['p99']} (n={stats['count']})"
+
 if __name__ == "__main__":
     PictureTarotApp().run()
\ No newline at end of file
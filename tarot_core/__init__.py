@@ -0,0 +1,18 @@
+"""Reading engine shared by the app and the command line, with no GUI imports."""
+
+from tarot_core.deck import (
+    suits, ranks, major_arcana, tarot_cards, CARD_IDS, CARD_MEANINGS, MEANING_TABLE, SPREADS,
+    card_code, compile_meanings, set_meaning_table, get_card_meaning,
+)
+from tarot_core.client_index import ClientIndex
+from tarot_core.codec import CODEC_VERSION, SPREAD_IDS, PackedReading, encode_reading, decode_header, decode_reading
+from tarot_core.draw import ORIENTATIONS, DECK_SIZE, new_seed, derive_seed, draw_cards, draw_spread, draw_batch, position_counts, describe_reading
+from tarot_core.layouts import CARD_ASPECT, Slot, HitIndex, spread_layout, card_corners, layout_bounds
+from tarot_core.meanings import PACK_EXTENSION, BUILTIN_PACK, MeaningPack, write_pack, read_pack_info, find_packs
+from tarot_core.search import HIGHLIGHT_START, HIGHLIGHT_END, match_query, search_documents
+from tarot_core.session import ReadingSession
+from tarot_core.stats import reading_stat_counts, rebuild_card_stats, summarize_card_stats
+from tarot_core.store import (
+    WRITE_BEHIND_DELAY, DEFAULT_CLIENT_NAME, SCHEMA_MIGRATIONS,
+    atomic_write_json, reading_periods, read_client_names, WriteBehindScheduler, ClientManager,
+)
@@ -0,0 +1,5 @@
+import sys
+
+from tarot_core.cli import main
+
+sys.exit(main())
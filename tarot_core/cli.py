@@ -0,0 +1,298 @@
+"""Command line entry point: python -m tarot_core <command> ..."""
+
+import argparse
+import csv
+import json
+import logging
+import math
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+from tarot_core.deck import SPREADS, tarot_cards, set_meaning_table
+from tarot_core.decks import DeckImportError, import_deck
+from tarot_core.draw import DECK_SIZE, np, new_seed, derive_seed, draw_spread, describe_reading, position_counts
+from tarot_core.meanings import PACK_EXTENSION, MeaningPack, write_pack
+from tarot_core.store import ClientManager, WriteBehindScheduler, read_client_names
+
+log = logging.getLogger("TarotCLI")
+
+DEFAULT_CHUNK_SIZE = 500  # readings per worker task
+SIMULATION_CHUNK = 65536  # spreads per simulation task; bounds NumPy scratch memory to ~40 MB
+CSV_FIELDS = ["reading", "client", "spread", "seed", "date", "position", "label", "card", "orientation", "meaning"]
+
+@lru_cache(maxsize=None)
+def open_meaning_pack(path):
+    # Once per worker process; the pack stays mapped for the worker's lifetime
+    return MeaningPack(path)
+
+def draw_chunk(job):
+    # Each reading's seed depends only on the base seed, client and reading number,
+    # so output is identical whatever the worker count or chunk size
+    base_seed, client, spread_name, start, count, meanings_path = job
+    set_meaning_table(open_meaning_pack(meanings_path) if meanings_path else None)
+    stamp = datetime.now().isoformat()
+    readings = []
+    for number in range(start, start + count):
+        reading = draw_spread(spread_name, derive_seed(base_seed, client, number))
+        readings.append({"client": client, "spread": spread_name, "seed": reading["seed"], "date": stamp, "cards": describe_reading(reading)})
+    return readings
+
+def plan_jobs(base_seed, clients, spread_name, count, chunk_size, meanings_path=None):
+    for client in clients:
+        for start in range(0, count, chunk_size):
+            yield base_seed, client, spread_name, start, min(chunk_size, count - start), meanings_path
+
+def run_jobs(func, jobs, workers):
+    # Results come back in submission order, so output is streamed as soon as each is ready
+    if workers <= 1:
+        yield from map(func, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(func, jobs)
+
+def iter_readings(jobs, workers):
+    for readings in run_jobs(draw_chunk, jobs, workers):
+        yield from readings
+
+class JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, number, reading):
+        self.stream.write(json.dumps(dict(reading, reading=number), ensure_ascii=False) + "\n")
+
+class CsvWriter:
+    """One row per card so spreadsheets and mail-merge tools can group by reading."""
+
+    def __init__(self, stream):
+        self.writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, number, reading):
+        for card in reading["cards"]:
+            self.writer.writerow(dict(card, reading=number, client=reading["client"], spread=reading["spread"], seed=reading["seed"], date=reading["date"]))
+
+WRITERS = {"jsonl": JsonlWriter, "csv": CsvWriter}
+
+def load_clients(args):
+    clients = list(args.client or [])
+    if args.clients_file:
+        with open(args.clients_file, encoding='utf-8') as f:
+            clients += [line.strip() for line in f if line.strip()]
+    if args.db:
+        clients += read_client_names(args.db)
+    return clients or [""]
+
+def cmd_readings(args):
+    if args.db and not os.path.isfile(args.db):
+        log.error(f"No client database at {args.db}")
+        return 2
+    try:
+        clients = load_clients(args)
+    except sqlite3.Error as e:
+        log.error(f"Cannot read client names from {args.db}: {e}")
+        return 2
+    base_seed = args.seed if args.seed is not None else new_seed()
+    log.info(f"Base seed {base_seed}")
+    meanings_path = os.path.abspath(args.meanings) if args.meanings else None
+    if meanings_path:
+        log.info(f"Meanings from {open_meaning_pack(meanings_path).info['name']}")
+    jobs = list(plan_jobs(base_seed, clients, args.spread, args.count, args.chunk_size, meanings_path))
+    stream = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        writer = WRITERS[args.format](stream)
+        total = 0
+        for total, reading in enumerate(iter_readings(jobs, args.workers), start=1):
+            writer.write(total, reading)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    log.info(f"Wrote {total} {args.spread} readings for {len(clients)} clients")
+    return 0
+
+def simulate_chunk(job):
+    base_seed, index, count, num_cards, use_numpy = job
+    return position_counts(count, num_cards, derive_seed(base_seed, index), use_numpy)
+
+def chi_square_z(observed, expected):
+    # Wilson-Hilferty normal approximation; |z| above ~3 means the position looks biased
+    df = len(observed) - 1
+    chi2 = sum((count - expected) ** 2 for count in observed) / expected
+    return chi2, ((chi2 / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+
+def cmd_simulate(args):
+    if args.engine == "numpy" and np is None:
+        log.error("NumPy is not installed; use --engine python")
+        return 2
+    use_numpy = args.engine == "numpy" or (args.engine == "auto" and np is not None)
+    spread = SPREADS[args.spread]
+    num_cards = spread["cards"]
+    base_seed = args.seed if args.seed is not None else new_seed()
+    jobs = [(base_seed, index, min(SIMULATION_CHUNK, args.count - start), num_cards, use_numpy)
+            for index, start in enumerate(range(0, args.count, SIMULATION_CHUNK))]
+    card_counts = [0] * (num_cards * DECK_SIZE)
+    reversed_counts = [0] * num_cards
+    start = time.perf_counter()
+    for chunk_cards, chunk_reversed in run_jobs(simulate_chunk, jobs, args.workers):
+        card_counts = [total + count for total, count in zip(card_counts, chunk_cards)]
+        reversed_counts = [total + count for total, count in zip(reversed_counts, chunk_reversed)]
+    elapsed = time.perf_counter() - start
+    expected = args.count / DECK_SIZE
+    positions = []
+    for position in range(num_cards):
+        observed = card_counts[position * DECK_SIZE:(position + 1) * DECK_SIZE]
+        chi2, z = chi_square_z(observed, expected)
+        positions.append({
+            "position": position + 1,
+            "label": spread["positions"][position],
+            "chi2": round(chi2, 2),
+            "z": round(z, 2),
+            "min_card": tarot_cards[observed.index(min(observed))],
+            "max_card": tarot_cards[observed.index(max(observed))],
+            "reversed_ratio": round(reversed_counts[position] / args.count, 4),
+            "counts": observed,
+        })
+    result = {"spread": args.spread, "spreads": args.count, "seed": base_seed, "engine": "numpy" if use_numpy else "python",
+              "seconds": round(elapsed, 3), "spreads_per_second": round(args.count / elapsed) if elapsed else None, "positions": positions}
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(f"{args.count} x {args.spread} ({result['engine']}, seed {base_seed}) in {elapsed:.2f}s, {result['spreads_per_second']} spreads/s")
+    for entry in positions:
+        flag = "  <-- check" if abs(entry["z"]) > 3 else ""
+        print(f"{entry['position']:>2}. {entry['label']:<28} chi2 {entry['chi2']:>8.1f}  z {entry['z']:>6.2f}  reversed {entry['reversed_ratio']:.3f}{flag}")
+    return 0
+
+def cmd_rebuild_stats(args):
+    # Opening a missing path would create an empty store with a default client
+    if not os.path.isfile(args.db):
+        log.error(f"No client database at {args.db}")
+        return 2
+    try:
+        manager = ClientManager(args.db, WriteBehindScheduler())
+    except sqlite3.Error as e:
+        log.error(f"Cannot open client database {args.db}: {e}")
+        return 2
+    try:
+        client_id = None
+        if args.client:
+            client_id = manager.find_client(args.client)
+            if client_id is None:
+                log.error(f"No client named {args.client}")
+                return 2
+        counted = manager.rebuild_stats(client_id)
+        print(f"Rebuilt card statistics from {counted} readings")
+        return 0
+    finally:
+        manager.close()
+
+def cmd_build_pack(args):
+    # Source JSON: {"name", "author", "language", "description", "meanings": {card: {"upright", "reversed"}}}
+    with open(args.source, encoding='utf-8') as f:
+        source = json.load(f)
+    meanings = source.get("meanings", {})
+    unknown = sorted(set(meanings) - set(tarot_cards))
+    if unknown:
+        log.error(f"Unknown card names: {', '.join(unknown)}")
+        return 2
+    output = args.output or os.path.splitext(args.source)[0] + PACK_EXTENSION
+    write_pack(output, meanings, source.get("name") or os.path.basename(os.path.splitext(args.source)[0]),
+               source.get("author", ""), source.get("language", ""), source.get("description", ""))
+    covered = sum(bool(meanings.get(card, {}).get(key)) for card in tarot_cards for key in ("upright", "reversed"))
+    print(f"Wrote {output}: {covered} of {2 * len(tarot_cards)} meanings, the rest fall back to the built-in pack")
+    return 0
+
+def cmd_import_deck(args):
+    def progress(done, total, card):
+        if args.verbose:
+            print(f"\r{done}/{total} {card or 'card back'}".ljust(40), end="", file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    try:
+        deck_dir = import_deck(args.source, args.decks_dir, args.name, progress=progress, workers=args.workers)
+    except DeckImportError as e:
+        for problem in e.problems:
+            log.error(problem)
+        return 2
+    if args.verbose:
+        print(file=sys.stderr)
+    print(f"Imported {deck_dir} in {time.perf_counter() - start:.1f}s")
+    return 0
+
+def cmd_spreads(args):
+    for name, spread in SPREADS.items():
+        print(f"{name} ({spread['cards']} cards): {spread['description']}")
+    return 0
+
+def positive_int(text):
+    # argparse type: counts and sizes of zero or less become a usage error, not a traceback
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m tarot_core", description="Picture Tarot batch tools")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    readings = commands.add_parser("readings", help="draw readings in bulk and stream them as JSONL or CSV")
+    readings.add_argument("--spread", default="Past-Present-Future", choices=list(SPREADS), help="spread to draw")
+    readings.add_argument("-n", "--count", type=positive_int, default=1, help="readings per client")
+    readings.add_argument("--client", action="append", help="client name; repeat for several")
+    readings.add_argument("--clients-file", help="text file with one client name per line")
+    readings.add_argument("--db", help="clients.db to take every client name from")
+    readings.add_argument("--format", choices=list(WRITERS), default="jsonl")
+    readings.add_argument("-o", "--output", help="output file (default stdout)")
+    readings.add_argument("-j", "--workers", type=positive_int, default=os.cpu_count() or 1, help="worker processes")
+    readings.add_argument("--chunk-size", type=positive_int, default=DEFAULT_CHUNK_SIZE, help="readings per worker task")
+    readings.add_argument("--seed", type=int, help="base seed; the same seed and clients reproduce the same output")
+    readings.add_argument("--meanings", help=f"interpretation pack ({PACK_EXTENSION}) to take card meanings from")
+    readings.set_defaults(func=cmd_readings)
+
+    simulate = commands.add_parser("simulate", help="draw many spreads and test each position for card and orientation bias")
+    simulate.add_argument("--spread", default="Celtic Cross", choices=list(SPREADS))
+    simulate.add_argument("-n", "--count", type=positive_int, default=1000000, help="spreads to draw")
+    simulate.add_argument("--seed", type=int, help="base seed for a reproducible run")
+    simulate.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto")
+    simulate.add_argument("-j", "--workers", type=positive_int, default=os.cpu_count() or 1, help="worker processes")
+    simulate.add_argument("--json", action="store_true", help="print full per-position counts as JSON")
+    simulate.set_defaults(func=cmd_simulate)
+
+    rebuild = commands.add_parser("rebuild-stats", help="recompute per-client card statistics from stored readings")
+    rebuild.add_argument("--db", required=True, help="clients.db to rebuild")
+    rebuild.add_argument("--client", help="only this client (default: everyone)")
+    rebuild.set_defaults(func=cmd_rebuild_stats)
+
+    build_pack = commands.add_parser("build-pack", help=f"compile a JSON file of card meanings into an interpretation pack ({PACK_EXTENSION})")
+    build_pack.add_argument("source", help="JSON with name, author, language, description and meanings per card")
+    build_pack.add_argument("-o", "--output", help=f"pack file to write (default: source name with {PACK_EXTENSION})")
+    build_pack.set_defaults(func=cmd_build_pack)
+
+    deck = commands.add_parser("import-deck", help="import a zip or folder of card art as a deck with resized variants")
+    deck.add_argument("source", help="zip file or folder with one image per card (plus an optional card back)")
+    deck.add_argument("--decks-dir", required=True, help="directory holding imported decks (the app's user data decks/)")
+    deck.add_argument("--name", help="deck name (default: the source file or folder name)")
+    deck.add_argument("-j", "--workers", type=positive_int, default=os.cpu_count() or 1, help="worker processes")
+    deck.set_defaults(func=cmd_import_deck)
+
+    spreads = commands.add_parser("spreads", help="list the available spreads")
+    spreads.set_defaults(func=cmd_spreads)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(name)s: %(message)s")
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # Output piped into head or similar; the reader has what it wanted
+        sys.stderr.close()
+        return 1
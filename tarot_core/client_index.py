@@ -0,0 +1,101 @@
+"""In-memory index over client names and descriptions for search-as-you-type and duplicate checks."""
+
+import heapq
+import re
+from collections import defaultdict
+
+PREFIX_MAX = 8  # word prefixes longer than this are looked up by their first PREFIX_MAX characters
+WORD = re.compile(r"\w+", re.UNICODE)
+
+def name_key(name):
+    # Same folding add_client has always used for "already exists"
+    return name.strip().lower()
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def word_prefixes(text):
+    return {word[:length] for word in WORD.findall(text) for length in range(1, min(len(word), PREFIX_MAX) + 1)}
+
+class ClientIndex:
+    """Exact-name map, word-prefix postings and trigram postings over every client.
+
+    find_name is one dict lookup. search ANDs the query's words; each word matches the
+    start of a word (prefix postings) or, from three letters on, anywhere (trigrams).
+    """
+
+    def __init__(self):
+        self.by_name = {}
+        self.texts = {}  # client id -> (folded name, folded description)
+        self.prefixes = defaultdict(set)
+        self.name_prefixes = defaultdict(set)  # name words only, for ranking
+        self.grams = defaultdict(set)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def _keys(self, name, description):
+        name_prefixes = word_prefixes(name)
+        return name_prefixes | word_prefixes(description), name_prefixes, trigrams(name) | trigrams(description)
+
+    def add(self, client_id, name, description=""):
+        folded = (name_key(name), (description or "").lower())
+        self.by_name[folded[0]] = client_id
+        self.texts[client_id] = folded
+        for postings, keys in zip((self.prefixes, self.name_prefixes, self.grams), self._keys(*folded)):
+            for key in keys:
+                postings[key].add(client_id)
+
+    def remove(self, client_id):
+        folded = self.texts.pop(client_id, None)
+        if folded is None:
+            return
+        if self.by_name.get(folded[0]) == client_id:
+            del self.by_name[folded[0]]
+        for postings, keys in zip((self.prefixes, self.name_prefixes, self.grams), self._keys(*folded)):
+            for key in keys:
+                ids = postings[key]
+                ids.discard(client_id)
+                if not ids:
+                    del postings[key]
+
+    def update(self, client_id, name, description=""):
+        self.remove(client_id)
+        self.add(client_id, name, description)
+
+    def find_name(self, name):
+        return self.by_name.get(name_key(name))
+
+    def _word_matches(self, word):
+        hits = set(self.prefixes.get(word[:PREFIX_MAX], ()))
+        if len(word) > PREFIX_MAX:
+            hits = {client_id for client_id in hits if any(token.startswith(word) for text in self.texts[client_id] for token in WORD.findall(text))}
+        if len(word) >= 3:
+            grams = sorted((self.grams.get(gram, set()) for gram in trigrams(word)), key=len)
+            infix = grams[0].intersection(*grams[1:]) - hits
+            if len(word) > 3:
+                # Trigrams can match out of order; confirm the substring
+                infix = {client_id for client_id in infix if any(word in text for text in self.texts[client_id])}
+            hits |= infix
+        return hits
+
+    def search(self, query, limit=50):
+        """Client ids matching every word of query, best first: name starts with the query,
+        then a name word starts with it, then description or mid-word matches; ties by name."""
+        words = WORD.findall(query.lower())
+        if not words:
+            return []
+        matches = None
+        for word in sorted(words, key=len, reverse=True):
+            hits = self._word_matches(word)
+            matches = hits if matches is None else matches & hits
+            if not matches:
+                return []
+        folded_query = " ".join(words)
+        name_hits = [self.name_prefixes.get(word[:PREFIX_MAX], ()) for word in words]
+        def rank(client_id):
+            name = self.texts[client_id][0]
+            if name.startswith(folded_query):
+                return 0, name
+            return (1 if all(client_id in hits for hits in name_hits) else 2), name
+        return heapq.nsmallest(limit, matches, key=rank)
@@ -0,0 +1,103 @@
+"""Versioned binary encoding of readings: a short header plus one byte per card."""
+
+import struct
+from datetime import datetime, timezone
+
+from tarot_core.deck import CARD_IDS, SPREADS, tarot_cards
+
+CODEC_VERSION = 1
+HEADER = struct.Struct(">BBI")  # version, spread id, wall-clock seconds since 1970
+
+# Stored ids: append new spreads only, never renumber (card ids live in tarot_core.deck)
+SPREAD_IDS = {
+    "Daily Guidance": 1,
+    "Past-Present-Future": 2,
+    "Love & Relationships": 3,
+    "Career Path": 4,
+    "Celtic Cross": 5,
+    "Chakra Balance": 6,
+    "Essential Oil Guidance": 7,
+}
+SPREAD_NAMES = {spread_id: name for name, spread_id in SPREAD_IDS.items()}
+UNKNOWN_SPREAD = "Unknown spread"
+
+# A spread without an id would be stored as UNKNOWN_SPREAD and its name lost for good
+if set(SPREADS) - set(SPREAD_IDS):
+    raise ImportError(f"Spreads without a stored id in SPREAD_IDS: {sorted(set(SPREADS) - set(SPREAD_IDS))}")
+
+def to_timestamp(iso_date):
+    # Dates are naive local wall-clock times; pinning them to UTC keeps the round trip exact
+    return int(datetime.fromisoformat(iso_date).replace(tzinfo=timezone.utc).timestamp())
+
+def from_timestamp(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None).isoformat()
+
+def encode_reading(spread_name, cards, orientations, timestamp):
+    if spread_name not in SPREAD_IDS:
+        raise ValueError(f"Spread {spread_name!r} has no stored id in SPREAD_IDS")
+    body = bytes(CARD_IDS[card] << 1 | (orientation == "Reversed") for card, orientation in zip(cards, orientations))
+    return HEADER.pack(CODEC_VERSION, SPREAD_IDS[spread_name], timestamp) + body
+
+def decode_header(packed):
+    # Spread, timestamp and card count without touching the card bytes
+    version, spread_id, timestamp = HEADER.unpack_from(packed)
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported reading encoding version {version}")
+    return SPREAD_NAMES.get(spread_id, UNKNOWN_SPREAD), timestamp, len(packed) - HEADER.size
+
+def decode_cards(packed):
+    body = packed[HEADER.size:]
+    return [tarot_cards[code >> 1] for code in body], ["Reversed" if code & 1 else "Upright" for code in body]
+
+def decode_reading(packed):
+    spread_name, timestamp, _ = decode_header(packed)
+    cards, orientations = decode_cards(packed)
+    return {"spread": spread_name, "date": from_timestamp(timestamp), "cards": cards, "orientations": orientations}
+
+class PackedReading:
+    """A stored reading that decodes its header and cards only when first read."""
+
+    __slots__ = ("id", "seed", "packed", "_header", "_cards")
+
+    def __init__(self, reading_id, packed, seed=None):
+        self.id = reading_id
+        self.seed = seed
+        self.packed = bytes(packed)
+        self._header = None
+        self._cards = None
+
+    def _decoded_header(self):
+        if self._header is None:
+            self._header = decode_header(self.packed)
+        return self._header
+
+    def _decoded_cards(self):
+        if self._cards is None:
+            self._cards = decode_cards(self.packed)
+        return self._cards
+
+    @property
+    def spread(self):
+        return self._decoded_header()[0]
+
+    @property
+    def date(self):
+        return from_timestamp(self._decoded_header()[1])
+
+    @property
+    def card_count(self):
+        return self._decoded_header()[2]
+
+    @property
+    def cards(self):
+        return self._decoded_cards()[0]
+
+    @property
+    def orientations(self):
+        return self._decoded_cards()[1]
+
+    def __getitem__(self, key):
+        # Dict-style access so callers written against plain reading dicts keep working
+        if key not in ("id", "seed", "spread", "date", "card_count", "cards", "orientations"):
+            raise KeyError(key)
+        return getattr(self, key)
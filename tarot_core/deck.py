@@ -0,0 +1,144 @@
+"""Deck, card meanings and spread definitions."""
+
+import logging
+
+log = logging.getLogger("PictureTarot")
+
+# Card definitions
+suits = ["Wands", "Cups", "Swords", "Pentacles"]
+ranks = ["Ace", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten", "Page", "Knight", "Queen", "King"]
+major_arcana = [
+    "The Fool", "The Magician", "The High Priestess", "The Empress", "The Emperor", "The Hierophant", "The Lovers",
+    "The Chariot", "Strength", "The Hermit", "Wheel of Fortune", "Justice", "The Hanged Man", "Death",
+    "Temperance", "The Devil", "The Tower", "The Star", "The Moon", "The Sun", "Judgement", "The World"
+]
+tarot_cards = [f"{rank} of {suit}" for suit in suits for rank in ranks] + major_arcana
+# Stored ids: append new cards only, never renumber
+CARD_IDS = {name: index for index, name in enumerate(tarot_cards)}
+
+# Upright and reversed meanings for all 78 cards
+CARD_MEANINGS = {
+    # Major arcana
+    "The Fool": {"upright": "New beginnings, innocence, spontaneity, free spirit", "reversed": "Recklessness, taken advantage of, inconsideration"},
+    "The Magician": {"upright": "Manifestation, resourcefulness, power, inspired action", "reversed": "Manipulation, poor planning, untapped talents"},
+    "The High Priestess": {"upright": "Intuition, sacred knowledge, divine feminine, subconscious", "reversed": "Secrets, disconnected intuition, withdrawal"},
+    "The Empress": {"upright": "Femininity, beauty, nature, nurturing, abundance", "reversed": "Creative block, dependency on others"},
+    "The Emperor": {"upright": "Authority, establishment, structure, father figure", "reversed": "Domination, excessive control, rigidity"},
+    "The Hierophant": {"upright": "Spiritual wisdom, religious beliefs, conformity, tradition", "reversed": "Personal beliefs, freedom, challenging status quo"},
+    "The Lovers": {"upright": "Love, harmony, relationships, values alignment", "reversed": "Self-love, disharmony, imbalance, misalignment"},
+    "The Chariot": {"upright": "Control, willpower, success, determination", "reversed": "Self-discipline, opposition, lack of direction"},
+    "Strength": {"upright": "Strength, courage, persuasion, influence, compassion", "reversed": "Self-doubt, low energy, raw emotion"},
+    "The Hermit": {"upright": "Soul searching, introspection, inner guidance", "reversed": "Isolation, loneliness, withdrawal"},
+    "Wheel of Fortune": {"upright": "Good luck, karma, life cycles, destiny", "reversed": "Bad luck, lack of control, clinging to control"},
+    "Justice": {"upright": "Justice, fairness, truth, cause and effect", "reversed": "Unfairness, lack of accountability, dishonesty"},
+    "The Hanged Man": {"upright": "Surrender, letting go, sacrifice, patience", "reversed": "Delays, resistance, stalling, indecision"},
+    "Death": {"upright": "Endings, change, transformation, transition", "reversed": "Resistance to change, personal transformation"},
+    "Temperance": {"upright": "Balance, moderation, patience, purpose", "reversed": "Imbalance, excess, self-healing, re-alignment"},
+    "The Devil": {"upright": "Shadow self, attachment, addiction, restriction", "reversed": "Releasing limiting beliefs, exploring dark thoughts"},
+    "The Tower": {"upright": "Sudden change, upheaval, chaos, revelation", "reversed": "Personal transformation, fear of change, averting disaster"},
+    "The Star": {"upright": "Hope, faith, purpose, renewal, spirituality", "reversed": "Lack of faith, despair, self-trust, disconnection"},
+    "The Moon": {"upright": "Illusion, fear, anxiety, subconscious, intuition", "reversed": "Release of fear, repressed emotion, inner confusion"},
+    "The Sun": {"upright": "Positivity, fun, warmth, success, vitality", "reversed": "Inner child, feeling down, overly optimistic"},
+    "Judgement": {"upright": "Judgement, rebirth, inner calling, absolution", "reversed": "Self-doubt, inner critic, ignoring the call"},
+    "The World": {"upright": "Completion, integration, accomplishment, travel", "reversed": "Seeking personal closure, short-cut to success"},
+    # Wands
+    "Ace of Wands": {"upright": "Inspiration, new opportunities, growth", "reversed": "Lack of energy, delayed timing, lack of direction"},
+    "Two of Wands": {"upright": "Future planning, progress, decisions, discovery", "reversed": "Fear of the unknown, lack of planning, playing it safe"},
+    "Three of Wands": {"upright": "Expansion, foresight, momentum, overseas opportunities", "reversed": "Obstacles, delays, frustration, limited vision"},
+    "Four of Wands": {"upright": "Celebration, harmony, homecoming, community", "reversed": "Personal celebration, transition, lack of support"},
+    "Five of Wands": {"upright": "Competition, conflict, tension, diversity of ideas", "reversed": "Avoiding conflict, inner conflict, finding common ground"},
+    "Six of Wands": {"upright": "Public recognition, victory, progress, self-confidence", "reversed": "Private achievement, fall from grace, egotism"},
+    "Seven of Wands": {"upright": "Challenge, perseverance, protecting what you have built", "reversed": "Exhaustion, giving up, feeling overwhelmed"},
+    "Eight of Wands": {"upright": "Speed, swift action, movement, news arriving", "reversed": "Delays, frustration, resisting change, waiting"},
+    "Nine of Wands": {"upright": "Resilience, courage, persistence, last stand", "reversed": "Paranoia, defensiveness, fatigue, stubbornness"},
+    "Ten of Wands": {"upright": "Burden, responsibility, hard work, stress", "reversed": "Letting go, delegating, release of burdens"},
+    "Page of Wands": {"upright": "Enthusiasm, exploration, discovery, free spirit", "reversed": "Hasty ideas, lack of direction, procrastination"},
+    "Knight of Wands": {"upright": "Energy, passion, adventure, impulsive action", "reversed": "Haste, scattered energy, frustration, delays"},
+    "Queen of Wands": {"upright": "Courage, confidence, warmth, determination", "reversed": "Self-respect, introversion, jealousy, insecurity"},
+    "King of Wands": {"upright": "Natural born leader, vision, entrepreneur", "reversed": "Impulsiveness, haste, ruthless"},
+    # Cups
+    "Ace of Cups": {"upright": "Love, new feelings, compassion, creativity", "reversed": "Self-love, blocked emotions, emptiness"},
+    "Two of Cups": {"upright": "Unified love, partnership, mutual attraction", "reversed": "Imbalance, broken communication, tension"},
+    "Three of Cups": {"upright": "Friendship, celebration, community, creativity", "reversed": "Overindulgence, gossip, isolation"},
+    "Four of Cups": {"upright": "Contemplation, apathy, reevaluation, missed offers", "reversed": "Sudden awareness, choosing happiness, acceptance"},
+    "Five of Cups": {"upright": "Regret, loss, grief, disappointment", "reversed": "Acceptance, moving on, forgiveness"},
+    "Six of Cups": {"upright": "Nostalgia, childhood memories, innocence, joy", "reversed": "Living in the past, unrealistic memories, moving forward"},
+    "Seven of Cups": {"upright": "Choices, illusion, wishful thinking, imagination", "reversed": "Clarity, alignment with values, sobering reality"},
+    "Eight of Cups": {"upright": "Walking away, disillusionment, seeking deeper meaning", "reversed": "Fear of change, aimless drifting, staying too long"},
+    "Nine of Cups": {"upright": "Contentment, satisfaction, gratitude, wish come true", "reversed": "Inner happiness, materialism, dissatisfaction"},
+    "Ten of Cups": {"upright": "Divine love, blissful relationships, harmony, family", "reversed": "Disconnection, misaligned values, struggling home life"},
+    "Page of Cups": {"upright": "Creative opportunities, intuitive messages, curiosity", "reversed": "Emotional immaturity, creative block, insecurity"},
+    "Knight of Cups": {"upright": "Romance, charm, imagination, following the heart", "reversed": "Moodiness, unrealistic expectations, jealousy"},
+    "Queen of Cups": {"upright": "Compassion, calm, emotional security, intuition", "reversed": "Inner feelings, self-care, co-dependency"},
+    "King of Cups": {"upright": "Emotional balance, diplomacy, generosity", "reversed": "Self-compassion, moodiness, emotional manipulation"},
+    # Swords
+    "Ace of Swords": {"upright": "Breakthrough, clarity, sharp mind, truth", "reversed": "Confusion, clouded judgement, miscommunication"},
+    "Two of Swords": {"upright": "Difficult decisions, weighing options, stalemate", "reversed": "Indecision, information overload, confusion"},
+    "Three of Swords": {"upright": "Heartbreak, emotional pain, sorrow, grief", "reversed": "Recovery, forgiveness, releasing pain"},
+    "Four of Swords": {"upright": "Rest, relaxation, meditation, recuperation", "reversed": "Exhaustion, burn-out, restlessness"},
+    "Five of Swords": {"upright": "Conflict, disagreements, winning at all costs", "reversed": "Reconciliation, making amends, past resentment"},
+    "Six of Swords": {"upright": "Transition, change, rite of passage, moving on", "reversed": "Resistance to change, unfinished business"},
+    "Seven of Swords": {"upright": "Deception, strategy, getting away with something", "reversed": "Coming clean, rethinking approach, conscience"},
+    "Eight of Swords": {"upright": "Restriction, imprisonment, victim mentality", "reversed": "Self-acceptance, new perspective, freedom"},
+    "Nine of Swords": {"upright": "Anxiety, worry, fear, sleepless nights", "reversed": "Inner turmoil, deep-seated fears, hope returning"},
+    "Ten of Swords": {"upright": "Painful endings, betrayal, rock bottom", "reversed": "Recovery, regeneration, resisting an inevitable end"},
+    "Page of Swords": {"upright": "Curiosity, new ideas, thirst for knowledge", "reversed": "Self-expression, all talk and no action, haste"},
+    "Knight of Swords": {"upright": "Ambition, action-oriented, fast thinking", "reversed": "Restlessness, unfocused, impulsive, burn-out"},
+    "Queen of Swords": {"upright": "Independence, clear boundaries, direct communication", "reversed": "Overly emotional, cold-hearted, bitterness"},
+    "King of Swords": {"upright": "Mental clarity, intellectual power, authority, truth", "reversed": "Quiet power, inner truth, misuse of power"},
+    # Pentacles
+    "Ace of Pentacles": {"upright": "New financial opportunity, prosperity, manifestation", "reversed": "Lost opportunity, lack of planning, scarcity"},
+    "Two of Pentacles": {"upright": "Balance, adaptability, time management, priorities", "reversed": "Over-committed, disorganisation, reprioritising"},
+    "Three of Pentacles": {"upright": "Teamwork, collaboration, learning, craftsmanship", "reversed": "Disharmony, misalignment, working alone"},
+    "Four of Pentacles": {"upright": "Saving money, security, conservatism, control", "reversed": "Over-spending, greed, self-protection"},
+    "Five of Pentacles": {"upright": "Financial loss, poverty, isolation, worry", "reversed": "Recovery from loss, spiritual poverty, asking for help"},
+    "Six of Pentacles": {"upright": "Giving, receiving, sharing wealth, generosity", "reversed": "Self-care, unpaid debts, one-sided charity"},
+    "Seven of Pentacles": {"upright": "Long-term view, sustainable results, perseverance", "reversed": "Lack of long-term vision, limited rewards, impatience"},
+    "Eight of Pentacles": {"upright": "Apprenticeship, skill development, diligence, mastery", "reversed": "Perfectionism, misdirected effort, lack of motivation"},
+    "Nine of Pentacles": {"upright": "Abundance, luxury, self-sufficiency, independence", "reversed": "Self-worth, over-investment in work, hustling"},
+    "Ten of Pentacles": {"upright": "Wealth, legacy, family, long-term success", "reversed": "Financial failure, loneliness, loss of legacy"},
+    "Page of Pentacles": {"upright": "Manifestation, financial opportunity, new skills", "reversed": "Lack of progress, procrastination, learning from failure"},
+    "Knight of Pentacles": {"upright": "Hard work, productivity, routine, reliability", "reversed": "Self-discipline, boredom, feeling stuck"},
+    "Queen of Pentacles": {"upright": "Nurturing, practical, providing, working parent", "reversed": "Financial independence, self-care, work-home conflict"},
+    "King of Pentacles": {"upright": "Wealth, business, leadership, security, discipline", "reversed": "Financial ineptitude, obsession with wealth, stubbornness"},
+}
+
+def card_code(card_name, orientation):
+    # Same code the reading codec stores: deck index << 1 | reversed
+    return CARD_IDS[card_name] << 1 | (orientation == "Reversed")
+
+def compile_meanings(meanings):
+    # Flat list indexed by card code, so a lookup is one index instead of dict and string work
+    table = []
+    for card in tarot_cards:
+        entry = meanings.get(card, {})
+        table += [entry.get("upright", ""), entry.get("reversed", "")]
+    return table
+
+MEANING_TABLE = compile_meanings(CARD_MEANINGS)
+_active_meanings = MEANING_TABLE
+
+def set_meaning_table(table):
+    # Any sequence indexed by card code (e.g. a MeaningPack); None restores the built-in meanings
+    global _active_meanings
+    _active_meanings = MEANING_TABLE if table is None else table
+
+def get_card_meaning(card_name, orientation):
+    try:
+        return _active_meanings[CARD_IDS[card_name] << 1 | (orientation == "Reversed")]
+    except KeyError:
+        return f"Meditate on the symbolism of {card_name}. Trust your intuition for guidance."
+    except Exception:
+        log.error(f"Error getting card meaning for {card_name}", exc_info=True)
+        return f"Error retrieving meaning for {card_name}"
+
+# Spread definitions
+SPREADS = {
+    "Daily Guidance": {"cards": 1, "positions": ["Your guidance for today"], "description": "A single card to guide your day"},
+    "Past-Present-Future": {"cards": 3, "positions": ["Past influences", "Present situation", "Future potential"], "description": "Classic three-card timeline reading"},
+    "Love & Relationships": {"cards": 5, "positions": ["You in love", "Your partner/potential", "The relationship", "Challenges to overcome", "Outcome/advice"], "description": "Deep dive into your romantic life"},
+    "Career Path": {"cards": 4, "positions": ["Current career energy", "Hidden talents", "Obstacles to address", "Next steps to take"], "description": "Navigate your professional journey"},
+    "Celtic Cross": {"cards": 10, "positions": ["Present situation", "Challenge/cross", "Distant past/foundation", "Recent past", "Possible outcome", "Near future", "Your approach", "External influences", "Hopes & fears", "Final outcome"], "description": "The most comprehensive tarot spread"},
+    "Chakra Balance": {"cards": 7, "positions": ["Root Chakra (survival)", "Sacral Chakra (creativity)", "Solar Plexus (power)", "Heart Chakra (love)", "Throat Chakra (communication)", "Third Eye (intuition)", "Crown Chakra (spirituality)"], "description": "Align your spiritual energy centers"},
+    "Essential Oil Guidance": {"cards": 3, "positions": ["Physical needs", "Emotional needs", "Spiritual needs"], "description": "Perfect for holistic wellness consultations"}
+}
@@ -0,0 +1,293 @@
+"""Custom card decks: match artist files to the 78 cards, render density variants and write a manifest.
+
+An imported deck is a directory holding manifest.json plus one sub-directory per density
+(thumb, list, full) of PNGs named after the card (The_Fool.png). Rendering runs in a process
+pool where the platform has one (Android does not) and in a thread pool otherwise.
+"""
+
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from tarot_core.deck import suits, ranks, major_arcana, tarot_cards
+from tarot_core.store import atomic_write_json
+
+try:
+    from PIL import Image as PILImage
+except ImportError:  # optional: without Pillow, imported art is stored as-is at full density only
+    PILImage = None
+
+log = logging.getLogger("DeckImport")
+
+IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg']
+CARD_BACK_NAMES = ["CardBacks", "cardback", "card_back", "back", "cover"]
+DECK_MANIFEST = "manifest.json"
+DECK_FORMAT = 1
+
+# Card texture densities, smallest first, with the card height in pixels each is rendered at
+TEXTURE_RESOLUTION_FULL = "full"
+CARD_RESOLUTIONS = [("thumb", 168), ("list", 336), (TEXTURE_RESOLUTION_FULL, 896)]
+
+RANK_ALIASES = {
+    "Ace": ["ace", "one", "1", "01"], "Two": ["two", "2", "02"], "Three": ["three", "3", "03"],
+    "Four": ["four", "4", "04"], "Five": ["five", "5", "05"], "Six": ["six", "6", "06"],
+    "Seven": ["seven", "7", "07"], "Eight": ["eight", "8", "08"], "Nine": ["nine", "9", "09"],
+    "Ten": ["ten", "10"], "Page": ["page", "knave", "princess", "11"], "Knight": ["knight", "prince", "12"],
+    "Queen": ["queen", "13"], "King": ["king", "14"],
+}
+SUIT_ALIASES = {
+    "Wands": ["wands", "wand", "rods", "staves", "batons", "wa", "w"],
+    "Cups": ["cups", "cup", "chalices", "cu", "c"],
+    "Swords": ["swords", "sword", "blades", "sw", "s"],
+    "Pentacles": ["pentacles", "pentacle", "coins", "disks", "discs", "pe", "p"],
+}
+MAJOR_ALIASES = {
+    "Strength": ["fortitude"], "Judgement": ["judgment"], "Wheel of Fortune": ["wheel", "fortune"],
+    "The Hanged Man": ["hanged"], "The High Priestess": ["priestess"],
+}
+STEM_SEPARATORS = re.compile(r"[\s_\-]+")
+COPY_SUFFIX = re.compile(r"\s*\(\d+\)$")  # "Knight of Cups (1)", as left by browsers and file managers
+ROMAN_NUMERALS = ["0", "i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x", "xi",
+                  "xii", "xiii", "xiv", "xv", "xvi", "xvii", "xviii", "xix", "xx", "xxi"]
+
+class DeckImportError(Exception):
+    """The source is not a usable deck; problems lists every reason, for the user to fix in one go."""
+
+    def __init__(self, problems):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+def canonical_asset_key(name):
+    # "The Fool", "The_Fool", "the-fool" and "TheFool" all collapse to "thefool"
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+def card_file_stem(card_name):
+    return card_name.replace(" ", "_")
+
+def pick_card_resolution(pixel_height):
+    for resolution, card_height in CARD_RESOLUTIONS:
+        if pixel_height <= card_height:
+            return resolution
+    return TEXTURE_RESOLUTION_FULL
+
+def _build_aliases():
+    # canonical key -> card name for the naming schemes artists commonly use
+    aliases = {}
+    for suit in suits:
+        for rank in ranks:
+            card = f"{rank} of {suit}"
+            for rank_alias in RANK_ALIASES[rank]:
+                for suit_alias in SUIT_ALIASES[suit]:
+                    if len(suit_alias) > 1:
+                        aliases.setdefault(f"{rank_alias}of{suit_alias}", card)
+                    aliases.setdefault(f"{rank_alias}{suit_alias}", card)
+                    aliases.setdefault(f"{suit_alias}{rank_alias}", card)
+    for number, card in enumerate(major_arcana):
+        names = [canonical_asset_key(card), canonical_asset_key(re.sub(r"^The ", "", card))]
+        names += MAJOR_ALIASES.get(card, [])
+        numbers = [str(number), f"{number:02d}", ROMAN_NUMERALS[number]]
+        for name in names:
+            aliases.setdefault(name, card)
+            for prefix in numbers:
+                aliases.setdefault(f"{prefix}{name}", card)
+                aliases.setdefault(f"{name}{prefix}", card)
+        for prefix in ("major", "maj", "m", "trump", "ar", "t"):
+            aliases.setdefault(f"{prefix}{number}", card)
+            aliases.setdefault(f"{prefix}{number:02d}", card)
+    for name in CARD_BACK_NAMES:
+        aliases[canonical_asset_key(name)] = None
+    return aliases
+
+CARD_ALIASES = _build_aliases()
+# Bare numbers are majors ("07.png"), but only as the whole stem; minors always carry a suit
+MAJOR_NUMBERS = {key: card for number, card in enumerate(major_arcana) for key in (str(number), f"{number:02d}")}
+
+def match_card_files(stems):
+    """Maps file stems to card names (None for the card back).
+
+    Returns (matches {stem: card}, unmatched stems). A stem that is not a known name is
+    retried without its leading parts, split at "_", "-" and spaces, so "mydeck_07_cups01"
+    still finds "cups01". Parts are never cut mid-word, and a bare number only names a
+    major when it is the whole stem, so "IMG_0001" and "sw10" are not misread.
+    """
+    matches = {}
+    unmatched = []
+    for stem in stems:
+        parts = [part for part in STEM_SEPARATORS.split(COPY_SUFFIX.sub("", stem)) if part]
+        card = False
+        for start in range(len(parts)):
+            key = canonical_asset_key("".join(parts[start:]))
+            if key in CARD_ALIASES:
+                card = CARD_ALIASES[key]
+                break
+            if start == 0 and key in MAJOR_NUMBERS:
+                card = MAJOR_NUMBERS[key]
+                break
+        if card is False:
+            unmatched.append(stem)
+        else:
+            matches[stem] = card
+    return matches, unmatched
+
+def list_source_images(source):
+    # {stem: member} for a zip (member is the archive name) or a folder (member is the file path)
+    members = []
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            members = [info.filename for info in archive.infolist() if not info.is_dir()]
+    elif os.path.isdir(source):
+        for root, _, filenames in os.walk(source):
+            members += [os.path.join(root, filename) for filename in filenames]
+    else:
+        raise DeckImportError([f"{source} is neither a zip file nor a folder"])
+    images = {}
+    for member in sorted(members):
+        stem, ext = os.path.splitext(os.path.basename(member))
+        # macOS zips carry "._name" resource forks next to every file
+        if ext.lower() in IMAGE_EXTENSIONS and not stem.startswith("._") and "__MACOSX" not in member:
+            images.setdefault(stem, member)
+    return images
+
+def plan_deck_import(source):
+    """Validates a source and returns {card name or None: member}; raises DeckImportError."""
+    images = list_source_images(source)
+    matches, unmatched = match_card_files(list(images))
+    plan = {}
+    problems = []
+    duplicates = {}
+    for stem, card in matches.items():
+        if card in plan:
+            duplicates.setdefault(card, [os.path.basename(plan[card])]).append(os.path.basename(images[stem]))
+        else:
+            plan[card] = images[stem]
+    missing = [card for card in tarot_cards if card not in plan]
+    if missing:
+        problems.append(f"No image for {len(missing)} cards: {', '.join(missing[:10])}{' …' if len(missing) > 10 else ''}")
+    for card, files in duplicates.items():
+        problems.append(f"Several images for {card or 'the card back'}: {', '.join(files)}")
+    if unmatched:
+        log.info(f"Ignoring unrecognised files: {', '.join(unmatched)}")
+    if problems:
+        raise DeckImportError(problems)
+    return plan
+
+def _read_member(source, member):
+    if os.path.isdir(source):
+        with open(member, 'rb') as f:
+            return f.read()
+    with zipfile.ZipFile(source) as archive:
+        return archive.read(member)
+
+def render_card(job):
+    """Worker: writes every density of one card and returns (card, width, height) of the source."""
+    source, member, deck_dir, card = job
+    data = _read_member(source, member)
+    stem = "CardBacks" if card is None else card_file_stem(card)
+    if PILImage is None:
+        ext = os.path.splitext(member)[1].lower()
+        with open(os.path.join(deck_dir, TEXTURE_RESOLUTION_FULL, stem + ext), 'wb') as f:
+            f.write(data)
+        return card, None, None
+    with PILImage.open(io.BytesIO(data)) as image:
+        image.load()
+        width, height = image.size
+        image = image.convert("RGBA")
+        for resolution, card_height in CARD_RESOLUTIONS:
+            # Never upscale; small art is stored at its own size
+            target_height = min(card_height, height)
+            resized = image if target_height == height else image.resize((max(1, round(width * target_height / height)), target_height), PILImage.LANCZOS)
+            resized.save(os.path.join(deck_dir, resolution, f"{stem}.png"), optimize=resolution != TEXTURE_RESOLUTION_FULL)
+    return card, width, height
+
+def _executor(workers, processes, mp_context):
+    if processes:
+        try:
+            return ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+        except (ImportError, NotImplementedError, OSError):
+            # No working multiprocessing (Android lacks sem_open)
+            log.info("Process pool unavailable, rendering deck on threads")
+    # Pillow releases the GIL while decoding and resizing, so threads still overlap
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="DeckImport")
+
+def deck_slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "deck"
+
+def import_deck(source, decks_dir, name=None, progress=None, workers=None, processes=True, mp_context=None):
+    """Imports a zip or folder of card art into decks_dir and returns the new deck's directory.
+
+    progress(done, total, card) is called from the importing thread after each card.
+    processes=False renders on threads, for hosts whose main module must not be re-imported.
+    Nothing is visible under decks_dir until every card rendered and the manifest is written.
+    """
+    plan = plan_deck_import(source)
+    name = name or os.path.splitext(os.path.basename(os.path.normpath(source)))[0]
+    deck_dir = os.path.join(decks_dir, deck_slug(name))
+    suffix = 2
+    while os.path.exists(deck_dir):
+        deck_dir = os.path.join(decks_dir, f"{deck_slug(name)}-{suffix}")
+        suffix += 1
+    work_dir = f"{deck_dir}.partial"
+    shutil.rmtree(work_dir, ignore_errors=True)
+    resolutions = [resolution for resolution, _ in CARD_RESOLUTIONS] if PILImage is not None else [TEXTURE_RESOLUTION_FULL]
+    for resolution in resolutions:
+        os.makedirs(os.path.join(work_dir, resolution))
+    jobs = [(os.path.abspath(source), member, work_dir, card) for card, member in plan.items()]
+    sizes = {}
+    problems = []
+    try:
+        with _executor(workers or os.cpu_count() or 1, processes, mp_context) as executor:
+            futures = {executor.submit(render_card, job): job for job in jobs}
+            for done, future in enumerate(as_completed(futures), start=1):
+                card = futures[future][3]
+                try:
+                    sizes[card] = future.result()[1:]
+                except Exception as e:
+                    problems.append(f"{os.path.basename(futures[future][1])} could not be read: {e}")
+                if progress is not None:
+                    progress(done, len(jobs), card)
+        if problems:
+            raise DeckImportError(problems)
+        dimensions = [size for card, size in sizes.items() if card is not None and size[0]]
+        manifest = {
+            "format": DECK_FORMAT,
+            "name": name,
+            "source": os.path.basename(os.path.normpath(source)),
+            "created": datetime.now().isoformat(),
+            "resolutions": resolutions,
+            "cards": {card: card_file_stem(card) for card in tarot_cards},
+            "back": "CardBacks" if None in plan else None,
+            "aspect": round(sum(w / h for w, h in dimensions) / len(dimensions), 4) if dimensions else None,
+        }
+        atomic_write_json(os.path.join(work_dir, DECK_MANIFEST), manifest)
+        os.replace(work_dir, deck_dir)
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+    log.info(f"Imported deck {name} into {deck_dir}")
+    return deck_dir
+
+def read_deck_manifest(deck_dir):
+    with open(os.path.join(deck_dir, DECK_MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("format") != DECK_FORMAT:
+        raise ValueError(f"{deck_dir} has unsupported deck format {manifest.get('format')}")
+    return manifest
+
+def list_decks(decks_dir):
+    # [(deck_dir, name)] for every fully imported deck
+    decks = []
+    if not os.path.isdir(decks_dir):
+        return decks
+    for entry in sorted(os.scandir(decks_dir), key=lambda entry: entry.name):
+        if entry.is_dir() and not entry.name.endswith(".partial") and os.path.exists(os.path.join(entry.path, DECK_MANIFEST)):
+            try:
+                decks.append((entry.path, read_deck_manifest(entry.path)["name"]))
+            except Exception:
+                log.error(f"Skipping unreadable deck {entry.path}", exc_info=True)
+    return decks
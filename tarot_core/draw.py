@@ -0,0 +1,93 @@
+"""Seeded card draws for single spreads and bulk simulation."""
+
+import hashlib
+import random
+import secrets
+from array import array
+
+from tarot_core.deck import SPREADS, tarot_cards, get_card_meaning
+
+try:
+    import numpy as np
+except ImportError:  # Android builds ship without NumPy; the pure-Python path covers them
+    np = None
+
+ORIENTATIONS = ["Upright", "Reversed"]
+DECK_SIZE = len(tarot_cards)
+
+def new_seed():
+    return secrets.randbits(63)  # fits SQLite's signed INTEGER
+
+def derive_seed(*parts):
+    # Stable across processes and runs, unlike hash(), so batch output is reproducible
+    digest = hashlib.blake2b(":".join(str(part) for part in parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+def draw_cards(num_cards, seed):
+    # The same seed always gives the same cards in the same positions and orientations
+    rng = random.Random(seed)
+    cards = rng.sample(tarot_cards, num_cards)
+    orientations = [rng.choice(ORIENTATIONS) for _ in range(num_cards)]
+    return cards, orientations
+
+def draw_spread(spread_name, seed):
+    cards, orientations = draw_cards(SPREADS[spread_name]["cards"], seed)
+    return {"spread": spread_name, "seed": seed, "cards": cards, "orientations": orientations}
+
+def draw_batch(num_spreads, num_cards, seed, use_numpy=None):
+    """Draws many spreads at once as rows of deck indices plus rows of reversed flags.
+
+    Returns uint8/bool arrays of shape (num_spreads, num_cards) with NumPy, otherwise
+    lists of array('B') rows. A seed reproduces a batch only on the same engine.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        rng = np.random.default_rng(seed)
+        # Partial Fisher-Yates run on every row at once: only num_cards column swaps
+        decks = np.empty((num_spreads, DECK_SIZE), dtype=np.uint8)
+        decks[:] = np.arange(DECK_SIZE, dtype=np.uint8)
+        rows = np.arange(num_spreads)
+        for position in range(num_cards):
+            picks = rng.integers(position, DECK_SIZE, size=num_spreads)
+            swapped = decks[:, position].copy()
+            decks[:, position] = decks[rows, picks]
+            decks[rows, picks] = swapped
+        reversed_flags = rng.integers(0, 2, size=(num_spreads, num_cards), dtype=np.uint8).astype(bool)
+        return decks[:, :num_cards], reversed_flags
+    rng = random.Random(seed)
+    deck = range(DECK_SIZE)
+    cards = [array('B', rng.sample(deck, num_cards)) for _ in range(num_spreads)]
+    reversed_flags = [array('B', (rng.getrandbits(1) for _ in range(num_cards))) for _ in range(num_spreads)]
+    return cards, reversed_flags
+
+def position_counts(num_spreads, num_cards, seed, use_numpy=None):
+    # How often each card landed in each position, plus reversals per position, as flat lists
+    if use_numpy is None:
+        use_numpy = np is not None
+    cards, reversed_flags = draw_batch(num_spreads, num_cards, seed, use_numpy)
+    if use_numpy:
+        offsets = np.arange(num_cards, dtype=np.int64) * DECK_SIZE
+        card_counts = np.bincount((cards + offsets).ravel(), minlength=num_cards * DECK_SIZE)
+        return card_counts.tolist(), reversed_flags.sum(axis=0).tolist()
+    card_counts = [0] * (num_cards * DECK_SIZE)
+    reversed_counts = [0] * num_cards
+    for row, flags in zip(cards, reversed_flags):
+        for position, card in enumerate(row):
+            card_counts[position * DECK_SIZE + card] += 1
+            reversed_counts[position] += flags[position]
+    return card_counts, reversed_counts
+
+def describe_reading(reading):
+    # One entry per position with its label and meaning, for export and display
+    positions = SPREADS.get(reading["spread"], {}).get("positions", [])
+    return [
+        {
+            "position": index + 1,
+            "label": positions[index] if index < len(positions) else f"Position {index + 1}",
+            "card": card,
+            "orientation": orientation,
+            "meaning": get_card_meaning(card, orientation),
+        }
+        for index, (card, orientation) in enumerate(zip(reading["cards"], reading["orientations"]))
+    ]
@@ -0,0 +1,95 @@
+"""Spread geometry: where each position's card lies on the table, and which card a point touches.
+
+Coordinates are in card widths, y pointing up, with the layout's centre at the origin.
+"""
+
+import math
+from collections import defaultdict, namedtuple
+
+CARD_ASPECT = 1.72  # height / width of the Rider-Waite cards
+CARD_GAP = 0.15
+ROW_LENGTH = 3  # spreads without their own geometry are laid out in rows of this many
+
+Slot = namedtuple("Slot", "x y angle")  # card centre, and degrees counter-clockwise
+
+def celtic_cross(aspect):
+    # The cross: 1 covered by 2 laid sideways, 3 below, 4 left, 5 above, 6 right.
+    # The staff: 7 to 10 from the bottom up, to the right of the cross.
+    across = aspect / 2 + 0.5 + CARD_GAP
+    down = aspect + CARD_GAP
+    staff_x = across + 1 + 3 * CARD_GAP
+    slots = [Slot(0, 0, 0), Slot(0, 0, 90), Slot(0, -down, 0), Slot(-across, 0, 0), Slot(0, down, 0), Slot(across, 0, 0)]
+    slots += [Slot(staff_x, (step - 1.5) * down, 0) for step in range(4)]
+    return center_slots(slots, aspect)
+
+def chakra_column(aspect):
+    # Root at the bottom, crown at the top
+    return [Slot(0, (step - 3) * (aspect + CARD_GAP), 0) for step in range(7)]
+
+def rows(count, aspect):
+    slots = []
+    row_count = math.ceil(count / ROW_LENGTH)
+    for index in range(count):
+        row, column = divmod(index, ROW_LENGTH)
+        in_row = min(ROW_LENGTH, count - row * ROW_LENGTH)
+        slots.append(Slot((column - (in_row - 1) / 2) * (1 + CARD_GAP), ((row_count - 1) / 2 - row) * (aspect + CARD_GAP), 0))
+    return slots
+
+SPREAD_GEOMETRY = {
+    "Celtic Cross": celtic_cross,
+    "Chakra Balance": chakra_column,
+}
+
+def spread_layout(spread_name, count, aspect=CARD_ASPECT):
+    geometry = SPREAD_GEOMETRY.get(spread_name)
+    slots = geometry(aspect) if geometry else []
+    # A spread whose position count changed falls back to rows rather than misplacing cards
+    return slots if len(slots) == count else rows(count, aspect)
+
+def card_corners(slot, aspect):
+    """Bottom-left, bottom-right, top-right, top-left of the card image, turned by slot.angle."""
+    cos, sin = math.cos(math.radians(slot.angle)), math.sin(math.radians(slot.angle))
+    half_w, half_h = 0.5, aspect / 2
+    return [(slot.x + dx * cos - dy * sin, slot.y + dx * sin + dy * cos)
+            for dx, dy in ((-half_w, -half_h), (half_w, -half_h), (half_w, half_h), (-half_w, half_h))]
+
+def layout_bounds(slots, aspect):
+    points = [point for slot in slots for point in card_corners(slot, aspect)]
+    if not points:
+        return 0, 0, 0, 0
+    xs, ys = [x for x, _ in points], [y for _, y in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def center_slots(slots, aspect):
+    min_x, min_y, max_x, max_y = layout_bounds(slots, aspect)
+    cx, cy = (min_x + max_x) / 2, (min_y + max_y) / 2
+    return [Slot(slot.x - cx, slot.y - cy, slot.angle) for slot in slots]
+
+class HitIndex:
+    """Uniform grid over the cards' bounding boxes, one card width per cell.
+
+    A point is tested only against the few cards whose boxes share its cell.
+    """
+
+    def __init__(self, slots, aspect, cell=1.0):
+        self.slots = list(slots)
+        self.aspect = aspect
+        self.cell = cell
+        self.cells = defaultdict(list)
+        for index, slot in enumerate(self.slots):
+            xs, ys = zip(*card_corners(slot, aspect))
+            for cx in range(math.floor(min(xs) / cell), math.floor(max(xs) / cell) + 1):
+                for cy in range(math.floor(min(ys) / cell), math.floor(max(ys) / cell) + 1):
+                    self.cells[(cx, cy)].append(index)
+
+    def hits(self, x, y):
+        """Indices of the cards under (x, y), topmost (drawn last) first."""
+        found = []
+        for index in reversed(self.cells.get((math.floor(x / self.cell), math.floor(y / self.cell)), ())):
+            slot = self.slots[index]
+            cos, sin = math.cos(math.radians(slot.angle)), math.sin(math.radians(slot.angle))
+            dx, dy = x - slot.x, y - slot.y
+            # Into the card's own frame
+            if abs(dx * cos + dy * sin) <= 0.5 and abs(-dx * sin + dy * cos) <= self.aspect / 2:
+                found.append(index)
+        return found
@@ -0,0 +1,105 @@
+"""Interpretation packs: alternative card meanings in a compact file that is memory-mapped on use.
+
+Layout: header, UTF-8 JSON metadata, one offset per card code plus an end offset, then the
+meanings back to back as UTF-8. Empty entries fall back to the built-in meaning.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+
+from tarot_core.deck import MEANING_TABLE, compile_meanings
+
+log = logging.getLogger("MeaningPacks")
+
+PACK_EXTENSION = ".tpack"
+PACK_MAGIC = b"TMPK"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct(">4sBHI")  # magic, version, entry count, metadata length
+BUILTIN_PACK = {"name": "Classic (built-in)", "author": "", "language": "en", "path": None}
+
+def write_pack(path, meanings, name, author="", language="", description=""):
+    """Compiles {card: {"upright": ..., "reversed": ...}} into a pack file at path."""
+    blobs = [text.encode('utf-8') for text in compile_meanings(meanings)]
+    metadata = json.dumps({"name": name, "author": author, "language": language, "description": description}, ensure_ascii=False).encode('utf-8')
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(blobs), len(metadata)))
+        f.write(metadata)
+        f.write(struct.pack(f">{len(offsets)}I", *offsets))
+        f.writelines(blobs)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _read_header(data, path):
+    magic, version, count, metadata_length = PACK_HEADER.unpack_from(data)
+    if magic != PACK_MAGIC or version != PACK_VERSION:
+        raise ValueError(f"{path} is not a version {PACK_VERSION} meaning pack")
+    if count != len(MEANING_TABLE):
+        raise ValueError(f"{path} has {count} entries, expected {len(MEANING_TABLE)}")
+    return count, metadata_length
+
+def read_pack_info(path):
+    # Header and metadata only, so listing packs never reads the meanings themselves
+    with open(path, 'rb') as f:
+        _, metadata_length = _read_header(f.read(PACK_HEADER.size), path)
+        info = json.loads(f.read(metadata_length).decode('utf-8'))
+    return dict(info, path=path)
+
+def find_packs(directories):
+    packs = []
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(PACK_EXTENSION):
+                continue
+            try:
+                packs.append(read_pack_info(os.path.join(directory, filename)))
+            except Exception:
+                log.error(f"Skipping unreadable meaning pack {filename}", exc_info=True)
+    return packs
+
+class MeaningPack:
+    """A pack file mapped into memory; each meaning is decoded the first time it is read.
+
+    Indexed by card code like tarot_core.deck.MEANING_TABLE, so it can be passed to
+    set_meaning_table directly.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            count, metadata_length = _read_header(self._map, path)
+            self.info = dict(json.loads(self._map[PACK_HEADER.size:PACK_HEADER.size + metadata_length].decode('utf-8')), path=path)
+            offsets_start = PACK_HEADER.size + metadata_length
+            self._offsets = struct.unpack_from(f">{count + 1}I", self._map, offsets_start)
+            self._text_start = offsets_start + 4 * (count + 1)
+            if self._text_start + self._offsets[-1] > len(self._map):
+                raise ValueError(f"{path} is truncated")
+        except Exception:
+            self._map.close()
+            raise
+        self._entries = [None] * count
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, code):
+        text = self._entries[code]
+        if text is None:
+            start = self._text_start + self._offsets[code]
+            text = self._map[start:self._text_start + self._offsets[code + 1]].decode('utf-8') or MEANING_TABLE[code]
+            self._entries[code] = text
+        return text
+
+    def close(self):
+        self._map.close()
@@ -0,0 +1,105 @@
+"""Full-text index over journal entries and reading metadata, on FTS5 with an FTS4 fallback."""
+
+import re
+import sqlite3
+import struct
+from datetime import datetime
+
+from tarot_core.codec import decode_reading
+
+HIGHLIGHT_START = "\x02"  # snippet markers; the UI swaps them for its own markup after escaping
+HIGHLIGHT_END = "\x03"
+SNIPPET_TOKENS = 12
+RANK_WINDOW = 2000  # newest matches ordered by relevance
+TOKEN = re.compile(r"\w+", re.UNICODE)
+
+INSERT_DOCUMENT = "INSERT INTO search_index (kind, ref, client_id, date, client, body) VALUES (?, ?, ?, ?, ?, ?)"
+
+def create_search_index(conn):
+    # FTS5 ranks with bm25; builds without it (older Android SQLite) get FTS4 ranked by fts4_rank
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE search_index USING fts5(
+                kind UNINDEXED, ref UNINDEXED, client_id UNINDEXED, date UNINDEXED, client, body,
+                tokenize = 'unicode61', prefix = '2 3'
+            )
+        """)
+    except sqlite3.OperationalError:
+        conn.execute("""
+            CREATE VIRTUAL TABLE search_index USING fts4(
+                kind, ref, client_id, date, client, body,
+                notindexed=kind, notindexed=ref, notindexed=client_id, notindexed=date,
+                tokenize=unicode61, prefix="2,3"
+            )
+        """)
+    names = {row[0]: row[1] for row in conn.execute("SELECT id, name FROM clients")}
+    conn.executemany(INSERT_DOCUMENT, [
+        journal_document(entry_id, client_id, names.get(client_id, ""), entry_date, text)
+        for entry_id, client_id, entry_date, text in conn.execute("SELECT id, client_id, date, text FROM journal_entries")
+    ])
+    conn.executemany(INSERT_DOCUMENT, [
+        reading_document(reading_id, client_id, names.get(client_id, ""), packed)
+        for reading_id, client_id, packed in conn.execute("SELECT id, client_id, packed FROM readings")
+    ])
+
+def uses_fts5(conn):
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'search_index'").fetchone()
+    return row is not None and "fts5" in row[0].lower()
+
+def fts4_rank(matchinfo):
+    # matchinfo 'pcx': phrases, columns, then per phrase and column (hits here, hits everywhere, rows hit)
+    values = struct.unpack(f"{len(matchinfo) // 4}I", matchinfo)
+    phrases, columns = values[0], values[1]
+    score = 0.0
+    for cell in range(phrases * columns):
+        hits, total_hits = values[2 + 3 * cell], values[3 + 3 * cell]
+        if hits:
+            score += hits / total_hits
+    return score
+
+def register_functions(conn):
+    conn.create_function("fts4_rank", 1, fts4_rank, deterministic=True)
+
+def journal_document(entry_id, client_id, client_name, entry_date, text):
+    return ("journal", entry_id, client_id, entry_date, client_name, text)
+
+def reading_document(reading_id, client_id, client_name, packed):
+    # Spread, card names, orientations and the date spelled out, so "celtic tower march" finds it
+    reading = decode_reading(packed)
+    day = datetime.fromisoformat(reading["date"])
+    words = [reading["spread"], day.strftime("%Y-%m-%d %B %Y %A")]
+    words += [f"{card} {orientation}" for card, orientation in zip(reading["cards"], reading["orientations"])]
+    return ("reading", reading_id, client_id, reading["date"], client_name, " · ".join(words))
+
+def match_query(text):
+    # Every word must match, each as a prefix; lowercasing keeps AND/OR/NOT from acting as operators
+    tokens = TOKEN.findall(text.lower())
+    return " ".join(f"{token}*" for token in tokens) if tokens else None
+
+def search_documents(conn, text, limit=50, offset=0, client_id=None, fts5=True):
+    # Relevance ranking reads every hit's position list, so only the newest RANK_WINDOW
+    # matches are ranked; any older ones follow newest first. Keeps common prefixes fast.
+    query = match_query(text)
+    if query is None:
+        return []
+    client_filter = "AND client_id = ?" if client_id else ""
+    client_params = [client_id] if client_id else []
+    if fts5:
+        snippet = f"snippet(search_index, 5, ?, ?, '…', {SNIPPET_TOKENS})"
+        relevance = "bm25(search_index, 0, 0, 0, 0, 2.0, 1.0)"
+    else:
+        snippet = f"snippet(search_index, ?, ?, '…', 5, {SNIPPET_TOKENS})"
+        relevance = "-fts4_rank(matchinfo(search_index, 'pcx'))"
+    select = f"SELECT kind, ref, client_id, date, client, {snippet} FROM search_index WHERE search_index MATCH ? {client_filter}"
+    params = [HIGHLIGHT_START, HIGHLIGHT_END, query] + client_params
+    oldest_ranked = conn.execute(f"SELECT rowid FROM search_index WHERE search_index MATCH ? {client_filter} ORDER BY rowid DESC LIMIT 1 OFFSET ?",
+                                 [query] + client_params + [RANK_WINDOW - 1]).fetchone()
+    boundary = oldest_ranked[0] if oldest_ranked else 0
+    rows = conn.execute(f"{select} AND rowid >= ? ORDER BY {relevance} LIMIT ? OFFSET ?", params + [boundary, limit, offset]).fetchall()
+    if oldest_ranked and len(rows) < limit:
+        rows += conn.execute(f"{select} AND rowid < ? ORDER BY rowid DESC LIMIT ? OFFSET ?",
+                             params + [boundary, limit - len(rows), max(0, offset - RANK_WINDOW)]).fetchall()
+    return [
+        {"kind": row[0], "ref": int(row[1]), "client_id": row[2], "date": row[3], "client": row[4], "snippet": row[5]}
+        for row in rows
+    ]
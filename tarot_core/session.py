@@ -0,0 +1,94 @@
+"""Reading sessions: the cards drawn for a reading, which are face up and when, in a few dozen bytes."""
+
+import struct
+from datetime import datetime
+
+from tarot_core.codec import decode_reading, encode_reading, from_timestamp, to_timestamp
+from tarot_core.draw import draw_cards, new_seed
+
+SESSION_VERSION = 1
+SESSION_HEADER = struct.Struct(">BBqB")  # version, flags, seed, client id length
+FLAG_SPECIAL = 1
+
+def now_timestamp():
+    # Same clock as stored readings: local wall-clock seconds, see tarot_core.codec.to_timestamp
+    return to_timestamp(datetime.now().replace(microsecond=0).isoformat())
+
+class ReadingSession:
+    """A reading in progress, independent of any widgets.
+
+    Cards are kept in draw order, which is also position order, and are revealed
+    strictly in that order; reveal_times holds one timestamp per revealed card.
+    """
+
+    __slots__ = ("spread", "cards", "orientations", "seed", "client_id", "special", "started", "reveal_times")
+
+    def __init__(self, spread, cards, orientations, seed, client_id=None, special=False, started=None, reveal_times=()):
+        self.spread = spread
+        self.cards = list(cards)
+        self.orientations = list(orientations)
+        self.seed = seed
+        self.client_id = client_id
+        self.special = special
+        self.started = now_timestamp() if started is None else started
+        self.reveal_times = list(reveal_times)
+
+    @classmethod
+    def draw(cls, spread, num_cards, client_id=None, special=False, seed=None):
+        seed = new_seed() if seed is None else seed
+        cards, orientations = draw_cards(num_cards, seed)
+        return cls(spread, cards, orientations, seed, client_id, special)
+
+    def __len__(self):
+        return len(self.cards)
+
+    @property
+    def next_index(self):
+        return len(self.reveal_times)
+
+    @property
+    def complete(self):
+        return len(self.reveal_times) == len(self.cards)
+
+    @property
+    def date(self):
+        return from_timestamp(self.started)
+
+    def is_revealed(self, index):
+        return index < len(self.reveal_times)
+
+    def reveal(self, index, timestamp=None):
+        # True if index was the next face-down card and is now revealed
+        if index != len(self.reveal_times) or index >= len(self.cards):
+            return False
+        self.reveal_times.append(now_timestamp() if timestamp is None else timestamp)
+        return True
+
+    def to_bytes(self):
+        """Header, client id, one offset from the start per revealed card, then the packed reading."""
+        client_id = (self.client_id or "").encode('utf-8')
+        offsets = [max(0, timestamp - self.started) for timestamp in self.reveal_times]
+        return b"".join((
+            SESSION_HEADER.pack(SESSION_VERSION, FLAG_SPECIAL if self.special else 0, self.seed or 0, len(client_id)),
+            client_id,
+            struct.pack(f">B{len(offsets)}I", len(offsets), *offsets),
+            encode_reading(self.spread, self.cards, self.orientations, self.started),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data):
+        data = bytes(data)
+        version, flags, seed, client_id_length = SESSION_HEADER.unpack_from(data)
+        if version != SESSION_VERSION:
+            raise ValueError(f"Unsupported reading session version {version}")
+        position = SESSION_HEADER.size
+        client_id = data[position:position + client_id_length].decode('utf-8') or None
+        position += client_id_length
+        revealed = data[position]
+        offsets = struct.unpack_from(f">{revealed}I", data, position + 1)
+        reading = decode_reading(data[position + 1 + 4 * revealed:])
+        started = to_timestamp(reading["date"])
+        if revealed > len(reading["cards"]):
+            raise ValueError("Reading session reveals more cards than it holds")
+        return cls(reading["spread"], reading["cards"], reading["orientations"], seed or None, client_id,
+                   bool(flags & FLAG_SPECIAL), started, [started + offset for offset in offsets])
@@ -0,0 +1,95 @@
+"""Per-client card frequency aggregates kept in monthly and all-time buckets."""
+
+from collections import Counter
+
+from tarot_core.codec import HEADER, SPREAD_NAMES, UNKNOWN_SPREAD, decode_header, from_timestamp
+from tarot_core.deck import suits, ranks, tarot_cards
+
+ALL_TIME = "A"
+STAT_READINGS = "r"  # key 0: readings in the bucket
+STAT_CARD = "c"  # key: card code, deck index << 1 | reversed
+STAT_POSITION = "p"  # key: spread id << 16 | position << 8 | deck index
+STAT_SUIT = "s"  # key: index into suits, or len(suits) for the major arcana
+MAJOR_ARCANA_KEY = len(suits)
+
+def month_bucket(timestamp):
+    # Same "MYYYY-MM" keys as reading_periods uses for the monthly reading counts
+    return "M" + from_timestamp(timestamp)[:7]
+
+def recent_months(today, months):
+    keys = []
+    year, month = today.year, today.month
+    for _ in range(months):
+        keys.append(f"M{year:04d}-{month:02d}")
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return keys
+
+def suit_key(card_id):
+    return card_id // len(ranks) if card_id < len(suits) * len(ranks) else MAJOR_ARCANA_KEY
+
+def reading_stat_counts(packed):
+    # Every (dimension, key) a single packed reading adds to, with multiplicity
+    decode_header(packed)  # rejects encodings this version cannot read
+    spread_id = HEADER.unpack_from(packed)[1]  # the stored id, not a name lookup that could miss
+    counts = Counter({(STAT_READINGS, 0): 1})
+    for position, code in enumerate(packed[HEADER.size:]):
+        card_id = code >> 1
+        counts[(STAT_CARD, code)] += 1
+        counts[(STAT_POSITION, spread_id << 16 | position << 8 | card_id)] += 1
+        counts[(STAT_SUIT, suit_key(card_id))] += 1
+    return counts
+
+def rebuild_card_stats(conn, client_id=None):
+    # Recomputes the aggregates from raw readings for one client, or for everyone
+    if client_id is None:
+        conn.execute("DELETE FROM client_card_stats")
+        rows = conn.execute("SELECT client_id, ts, packed FROM readings")
+    else:
+        conn.execute("DELETE FROM client_card_stats WHERE client_id = ?", (client_id,))
+        rows = conn.execute("SELECT client_id, ts, packed FROM readings WHERE client_id = ?", (client_id,))
+    totals = Counter()
+    for reading_client, timestamp, packed in rows:
+        for (dimension, key), count in reading_stat_counts(packed).items():
+            totals[(reading_client, ALL_TIME, dimension, key)] += count
+            totals[(reading_client, month_bucket(timestamp), dimension, key)] += count
+    conn.executemany("INSERT INTO client_card_stats (client_id, period, dimension, key, count) VALUES (?, ?, ?, ?, ?)",
+                     [key + (count,) for key, count in totals.items()])
+    return sum(count for key, count in totals.items() if key[1] == ALL_TIME and key[2] == STAT_READINGS)
+
+def summarize_card_stats(buckets, top=10):
+    """Turns one or more {(dimension, key): count} buckets into a readable summary."""
+    totals = Counter()
+    for bucket in buckets:
+        totals.update(bucket)
+    cards = {}
+    upright = reversed_total = 0
+    suit_counts = {}
+    positions = {}
+    for (dimension, key), count in totals.items():
+        if dimension == STAT_CARD:
+            entry = cards.setdefault(tarot_cards[key >> 1], {"total": 0, "upright": 0, "reversed": 0})
+            entry["total"] += count
+            if key & 1:
+                entry["reversed"] += count
+                reversed_total += count
+            else:
+                entry["upright"] += count
+                upright += count
+        elif dimension == STAT_SUIT:
+            suit_counts["Major Arcana" if key == MAJOR_ARCANA_KEY else suits[key]] = count
+        elif dimension == STAT_POSITION:
+            spread_name = SPREAD_NAMES.get(key >> 16, UNKNOWN_SPREAD)
+            by_card = positions.setdefault(spread_name, {}).setdefault((key >> 8) & 0xFF, {})
+            by_card[tarot_cards[key & 0xFF]] = count
+    return {
+        "readings": totals[(STAT_READINGS, 0)],
+        "cards": cards,
+        "top_cards": sorted(cards.items(), key=lambda item: (-item[1]["total"], item[0]))[:top],
+        "orientations": {"upright": upright, "reversed": reversed_total},
+        "suits": suit_counts,
+        # Most frequent card in each position of each spread
+        "positions": {
+            spread_name: {position: max(by_card.items(), key=lambda item: item[1]) for position, by_card in sorted(by_position.items())}
+            for spread_name, by_position in positions.items()
+        },
+    }
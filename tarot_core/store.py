@@ -0,0 +1,809 @@
+"""SQLite client store, write-behind scheduling and atomic file writes."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from datetime import datetime, date, timedelta
+
+from tarot_core.client_index import ClientIndex
+from tarot_core.codec import PackedReading, encode_reading, decode_header, from_timestamp, to_timestamp
+from tarot_core.search import INSERT_DOCUMENT, create_search_index, journal_document, reading_document, register_functions, search_documents, uses_fts5
+from tarot_core.stats import ALL_TIME, month_bucket, recent_months, reading_stat_counts, rebuild_card_stats, summarize_card_stats
+
+log = logging.getLogger("ClientManager")
+write_log = logging.getLogger("WriteBehind")
+
+WRITE_BEHIND_DELAY = 1.0  # seconds a write may wait so bursts coalesce into one flush
+WRITE_RETRY_MAX = 60.0  # longest backoff before retrying a failed write
+TRANSIENT_SQLITE_CODES = {5, 6, 10, 13}  # SQLITE_BUSY, SQLITE_LOCKED, SQLITE_IOERR, SQLITE_FULL
+
+def is_transient(error):
+    # Failures worth retrying later, as opposed to a write that can never succeed
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, "sqlite_errorcode", None)  # Python 3.11+
+    if code is not None:
+        return code & 0xff in TRANSIENT_SQLITE_CODES
+    message = str(error).lower()
+    return any(word in message for word in ("locked", "busy", "disk i/o", "full"))
+
+def atomic_write_json(path, data):
+    # Readers only ever see the old file or the complete new one
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+class WriteBehindScheduler:
+    """Runs disk writes on a background thread, coalescing writes that share a key.
+
+    A write that raises is queued again and retried with exponential backoff; errors
+    holds the latest failure per key until that key writes successfully.
+    """
+
+    def __init__(self, delay=WRITE_BEHIND_DELAY):
+        self.delay = delay
+        self.pending = OrderedDict()
+        self.condition = threading.Condition()
+        self.flush_requested = False
+        self.busy = False
+        self.errors = {}
+        self.retries = 0  # consecutive batches with a failure
+        self.batches = 0
+        self.stats = {"flushes": 0, "writes": 0, "coalesced": 0, "failures": 0, "last_flush_ms": 0.0, "max_flush_ms": 0.0}
+        self.thread = threading.Thread(target=self._run, name="WriteBehind", daemon=True)
+        self.thread.start()
+
+    def schedule(self, key, write):
+        # A newer write for the same key replaces the queued one
+        with self.condition:
+            if self.pending.pop(key, None) is not None:
+                self.stats["coalesced"] += 1
+            self.pending[key] = write
+            self.condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                delay = self.delay if not self.retries else min(WRITE_RETRY_MAX, max(self.delay, 0.5) * 2 ** self.retries)
+                deadline = time.monotonic() + delay
+                while not self.flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                batch = list(self.pending.items())
+                self.pending.clear()
+                self.flush_requested = False
+                self.busy = True
+            start = time.perf_counter()
+            failed = []
+            for key, write in batch:
+                try:
+                    write()
+                except Exception as e:
+                    write_log.error(f"Error flushing {key}, will retry", exc_info=True)
+                    failed.append((key, write, e))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self.condition:
+                self.busy = False
+                for key, _ in batch:
+                    self.errors.pop(key, None)
+                for key, write, error in reversed(failed):
+                    # A write queued for the same key since then supersedes the failed one
+                    if key not in self.pending:
+                        self.pending[key] = write
+                        self.pending.move_to_end(key, last=False)
+                    self.errors[key] = f"{type(error).__name__}: {error}"
+                self.retries = self.retries + 1 if failed else 0
+                self.batches += 1
+                self.stats["failures"] += len(failed)
+                self.stats["flushes"] += 1
+                self.stats["writes"] += len(batch)
+                self.stats["last_flush_ms"] = elapsed_ms
+                self.stats["max_flush_ms"] = max(self.stats["max_flush_ms"], elapsed_ms)
+                self.condition.notify_all()
+
+    def flush(self, timeout=5.0):
+        # Blocks until everything queued so far is on disk; False if a write failed or timed out
+        with self.condition:
+            if not self.pending and not self.busy:
+                return True
+            batches = self.batches
+            self.flush_requested = True
+            self.condition.notify_all()
+            self.condition.wait_for(lambda: not self.busy and (not self.pending or (self.errors and self.batches > batches)), timeout)
+            self.flush_requested = False
+            return not self.pending and not self.busy and not self.errors
+
+    def summary(self):
+        with self.condition:
+            return dict(self.stats, pending=len(self.pending), busy=self.busy, errors=dict(self.errors),
+                        last_flush_ms=round(self.stats["last_flush_ms"], 2), max_flush_ms=round(self.stats["max_flush_ms"], 2))
+
+DEFAULT_CLIENT_NAME = "My Readings"
+
+def pack_readings_table(conn):
+    # Folds reading_cards into one packed BLOB per reading (see tarot_core.codec)
+    conn.execute("""
+        CREATE TABLE packed_readings (
+            id INTEGER PRIMARY KEY,
+            client_id TEXT NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+            ts INTEGER NOT NULL,
+            seed INTEGER,
+            packed BLOB NOT NULL
+        )
+    """)
+    cards = {}
+    for row in conn.execute("SELECT reading_id, card, orientation FROM reading_cards ORDER BY reading_id, position"):
+        entry = cards.setdefault(row[0], ([], []))
+        entry[0].append(row[1])
+        entry[1].append(row[2])
+    rows = []
+    for reading_id, client_id, spread, reading_date, seed in conn.execute("SELECT id, client_id, spread, date, seed FROM readings"):
+        timestamp = to_timestamp(reading_date)
+        reading_cards, orientations = cards.get(reading_id, ([], []))
+        rows.append((reading_id, client_id, timestamp, seed, encode_reading(spread, reading_cards, orientations, timestamp)))
+    conn.executemany("INSERT INTO packed_readings (id, client_id, ts, seed, packed) VALUES (?, ?, ?, ?, ?)", rows)
+    conn.execute("DROP TABLE reading_cards")
+    conn.execute("DROP TABLE readings")
+    conn.execute("ALTER TABLE packed_readings RENAME TO readings")
+    conn.execute("CREATE INDEX idx_readings_client_ts ON readings(client_id, ts)")
+
+def create_card_stats(conn):
+    # period is "A" (all time) or "MYYYY-MM"; dimension/key are described in tarot_core.stats
+    conn.execute("""
+        CREATE TABLE client_card_stats (
+            client_id TEXT NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+            period TEXT NOT NULL,
+            dimension TEXT NOT NULL,
+            key INTEGER NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (client_id, period, dimension, key)
+        ) WITHOUT ROWID
+    """)
+    rebuild_card_stats(conn)
+
+# Each entry upgrades the schema by one version; PRAGMA user_version records how many have run.
+# Entries are SQL scripts, or callables for steps that need Python (run in one transaction).
+SCHEMA_MIGRATIONS = [
+    """
+    CREATE TABLE clients (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+        description TEXT NOT NULL DEFAULT '',
+        created TEXT NOT NULL
+    );
+    CREATE TABLE readings (
+        id INTEGER PRIMARY KEY,
+        client_id TEXT NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+        spread TEXT NOT NULL,
+        date TEXT NOT NULL
+    );
+    CREATE TABLE reading_cards (
+        reading_id INTEGER NOT NULL REFERENCES readings(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        card TEXT NOT NULL,
+        orientation TEXT NOT NULL,
+        PRIMARY KEY (reading_id, position)
+    );
+    CREATE TABLE journal_entries (
+        id INTEGER PRIMARY KEY,
+        client_id TEXT NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+        date TEXT NOT NULL,
+        text TEXT NOT NULL
+    );
+    CREATE TABLE app_state (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    CREATE INDEX idx_readings_client_date ON readings(client_id, date);
+    CREATE INDEX idx_readings_client_spread ON readings(client_id, spread, date);
+    CREATE INDEX idx_journal_client_date ON journal_entries(client_id, date);
+    """,
+    """
+    CREATE TABLE client_spread_last (
+        client_id TEXT NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+        spread TEXT NOT NULL,
+        last_date TEXT NOT NULL,
+        PRIMARY KEY (client_id, spread)
+    ) WITHOUT ROWID;
+    CREATE TABLE client_period_counts (
+        client_id TEXT NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+        period TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (client_id, period)
+    ) WITHOUT ROWID;
+    INSERT INTO client_spread_last (client_id, spread, last_date)
+        SELECT client_id, spread, MAX(date) FROM readings GROUP BY client_id, spread;
+    INSERT INTO client_period_counts (client_id, period, count)
+        SELECT client_id, 'W' || date(date, '-6 days', 'weekday 1'), COUNT(*) FROM readings GROUP BY 1, 2;
+    INSERT INTO client_period_counts (client_id, period, count)
+        SELECT client_id, 'M' || strftime('%Y-%m', date), COUNT(*) FROM readings GROUP BY 1, 2;
+    """,
+    """
+    ALTER TABLE readings ADD COLUMN seed INTEGER;
+    """,
+    pack_readings_table,
+    create_card_stats,
+    create_search_index,
+    # Summary columns so the client book loads without touching any client's history
+    """
+    ALTER TABLE clients ADD COLUMN reading_count INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE clients ADD COLUMN journal_count INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE clients ADD COLUMN last_visit TEXT;
+    UPDATE clients SET
+        reading_count = (SELECT COUNT(*) FROM readings r WHERE r.client_id = clients.id),
+        journal_count = (SELECT COUNT(*) FROM journal_entries j WHERE j.client_id = clients.id),
+        last_visit = max(
+            created,
+            COALESCE((SELECT strftime('%Y-%m-%dT%H:%M:%S', MAX(ts), 'unixepoch') FROM readings r WHERE r.client_id = clients.id), created),
+            COALESCE((SELECT MAX(date) FROM journal_entries j WHERE j.client_id = clients.id), created)
+        );
+    """,
+]
+
+def reading_periods(day):
+    # Keys for the week (starting Monday) and month a reading falls in; must match the SQL backfill above
+    week_start = day - timedelta(days=day.weekday())
+    return f"W{week_start.isoformat()}", f"M{day.strftime('%Y-%m')}"
+
+class ClientManager:
+    """SQLite-backed store of clients with their readings and journal entries.
+
+    Mutations update the in-memory model immediately and queue their SQL on the
+    write-behind scheduler, which applies everything queued in one transaction.
+    """
+
+    def __init__(self, db_path, scheduler):
+        self.db_path = db_path
+        self.scheduler = scheduler
+        self.current_client_id = None
+        self._current_client = None
+        self._clients = {}
+        self._client_index = ClientIndex()
+        self.version = 0  # bumped on every mutation so cached screens know when to refresh
+        self._reading_index = {}
+        self._card_stats = {}
+        self._pending_ops = []
+        self._ops_lock = threading.Lock()
+        self._session_checkpoint = None
+        self._session_pending = False
+        self._writer_conn = None
+        try:
+            db_dir = os.path.dirname(db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self.conn = self._connect()
+            self._migrate()
+            self._search_fts5 = uses_fts5(self.conn)
+            self._load_clients()
+            self._load_current_client()
+        except Exception:
+            log.error(f"Error opening client store at {db_path}", exc_info=True)
+            raise
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        register_functions(conn)
+        return conn
+
+    def _migrate(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        rewrote = False
+        for target, script in enumerate(SCHEMA_MIGRATIONS[version:], start=version + 1):
+            log.info(f"Migrating client store to schema version {target}")
+            if callable(script):
+                self.conn.execute("BEGIN")
+                try:
+                    script(self.conn)
+                    self.conn.execute(f"PRAGMA user_version = {target}")
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+                rewrote = True
+            else:
+                self.conn.executescript(f"BEGIN; {script}; PRAGMA user_version = {target}; COMMIT;")
+        if rewrote:
+            # Hand the pages freed by rewritten tables back to the filesystem
+            self.conn.execute("VACUUM")
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _queue(self, op):
+        # op(conn) runs later on the writer thread's own connection
+        with self._ops_lock:
+            self._pending_ops.append(op)
+        self.scheduler.schedule(self.db_path, self._flush_ops)
+
+    def _flush_ops(self):
+        with self._ops_lock:
+            ops, self._pending_ops = self._pending_ops, []
+        if not ops:
+            return
+        dropped = 0
+        try:
+            if self._writer_conn is None:
+                self._writer_conn = self._connect()
+            conn = self._writer_conn
+            # IMMEDIATE takes the write lock up front, so a locked database fails before any op runs
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for op in ops:
+                    # Each op in its own savepoint: one that can never succeed is dropped alone
+                    conn.execute("SAVEPOINT write_op")
+                    try:
+                        op(conn)
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO write_op")
+                        conn.execute("RELEASE write_op")
+                        if is_transient(e):
+                            raise
+                        dropped += 1
+                        log.error("Dropping a queued write that cannot be applied", exc_info=True)
+                    else:
+                        conn.execute("RELEASE write_op")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+        except Exception:
+            # Nothing was committed: keep every op, in order, ahead of any queued meanwhile
+            with self._ops_lock:
+                self._pending_ops[:0] = ops
+            raise
+        if dropped:
+            raise sqlite3.DatabaseError(f"{dropped} of {len(ops)} queued writes failed and were dropped")
+
+    def _sync_before_read(self):
+        # Reads that go to disk must not miss writes still queued or being committed;
+        # _flush_ops empties _pending_ops before its transaction commits, so always ask
+        # the scheduler, which returns at once when idle
+        self.scheduler.flush()
+
+    def _load_clients(self):
+        # The summary index: one row per client, counts kept up to date on write
+        rows = self.conn.execute("SELECT id, name, description, created, reading_count, journal_count, last_visit FROM clients").fetchall()
+        self._clients = {row["id"]: dict(row) for row in rows}
+        self._client_index = ClientIndex()
+        for client in self._clients.values():
+            self._client_index.add(client["id"], client["name"], client["description"])
+
+    def _load_current_client(self):
+        row = self.conn.execute("SELECT value FROM app_state WHERE key = 'current_client_id'").fetchone()
+        client_id = row["value"] if row else None
+        if client_id in self._clients:
+            self.current_client_id = client_id
+            self._current_client = None
+            return
+        if self._clients:
+            client_id = min(self._clients.values(), key=lambda client: client["created"])["id"]
+        else:
+            client_id = self.add_client(DEFAULT_CLIENT_NAME, "")
+        self._set_current(client_id)
+
+    def _set_current(self, client_id):
+        self.current_client_id = client_id
+        self._current_client = None
+        self._evict_inactive()
+        self.version += 1
+        self._queue(lambda conn: conn.execute("INSERT OR REPLACE INTO app_state (key, value) VALUES ('current_client_id', ?)", (client_id,)))
+
+    def _evict_inactive(self):
+        # Only the active client's history and per-client caches stay resident
+        for cache in (self._reading_index, self._card_stats):
+            for client_id in [client_id for client_id in cache if client_id != self.current_client_id]:
+                del cache[client_id]
+
+    @property
+    def clients(self):
+        # Summaries only (name, description, counts, last visit); the active client's
+        # history is loaded by get_current_client
+        return dict(sorted(self._clients.items(), key=lambda item: item[1]["name"].lower()))
+
+    @property
+    def client_count(self):
+        return len(self._clients)
+
+    def get_client(self, client_id):
+        # One client's summary, or None
+        return self._clients.get(client_id)
+
+    def get_current_client_name(self):
+        client = self._clients.get(self.current_client_id)
+        return client["name"] if client else "No client"
+
+    def get_current_client(self):
+        try:
+            if self._current_client is None and self.current_client_id:
+                self._current_client = self._load_client(self.current_client_id)
+            return self._current_client
+        except Exception:
+            log.error("Error loading current client", exc_info=True)
+            return None
+
+    def _load_client(self, client_id):
+        self._sync_before_read()
+        row = self.conn.execute("SELECT id, name, description FROM clients WHERE id = ?", (client_id,)).fetchone()
+        if row is None:
+            return None
+        # Packed rows stay packed until a caller actually reads their cards
+        readings = [PackedReading(row["id"], row["packed"], row["seed"]) for row in self.conn.execute(
+            "SELECT id, seed, packed FROM readings WHERE client_id = ? ORDER BY ts, id", (client_id,))]
+        journal = [dict(entry) for entry in self.conn.execute("SELECT date, text FROM journal_entries WHERE client_id = ? ORDER BY date", (client_id,))]
+        client = dict(row)
+        client["readings"] = readings
+        client["journal"] = journal
+        return client
+
+    def _get_reading_index(self, client_id):
+        # Per-client last reading date per spread plus week/month counters, persisted on write
+        index = self._reading_index.get(client_id)
+        if index is None:
+            self._sync_before_read()
+            week, month = reading_periods(date.today())
+            index = {
+                "last": {row["spread"]: row["last_date"] for row in self.conn.execute(
+                    "SELECT spread, last_date FROM client_spread_last WHERE client_id = ?", (client_id,))},
+                "periods": {row["period"]: row["count"] for row in self.conn.execute(
+                    "SELECT period, count FROM client_period_counts WHERE client_id = ? AND period IN (?, ?)", (client_id, week, month))},
+            }
+            self._reading_index[client_id] = index
+        return index
+
+    def get_last_reading_date(self, spread_name):
+        if not self.current_client_id:
+            return None
+        return self._get_reading_index(self.current_client_id)["last"].get(spread_name)
+
+    def get_reading_counts(self):
+        if not self.current_client_id:
+            return {"week": 0, "month": 0}
+        periods = self._get_reading_index(self.current_client_id)["periods"]
+        week, month = reading_periods(date.today())
+        return {"week": periods.get(week, 0), "month": periods.get(month, 0)}
+
+    def get_readings_page(self, before=None, limit=50):
+        # Newest first, keyset-paged on (ts, id) so each page is one index range scan;
+        # only the packed header is decoded, card bytes wait until a reading is opened
+        if not self.current_client_id:
+            return [], None
+        self._sync_before_read()
+        ts_key, id_key = before or (2 ** 63 - 1, 2 ** 63 - 1)
+        rows = self.conn.execute("""
+            SELECT id, ts, seed, packed FROM readings
+            WHERE client_id = ? AND (ts < ? OR (ts = ? AND id < ?))
+            ORDER BY ts DESC, id DESC LIMIT ?
+        """, (self.current_client_id, ts_key, ts_key, id_key, limit)).fetchall()
+        cursor = (rows[-1]["ts"], rows[-1]["id"]) if rows else before
+        page = []
+        for row in rows:
+            spread_name, timestamp, card_count = decode_header(row["packed"])
+            page.append({"id": row["id"], "spread": spread_name, "date": from_timestamp(timestamp), "seed": row["seed"], "card_count": card_count})
+        return page, cursor
+
+    def get_reading(self, reading_id):
+        self._sync_before_read()
+        row = self.conn.execute("SELECT id, seed, packed FROM readings WHERE id = ?", (reading_id,)).fetchone()
+        return PackedReading(row["id"], row["packed"], row["seed"]) if row else None
+
+    def get_journal_page(self, before=None, limit=50):
+        if not self.current_client_id:
+            return [], None
+        self._sync_before_read()
+        date_key, id_key = before or ("\uffff", 0)
+        rows = self.conn.execute("""
+            SELECT id, date, text FROM journal_entries
+            WHERE client_id = ? AND (date < ? OR (date = ? AND id < ?))
+            ORDER BY date DESC, id DESC LIMIT ?
+        """, (self.current_client_id, date_key, date_key, id_key if before else 2 ** 63 - 1, limit)).fetchall()
+        cursor = (rows[-1]["date"], rows[-1]["id"]) if rows else before
+        return [dict(row) for row in rows], cursor
+
+    def switch_client(self, client_id):
+        try:
+            if client_id not in self._clients:
+                return False
+            visit = datetime.now().replace(microsecond=0).isoformat()
+            self._set_current(client_id)
+            self._clients[client_id]["last_visit"] = visit
+            self._queue(lambda conn: conn.execute("UPDATE clients SET last_visit = ? WHERE id = ?", (visit, client_id)))
+            log.info(f"Switched to client {client_id}")
+            return True
+        except Exception:
+            log.error(f"Error switching to client {client_id}", exc_info=True)
+            return False
+
+    def add_client(self, name, description=""):
+        try:
+            name = name.strip()
+            if not name or self._client_index.find_name(name) is not None:
+                log.info(f"Client name empty or already exists: {name}")
+                return None
+            client_id = uuid.uuid4().hex
+            created = datetime.now().isoformat()
+            self._clients[client_id] = {"id": client_id, "name": name, "description": description, "created": created,
+                                        "reading_count": 0, "journal_count": 0, "last_visit": created}
+            self._client_index.add(client_id, name, description)
+            self.version += 1
+            self._queue(lambda conn: conn.execute("INSERT INTO clients (id, name, description, created, last_visit) VALUES (?, ?, ?, ?, ?)",
+                                                  (client_id, name, description, created, created)))
+            log.info(f"Added client {name}")
+            return client_id
+        except Exception:
+            log.error(f"Error adding client {name}", exc_info=True)
+            return None
+
+    def rename_client(self, client_id, name, description=None):
+        # description=None keeps the current one; search documents carry the client name, so they follow
+        try:
+            client = self._clients.get(client_id)
+            name = name.strip()
+            if client is None or not name:
+                return False
+            existing = self._client_index.find_name(name)
+            if existing is not None and existing != client_id:
+                log.info(f"Client name already exists: {name}")
+                return False
+            if description is None:
+                description = client["description"]
+            client["name"] = name
+            client["description"] = description
+            self._client_index.update(client_id, name, description)
+            if self._current_client is not None and client_id == self.current_client_id:
+                self._current_client["name"] = name
+                self._current_client["description"] = description
+            self.version += 1
+            def write(conn):
+                conn.execute("UPDATE clients SET name = ?, description = ? WHERE id = ?", (name, description, client_id))
+                conn.execute("UPDATE search_index SET client = ? WHERE client_id = ?", (name, client_id))
+            self._queue(write)
+            log.info(f"Renamed client {client_id} to {name}")
+            return True
+        except Exception:
+            log.error(f"Error renaming client {client_id}", exc_info=True)
+            return False
+
+    def find_client(self, name):
+        # Case-insensitive exact name lookup; None when no client has that name
+        return self._client_index.find_name(name)
+
+    def find_clients(self, query, limit=50):
+        """Client summaries matching query as the user types, best match first.
+
+        Every word must start a word of the name or description, or (from three
+        letters) appear anywhere in them. An empty query lists the most recently
+        visited clients.
+        """
+        if not query.strip():
+            return sorted(self._clients.values(), key=lambda client: client["last_visit"] or "", reverse=True)[:limit]
+        return [self._clients[client_id] for client_id in self._client_index.search(query, limit)]
+
+    def delete_client(self, client_id):
+        try:
+            if len(self._clients) <= 1 or client_id not in self._clients:
+                return False
+            del self._clients[client_id]
+            self._client_index.remove(client_id)
+            self.version += 1
+            def write(conn):
+                conn.execute("DELETE FROM clients WHERE id = ?", (client_id,))
+                conn.execute("DELETE FROM search_index WHERE client_id = ?", (client_id,))
+            self._queue(write)
+            self._reading_index.pop(client_id, None)
+            self._card_stats.pop(client_id, None)
+            if client_id == self.current_client_id:
+                self._load_current_client()
+            log.info(f"Deleted client {client_id}")
+            return True
+        except Exception:
+            log.error(f"Error deleting client {client_id}", exc_info=True)
+            return False
+
+    def add_reading_to_current_client(self, spread_name, cards, orientations, seed=None):
+        try:
+            client_id = self.current_client_id
+            if not client_id:
+                return False
+            # Whole seconds, matching the packed timestamp, so the index and the reading agree
+            reading_date = datetime.now().replace(microsecond=0).isoformat()
+            timestamp = to_timestamp(reading_date)
+            packed = encode_reading(spread_name, cards, orientations, timestamp)
+            stat_counts = reading_stat_counts(packed)
+            stat_periods = (ALL_TIME, month_bucket(timestamp))
+            def write_stats(conn):
+                conn.executemany("""
+                    INSERT INTO client_card_stats (client_id, period, dimension, key, count) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (client_id, period, dimension, key) DO UPDATE SET count = count + excluded.count
+                """, [(client_id, period, dimension, key, count) for period in stat_periods for (dimension, key), count in stat_counts.items()])
+            client_name = self._clients[client_id]["name"]
+            def write(conn):
+                reading_id = conn.execute("INSERT INTO readings (client_id, ts, seed, packed) VALUES (?, ?, ?, ?)", (client_id, timestamp, seed, packed)).lastrowid
+                conn.execute(INSERT_DOCUMENT, reading_document(reading_id, client_id, client_name, packed))
+                conn.execute("UPDATE clients SET reading_count = reading_count + 1, last_visit = ? WHERE id = ?", (reading_date, client_id))
+            periods = reading_periods(date.fromisoformat(reading_date[:10]))
+            def write_index(conn):
+                conn.execute("""
+                    INSERT INTO client_spread_last (client_id, spread, last_date) VALUES (?, ?, ?)
+                    ON CONFLICT (client_id, spread) DO UPDATE SET last_date = excluded.last_date
+                """, (client_id, spread_name, reading_date))
+                conn.executemany("""
+                    INSERT INTO client_period_counts (client_id, period, count) VALUES (?, ?, 1)
+                    ON CONFLICT (client_id, period) DO UPDATE SET count = count + 1
+                """, [(client_id, period) for period in periods])
+            self._queue(write)
+            self._queue(write_index)
+            self._queue(write_stats)
+            self._clients[client_id]["reading_count"] += 1
+            self._clients[client_id]["last_visit"] = reading_date
+            self.version += 1
+            index = self._reading_index.get(client_id)
+            if index is not None:
+                index["last"][spread_name] = reading_date
+                for period in periods:
+                    index["periods"][period] = index["periods"].get(period, 0) + 1
+            buckets = self._card_stats.get(client_id, {})
+            for period in stat_periods:
+                if period in buckets:
+                    buckets[period].update(stat_counts)
+            if self._current_client is not None:
+                self._current_client["readings"].append(PackedReading(None, packed, seed))
+            return True
+        except Exception:
+            log.error(f"Error saving {spread_name} reading", exc_info=True)
+            return False
+
+    def add_journal_entry_to_current_client(self, text):
+        try:
+            client_id = self.current_client_id
+            if not client_id:
+                return False
+            entry_date = datetime.now().isoformat()
+            client_name = self._clients[client_id]["name"]
+            def write(conn):
+                # The search row rides in the same write-behind transaction as the entry itself
+                entry_id = conn.execute("INSERT INTO journal_entries (client_id, date, text) VALUES (?, ?, ?)", (client_id, entry_date, text)).lastrowid
+                conn.execute(INSERT_DOCUMENT, journal_document(entry_id, client_id, client_name, entry_date, text))
+                conn.execute("UPDATE clients SET journal_count = journal_count + 1, last_visit = ? WHERE id = ?", (entry_date, client_id))
+            self._queue(write)
+            self._clients[client_id]["journal_count"] += 1
+            self._clients[client_id]["last_visit"] = entry_date
+            self.version += 1
+            if self._current_client is not None:
+                self._current_client["journal"].append({"date": entry_date, "text": text})
+            return True
+        except Exception:
+            log.error("Error saving journal entry", exc_info=True)
+            return False
+
+    def get_journal_entry(self, entry_id):
+        self._sync_before_read()
+        row = self.conn.execute("SELECT id, client_id, date, text FROM journal_entries WHERE id = ?", (entry_id,)).fetchone()
+        return dict(row) if row else None
+
+    def search(self, text, limit=50, offset=0, client_id=None):
+        """Ranked prefix search over journal entries and readings, best match first.
+
+        Each word in text must match the start of a word in the client name,
+        journal text, or the reading's spread, cards, orientations and date.
+        Results carry kind ("journal" or "reading"), ref (row id), client_id,
+        client, date and a snippet with matches between HIGHLIGHT_START/END.
+        """
+        try:
+            self._sync_before_read()
+            return search_documents(self.conn, text, limit, offset, client_id, self._search_fts5)
+        except Exception:
+            log.error(f"Error searching for {text!r}", exc_info=True)
+            return []
+
+    def _get_stat_buckets(self, client_id, periods):
+        # Buckets are cached per client; only periods not seen yet are read from disk
+        buckets = self._card_stats.setdefault(client_id, {})
+        missing = [period for period in periods if period not in buckets]
+        if missing:
+            self._sync_before_read()
+            for period in missing:
+                buckets[period] = Counter()
+            placeholders = ", ".join("?" * len(missing))
+            for row in self.conn.execute(f"""
+                SELECT period, dimension, key, count FROM client_card_stats
+                WHERE client_id = ? AND period IN ({placeholders})
+            """, (client_id, *missing)):
+                buckets[row["period"]][(row["dimension"], row["key"])] = row["count"]
+        return [buckets[period] for period in periods]
+
+    def get_card_stats(self, months=None, client_id=None, top=10):
+        """Card, orientation, position and suit frequencies for a client.
+
+        months=None covers all time, otherwise the current calendar month and the
+        months before it. Cost depends on the window, never on history length.
+        """
+        client_id = client_id or self.current_client_id
+        if not client_id:
+            return summarize_card_stats([], top)
+        try:
+            periods = [ALL_TIME] if months is None else recent_months(date.today(), months)
+            return summarize_card_stats(self._get_stat_buckets(client_id, periods), top)
+        except Exception:
+            log.error(f"Error reading card stats for {client_id}", exc_info=True)
+            return summarize_card_stats([], top)
+
+    def rebuild_stats(self, client_id=None):
+        # Recomputes the aggregates from the stored readings; returns how many readings were counted
+        self.scheduler.flush()
+        with self.conn:
+            counted = rebuild_card_stats(self.conn, client_id)
+        if client_id is None:
+            self._card_stats.clear()
+        else:
+            self._card_stats.pop(client_id, None)
+        self.version += 1
+        log.info(f"Rebuilt card stats from {counted} readings")
+        return counted
+
+    def save_session(self, data):
+        # Checkpoints land with the next write-behind flush; a burst of reveals costs one row write
+        with self._ops_lock:
+            pending = self._session_pending
+            self._session_checkpoint = data
+            self._session_pending = True
+        if not pending:
+            self._queue(self._write_session)
+
+    def clear_session(self):
+        self.save_session(None)
+
+    def _write_session(self, conn):
+        with self._ops_lock:
+            data, self._session_pending = self._session_checkpoint, False
+        if data is None:
+            conn.execute("DELETE FROM app_state WHERE key = 'reading_session'")
+        else:
+            conn.execute("INSERT OR REPLACE INTO app_state (key, value) VALUES ('reading_session', ?)", (sqlite3.Binary(data),))
+
+    def load_session(self):
+        # The last checkpointed reading session as bytes, or None
+        with self._ops_lock:
+            if self._session_pending:
+                return self._session_checkpoint
+        # _write_session clears the pending flag before its flush commits; wait that flush out
+        self._sync_before_read()
+        row = self.conn.execute("SELECT value FROM app_state WHERE key = 'reading_session'").fetchone()
+        return bytes(row["value"]) if row and row["value"] is not None else None
+
+    def check_daily_reading_done(self, spread_name):
+        try:
+            last_date = self.get_last_reading_date(spread_name)
+            return last_date is not None and last_date[:10] == date.today().isoformat()
+        except Exception:
+            log.error(f"Error checking daily reading for {spread_name}", exc_info=True)
+            return False
+
+    def close(self):
+        try:
+            if not self.scheduler.flush():
+                log.error(f"Closing with unsaved writes: {self.scheduler.summary()['errors']}")
+            self.conn.close()
+        except Exception:
+            log.error("Error closing client store", exc_info=True)
+
+def read_client_names(db_path):
+    # Read-only snapshot for batch tools; never migrates or creates the default client
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return [row[0] for row in conn.execute("SELECT name FROM clients ORDER BY name COLLATE NOCASE")]
+    finally:
+        conn.close()
@@ -0,0 +1,40 @@
+import unittest
+
+from tarot_core.deck import major_arcana, ranks, suits, tarot_cards
+from tarot_core.decks import match_card_files
+
+RANK_NUMBERS = {rank: f"{number:02d}" for number, rank in enumerate(ranks, start=1)}
+SUIT_CODES = {"Wands": "wa", "Cups": "cu", "Swords": "sw", "Pentacles": "pe"}
+
+class MatchCardFilesTest(unittest.TestCase):
+    def assert_matches(self, expected):
+        matches, unmatched = match_card_files(list(expected))
+        self.assertEqual(unmatched, [])
+        self.assertEqual(matches, expected)
+
+    def test_two_letter_scheme_covers_the_deck(self):
+        expected = {f"ar{number:02d}": card for number, card in enumerate(major_arcana)}
+        expected.update({f"{SUIT_CODES[suit]}{RANK_NUMBERS[rank]}": f"{rank} of {suit}" for suit in suits for rank in ranks})
+        self.assert_matches(expected)
+        self.assertEqual(sorted(expected.values()), sorted(tarot_cards))
+
+    def test_two_letter_suits_are_not_read_as_one_letter_suits(self):
+        self.assert_matches({"sw10": "Ten of Swords", "cu01": "Ace of Cups", "pe14": "King of Pentacles", "wa11": "Page of Wands"})
+
+    def test_names_and_prefixed_names(self):
+        self.assert_matches({
+            "The_Fool": "The Fool", "XIII-Death": "Death", "Knight of Cups": "Knight of Cups",
+            "artistX_cups01": "Ace of Cups", "mydeck_07_cups01": "Ace of Cups", "rws_t13": "Death", "back": None,
+        })
+
+    def test_bare_numbers_only_as_the_whole_stem(self):
+        self.assert_matches({"07": "The Chariot", "0": "The Fool"})
+        matches, unmatched = match_card_files(["IMG_0001", "IMG_01", "scan-12"])
+        self.assertEqual(matches, {})
+        self.assertEqual(unmatched, ["IMG_0001", "IMG_01", "scan-12"])
+
+    def test_copy_suffix_keeps_the_card(self):
+        self.assert_matches({"Knight of Cups (1)": "Knight of Cups"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from tarot_core.codec import decode_reading, encode_reading, to_timestamp
+from tarot_core.session import ReadingSession
+from tarot_core.store import SCHEMA_MIGRATIONS, ClientManager, WriteBehindScheduler
+
+# (id, client id, spread, date, seed, [(card, orientation), ...])
+V3_READINGS = [
+    (1, "c1", "Celtic Cross", "2023-03-05T09:15:00", 1234,
+     [("The Fool", "Upright"), ("Death", "Reversed"), ("Ace of Cups", "Upright"), ("Ten of Swords", "Reversed"),
+      ("The Star", "Upright"), ("King of Pentacles", "Upright"), ("The Moon", "Reversed"), ("Page of Wands", "Upright"),
+      ("The World", "Upright"), ("Three of Cups", "Reversed")]),
+    (2, "c1", "Past-Present-Future", "2023-04-01T20:00:00", None,
+     [("The Tower", "Reversed"), ("Queen of Cups", "Upright"), ("The Sun", "Upright")]),
+    (3, "c2", "Daily Guidance", "2024-01-31T23:59:59", 2 ** 62,
+     [("Wheel of Fortune", "Reversed")]),
+]
+V3_JOURNAL = [("c1", "2023-03-05T09:30:00", "First reading"), ("c2", "2024-02-01T08:00:00", "Felt right")]
+
+def build_v3_database(path, readings=V3_READINGS):
+    conn = sqlite3.connect(path)
+    for script in SCHEMA_MIGRATIONS[:3]:
+        conn.executescript(script)
+    conn.executemany("INSERT INTO clients (id, name, description, created) VALUES (?, ?, ?, ?)", [
+        ("c1", "Ada", "Weekly", "2023-01-01T10:00:00"), ("c2", "Brook", "", "2023-06-01T10:00:00")])
+    for reading_id, client_id, spread, reading_date, seed, cards in readings:
+        conn.execute("INSERT INTO readings (id, client_id, spread, date, seed) VALUES (?, ?, ?, ?, ?)",
+                     (reading_id, client_id, spread, reading_date, seed))
+        conn.executemany("INSERT INTO reading_cards (reading_id, position, card, orientation) VALUES (?, ?, ?, ?)",
+                         [(reading_id, position, card, orientation) for position, (card, orientation) in enumerate(cards)])
+    conn.executemany("INSERT INTO journal_entries (client_id, date, text) VALUES (?, ?, ?)", V3_JOURNAL)
+    conn.execute("INSERT INTO app_state (key, value) VALUES ('current_client_id', 'c1')")
+    conn.execute("PRAGMA user_version = 3")
+    conn.commit()
+    conn.close()
+
+class MigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "clients.db")
+        self.manager = None
+
+    def tearDown(self):
+        if self.manager is not None:
+            self.manager.close()
+        self.tmp.cleanup()
+
+    def open_manager(self):
+        self.manager = ClientManager(self.db_path, WriteBehindScheduler())
+        return self.manager
+
+    def test_v3_history_survives_migration(self):
+        build_v3_database(self.db_path)
+        manager = self.open_manager()
+        self.assertEqual(manager.conn.execute("PRAGMA user_version").fetchone()[0], len(SCHEMA_MIGRATIONS))
+
+        self.assertEqual(manager.client_count, 2)
+        self.assertEqual(manager.get_client("c1")["reading_count"], 2)
+        self.assertEqual(manager.get_client("c1")["journal_count"], 1)
+        self.assertEqual(manager.get_client("c2")["reading_count"], 1)
+        self.assertEqual(manager.get_client("c2")["journal_count"], 1)
+
+        for client_id in ("c1", "c2"):
+            self.assertTrue(manager.switch_client(client_id))
+            client = manager.get_current_client()
+            expected = [reading for reading in V3_READINGS if reading[1] == client_id]
+            self.assertEqual(len(client["readings"]), len(expected))
+            for reading, (reading_id, _, spread, reading_date, seed, cards) in zip(client["readings"], expected):
+                self.assertEqual(reading.id, reading_id)
+                self.assertEqual(reading.spread, spread)
+                self.assertEqual(reading.date, reading_date)
+                self.assertEqual(reading.seed, seed)
+                self.assertEqual(reading.cards, [card for card, _ in cards])
+                self.assertEqual(reading.orientations, [orientation for _, orientation in cards])
+            self.assertEqual([entry["text"] for entry in client["journal"]],
+                             [text for journal_client, _, text in V3_JOURNAL if journal_client == client_id])
+            self.assertEqual(manager.get_card_stats()["readings"], len(expected))
+
+        self.assertEqual(manager.get_card_stats(client_id="c1")["orientations"], {"upright": 8, "reversed": 5})
+
+    def test_unknown_legacy_spread_stops_migration_without_loss(self):
+        build_v3_database(self.db_path, V3_READINGS + [(4, "c2", "Old Custom Spread", "2022-12-24T18:00:00", None, [("The Hermit", "Upright")])])
+        with self.assertRaises(ValueError):
+            self.open_manager()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 3)
+            self.assertEqual(conn.execute("SELECT spread FROM readings WHERE id = 4").fetchone()[0], "Old Custom Spread")
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM reading_cards").fetchone()[0], 15)
+        finally:
+            conn.close()
+
+class CodecRoundTripTest(unittest.TestCase):
+    def test_encode_decode_reading(self):
+        for _, _, spread, reading_date, _, cards in V3_READINGS:
+            packed = encode_reading(spread, [card for card, _ in cards], [orientation for _, orientation in cards], to_timestamp(reading_date))
+            self.assertEqual(decode_reading(packed), {
+                "spread": spread, "date": reading_date,
+                "cards": [card for card, _ in cards], "orientations": [orientation for _, orientation in cards],
+            })
+
+    def test_unknown_spread_is_refused(self):
+        with self.assertRaises(ValueError):
+            encode_reading("Old Custom Spread", ["The Fool"], ["Upright"], 0)
+
+    def test_reading_session_bytes(self):
+        session = ReadingSession.draw("Celtic Cross", 10, client_id="c1", special=True, seed=987654321)
+        for index in range(4):
+            self.assertTrue(session.reveal(index, session.started + 3 * index))
+        restored = ReadingSession.from_bytes(session.to_bytes())
+        for field in ReadingSession.__slots__:
+            self.assertEqual(getattr(restored, field), getattr(session, field), field)
+
+        fresh = ReadingSession.from_bytes(ReadingSession.draw("Daily Guidance", 1).to_bytes())
+        self.assertEqual((fresh.client_id, fresh.special, fresh.reveal_times), (None, False, []))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Pack the card deck into Kivy atlases at several densities.
+
+Run from the repository root before ``buildozer android debug``:
+
+    python tools/build_atlases.py [deck_dir] [output_dir]
+
+For every density in ``ATLAS_DENSITIES`` each card is resized to fit the
+density's card height and the results are packed with ``kivy.atlas`` into
+``<output_dir>/<deck>-<density>.atlas`` plus its page PNGs. Atlas keys are the
+original file stems (``The_Fool``), which is what ``AssetManifest`` looks up
+at runtime. The full reveal density is served from the loose deck files,
+which the CI "Optimize images" step already resizes to 512x896.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+from PIL import Image as PILImage
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DECK_DIR = os.path.join(REPO_ROOT, "images", "rider-waite-tarot")
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, "images", "atlas")
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# density name -> (card height in pixels, atlas page size)
+ATLAS_DENSITIES = {
+    "thumb": (168, 2048),
+    "list": (336, 2048),
+}
+
+def resize_deck(deck_dir, target_dir, card_height):
+    filenames = []
+    for name in sorted(os.listdir(deck_dir)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in IMAGE_EXTENSIONS:
+            continue
+        with PILImage.open(os.path.join(deck_dir, name)) as image:
+            image = image.convert("RGBA")
+            width = max(1, round(image.width * card_height / image.height))
+            image = image.resize((width, card_height), PILImage.LANCZOS)
+            # Atlas keys come from the file stem, so the output is always PNG
+            out_path = os.path.join(target_dir, f"{stem}.png")
+            image.save(out_path, optimize=True)
+            filenames.append(out_path)
+    return filenames
+
+def build_atlases(deck_dir=DEFAULT_DECK_DIR, output_dir=DEFAULT_OUTPUT_DIR):
+    from kivy.atlas import Atlas
+
+    deck_name = os.path.basename(os.path.normpath(deck_dir))
+    os.makedirs(output_dir, exist_ok=True)
+    for density, (card_height, page_size) in ATLAS_DENSITIES.items():
+        work_dir = tempfile.mkdtemp(prefix=f"atlas-{density}-")
+        try:
+            filenames = resize_deck(deck_dir, work_dir, card_height)
+            outname = os.path.join(output_dir, f"{deck_name}-{density}")
+            result = Atlas.create(outname, filenames, page_size)
+            if not result:
+                raise RuntimeError(f"kivy.atlas could not pack {density} cards into {page_size}px pages")
+            print(f"Built {outname}.atlas: {len(filenames)} cards, {len(result[1])} page(s)")
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    build_atlases(*args[:2])